@@ -97,6 +97,16 @@ CUSTOMIZED_IMAGE_LINK_KEY = 'tsfile'  # short for "time-stamp filename"
 ## EMPTY string or non-existing path to a folder if image cache is disabled.
 IMAGE_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), *"src/lazyblorg/testdata/imagecache".split('/'))
 
+## string: (optional) path to an existing folder which is used to store the
+## results of converting Org-mode and LaTeX snippets (tables, lists, ...) to
+## HTML with pandoc. Since starting pandoc takes quite some time, this
+## speeds up blog data generation time a lot. The cache files are named
+## after a hash of the pandoc version, the input format, and the
+## snippet. Old cache files are never removed: delete the content of the
+## folder from time to time.
+## EMPTY string or non-existing path to a folder if pandoc cache is disabled.
+PANDOC_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), *"src/lazyblorg/testdata/pandoccache".split('/'))
+
 ## string: path to the Memacs index for filenametimestamps
 ## Note that the method below is the safe one that works on Windows
 ## and other operating systems. Alternatively you can use something
@@ -330,6 +340,8 @@ if len(CUSTOMIZED_IMAGE_LINK_KEY) > 0:
 
 if len(IMAGE_CACHE_DIRECTORY) > 0 and not os.path.isdir(IMAGE_CACHE_DIRECTORY):
     print('Warning: IMAGE_CACHE_DIRECTORY is set but points to a directory which does not exist. Either empty the string or create its cache directory at "' + IMAGE_CACHE_DIRECTORY + '".')
+if len(PANDOC_CACHE_DIRECTORY) > 0 and not os.path.isdir(PANDOC_CACHE_DIRECTORY):
+    print('Warning: PANDOC_CACHE_DIRECTORY is set but points to a directory which does not exist. Either empty the string or create its cache directory at "' + PANDOC_CACHE_DIRECTORY + '".')
 
 ## END OF FILE #################################################################
 # Local Variables:
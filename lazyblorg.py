@@ -21,7 +21,10 @@ from lib.orgparser import *
 from lib.htmlizer import *
 from lib.snippets import SnippetResolver, SnippetException
 import pickle  # for serializing and storing objects into files
+from hashlib import md5  # for validating the parse cache
+import mmap  # for computing the checksums of segments of Org-mode files
 from time import time  # for measuring execution time
+from concurrent.futures import ProcessPoolExecutor  # for parsing Org-mode files in parallel
 
 
 INVOCATION_TIME = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
@@ -35,6 +38,69 @@ EPILOG = "\n\
   :version:    " + PROG_VERSION_DATE + "\n"
 
 
+def parse_orgmode_file_in_segments(filename, previous_segments, start=0, end=None):
+    """
+    Parses an Org-mode file or one of its shards segment by segment
+    (see OrgParser.find_segment_offsets()): each segment starts with
+    a line which might be the heading of a blog entry. The parse
+    result of a segment whose content and following line did not
+    change is taken from the segments of the previous run instead of
+    parsing it again. A segment which does not end at a clean cut
+    (see OrgParser.ends_at_clean_cut()) is parsed together with the
+    following segment.
+
+    This is a module-level function so that worker processes of
+    --jobs are able to run it.
+
+    @param filename: string containing one file name
+    @param previous_segments: dict(checksum) of segments as returned by the previous run
+    @param start: byte offset of the shard as returned by OrgParser.find_shard_offsets()
+    @param end: byte offset of the end of the shard; None for end of file
+    @param return: array containing parsed Org-mode data
+    @param return: integer with number of lines parsed
+    @param return: boolean value of OrgParser.ends_at_clean_cut() of the last segment
+    @param return: dict(checksum) of (blog data, lines, ends at clean cut) tuples of the segments
+    @param return: integer with number of segments taken from previous_segments
+    """
+
+    blog_data, lines, segments, reused_segments = [], 0, {}, 0
+    ends_at_clean_cut = True
+    if os.path.getsize(filename) == 0:
+        return blog_data, lines, ends_at_clean_cut, segments, reused_segments
+
+    offsets = OrgParser.find_segment_offsets(filename, start, end)
+    with open(filename, 'rb') as orgfile:
+        with mmap.mmap(orgfile.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            index = 0
+            while index < len(offsets):
+                segment_start = offsets[index][0]
+                while True:
+                    segment_end = offsets[index][1]
+                    checksum = md5(content[segment_start:segment_end])
+                    if segment_end is not None:
+                        # the parse result depends on the line following the segment as well:
+                        lineend = content.find(b'\n', segment_end)
+                        checksum.update(content[segment_end:None if lineend == -1 else lineend])
+                    checksum = checksum.hexdigest()
+                    if checksum in previous_segments:
+                        segment = previous_segments[checksum]
+                        reused_segments += 1
+                    else:
+                        parser = OrgParser(filename, segment_start, segment_end)
+                        segment_blog_data, segment_lines = parser.parse_orgmode_file()
+                        segment = (segment_blog_data, segment_lines, parser.ends_at_clean_cut())
+                    segments[checksum] = segment
+                    ends_at_clean_cut = segment[2]
+                    if ends_at_clean_cut or index == len(offsets) - 1:
+                        break
+                    index += 1  # parse again together with the following segment
+                blog_data += segment[0]
+                lines += segment[1]
+                index += 1
+
+    return blog_data, lines, ends_at_clean_cut, segments, reused_segments
+
+
 class Lazyblorg(object):
     """
     Central lazyblorg Class with main algorithm and methods
@@ -49,6 +115,9 @@ class Lazyblorg(object):
     template_definitions = None  # list of definitions of templates
     # dict(year) of list(month) of list(day) of lists(entries) of IDs
     entries_timeline_by_published = None
+    parse_cache = None  # dict(absolute file name) of dicts with the parse result and its validation data
+    stats_org_files_from_parse_cache = 0  # number of Org-mode files not parsed because of the parse cache
+    stats_org_segments_from_parse_cache = 0  # number of segments of changed Org-mode files not parsed again
 
     def __init__(self, options, logging):
 
@@ -59,6 +128,9 @@ class Lazyblorg(object):
         self.metadata = []  # meta-data of the current run of lazyblorg
         self.previous_metadata = None  # meta-data of the previous run of lazyblorg
         self.template_definitions = None
+        self.parse_cache = {}
+        self.stats_org_files_from_parse_cache = 0
+        self.stats_org_segments_from_parse_cache = 0
 
     def determine_changes(self):
         """
@@ -74,22 +146,75 @@ class Lazyblorg(object):
         options = self.options
         stats_parsed_org_files, stats_parsed_org_lines = 0, 0
 
-        logging.info("• Parsing Org mode files …")
+        # create path to new metadatafile if it does not exist:
+        if not os.path.isdir(os.path.dirname(options.new_metadatafilename)):
+            logging.debug(
+                "path of new_metadatafilename \"" +
+                options.new_metadatafilename +
+                "\" does not exist. Creating …")
+            os.makedirs(os.path.dirname(options.new_metadatafilename))
+
+        previous_parse_cache = self._read_parse_cache()
+        parse_cache_entries = {}
         for filename in options.orgfiles:
-            new_org_lines = 0
-            try:
-                file_blog_data, new_org_lines = self._parse_orgmode_file(
-                    filename)  # parsing one Org-mode file
-            except OrgParserException as message:
-                verbose_message = "Parsing error in file \"" + filename + \
-                    "\" which is not good. Therefore, I stop here and hope you " + \
-                    "can fix the issue in the Org-mode file. Reason: " + message.value
-                Utils.error_exit_with_userlog(
-                    options.logfilename, 20, verbose_message)
-            else:
-                self.blog_data += file_blog_data
-                stats_parsed_org_files += 1
-                stats_parsed_org_lines += new_org_lines
+            if os.path.isfile(filename) and filename not in parse_cache_entries:
+                parse_cache_entries[filename] = self._look_up_parse_cache(filename, previous_parse_cache)
+
+        # with --jobs, the files which are not in the parse cache get
+        # parsed in worker processes; the results are merged below in
+        # the order of the command line. With --shard-orgfiles-above,
+        # large files are split into one shard per job in addition:
+        pending_parse_results = {}
+        executor = None
+        jobs = getattr(options, 'jobs', 1)
+        shard_threshold = getattr(options, 'shard_orgfiles_above', 0) * 1024 * 1024
+        shards = {}
+        for filename in parse_cache_entries:
+            if 'blog_data' not in parse_cache_entries[filename]:
+                if jobs > 1 and shard_threshold and parse_cache_entries[filename]['size'] > shard_threshold:
+                    shards[filename] = OrgParser.find_shard_offsets(filename, jobs)
+                    logging.debug("Splitting \"" + filename + "\" into " + str(len(shards[filename])) +
+                                  " shards …")
+                else:
+                    shards[filename] = [(0, None)]
+        number_of_tasks = sum(len(offsets) for offsets in shards.values())
+        if jobs > 1 and number_of_tasks > 1:
+            logging.debug("Parsing " + str(len(shards)) + " Org mode files in " + str(number_of_tasks) +
+                          " parts with " + str(jobs) + " worker processes …")
+            executor = ProcessPoolExecutor(max_workers=min(jobs, number_of_tasks))
+            for filename in shards:
+                pending_parse_results[filename] = [
+                    executor.submit(parse_orgmode_file_in_segments, filename,
+                                    parse_cache_entries[filename].get('previous_segments', {}), start, end)
+                    for start, end in shards[filename]]
+
+        logging.info("• Parsing Org mode files …")
+        try:
+            for filename in options.orgfiles:
+                new_org_lines = 0
+                try:
+                    if filename in parse_cache_entries:
+                        file_blog_data, new_org_lines = self._parse_orgmode_file_using_cache(
+                            filename, parse_cache_entries[filename],
+                            pending_parse_results.get(filename))  # parsing one Org-mode file
+                    else:
+                        file_blog_data, new_org_lines = self._parse_orgmode_file(filename)
+                except OrgParserException as message:
+                    verbose_message = "Parsing error in file \"" + filename + \
+                        "\" which is not good. Therefore, I stop here and hope you " + \
+                        "can fix the issue in the Org-mode file. Reason: " + message.value
+                    Utils.error_exit_with_userlog(
+                        options.logfilename, 20, verbose_message)
+                else:
+                    self.blog_data += file_blog_data
+                    stats_parsed_org_files += 1
+                    stats_parsed_org_lines += new_org_lines
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+
+        # store the parse results before the snippet resolution modifies them:
+        self._write_parse_cache()
 
         # Resolve snippet references before metadata generation
         logging.info("• Resolving snippet references …")
@@ -113,19 +238,8 @@ class Lazyblorg(object):
         self.metadata, self.entries_timeline_by_published = Utils.generate_metadata_from_blogdata(
             self.blog_data)
 
-        # create path to new metadatafile if it does not exist:
-        if not os.path.isdir(os.path.dirname(options.new_metadatafilename)):
-            logging.debug(
-                "path of new_metadatafilename \"" +
-                options.new_metadatafilename +
-                "\" does not exist. Creating …")
-            os.makedirs(os.path.dirname(options.new_metadatafilename))
-
         # write this status to the persistent data file:
-        with open(options.new_metadatafilename, 'wb') as output:
-            pickle.dump([self.metadata,
-                         self.entries_timeline_by_published],
-                        output)
+        self._write_metadata_file()
 
         # load old metadata from file
         if os.path.isfile(options.previous_metadatafilename):
@@ -135,7 +249,7 @@ class Lazyblorg(object):
                 "\" …")
             with open(options.previous_metadatafilename, 'rb') as input:
                 [self.previous_metadata,
-                 self.entries_timeline_by_published] = pickle.load(input)
+                 previous_entries_timeline_by_published] = pickle.load(input)
 
         # extract HTML templates and store in class var
         self.template_definitions = self._generate_template_definitions_from_template_data()
@@ -145,6 +259,266 @@ class Lazyblorg(object):
 
         return generate, marked_for_feed, increment_version, stats_parsed_org_files, stats_parsed_org_lines
 
+    def _write_metadata_file(self):
+        """
+
+        Writes the meta-data of the current run to the new meta-data
+        file which is read as previous meta-data by the next run.
+
+        """
+
+        with open(self.options.new_metadatafilename, 'wb') as output:
+            pickle.dump([self.metadata,
+                         self.entries_timeline_by_published],
+                        output)
+
+    @staticmethod
+    def _page_dependencies_filename(metadatafilename):
+        """
+
+        Returns the file name of the page dependency graph which is
+        stored next to a meta-data file.
+
+        @param metadatafilename: file name of a meta-data file
+        @param return: file name of the page dependency graph
+        """
+
+        return os.path.splitext(metadatafilename)[0] + '_-_page_dependencies.pk'
+
+    @staticmethod
+    def _parse_cache_filename(metadatafilename):
+        """
+
+        Returns the file name of the parse cache which is stored next
+        to a meta-data file.
+
+        @param metadatafilename: file name of a meta-data file
+        @param return: file name of the parse cache
+        """
+
+        return os.path.splitext(metadatafilename)[0] + '_-_parse_cache.pk'
+
+    @staticmethod
+    def _parser_signature():
+        """
+
+        Returns a checksum of the source code of the parser, of this
+        file (which splits the Org-mode files into segments; see
+        parse_orgmode_file_in_segments()), and the configuration.
+        Parse results of a different parser or configuration are not
+        re-used.
+
+        @param return: hexdigest string
+        """
+
+        signature = md5()
+        for filename in [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lib', 'orgparser.py'),
+                         os.path.abspath(__file__),
+                         config.__file__]:
+            with open(filename, 'rb') as sourcefile:
+                signature.update(sourcefile.read())
+        return signature.hexdigest()
+
+    @staticmethod
+    def _content_cache_filename(metadatafilename):
+        """
+
+        Returns the file name of the content cache (the htmlized
+        content of the entries) which is stored next to a meta-data
+        file.
+
+        @param metadatafilename: file name of a meta-data file
+        @param return: file name of the content cache
+        """
+
+        return os.path.splitext(metadatafilename)[0] + '_-_content_cache.pk'
+
+    @staticmethod
+    def _htmlizer_signature():
+        """
+
+        Returns a checksum of the source code of the htmlizer and its
+        helpers, and the configuration. Content htmlized by a different
+        htmlizer is not re-used.
+
+        @param return: hexdigest string
+        """
+
+        signature = md5()
+        libdir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lib')
+        for filename in [os.path.join(libdir, 'htmlizer.py'),
+                         os.path.join(libdir, 'orgparser.py'),
+                         os.path.join(libdir, 'utils.py'),
+                         os.path.join(libdir, 'placeholders.py'),
+                         config.__file__]:
+            with open(filename, 'rb') as sourcefile:
+                signature.update(sourcefile.read())
+        return signature.hexdigest()
+
+    @staticmethod
+    def _file_checksum(filename):
+        """
+
+        Returns the checksum of the content of a file.
+
+        @param filename: file name
+        @param return: hexdigest string
+        """
+
+        checksum = md5()
+        with open(filename, 'rb') as inputfile:
+            for chunk in iter(lambda: inputfile.read(1024 * 1024), b''):
+                checksum.update(chunk)
+        return checksum.hexdigest()
+
+    def _read_parse_cache(self):
+        """
+
+        Reads the parse cache of the previous run which is stored next
+        to the previous meta-data file.
+
+        @param return: dict(absolute file name) of cache entries; empty if not found or outdated
+        """
+
+        filename = self._parse_cache_filename(self.options.previous_metadatafilename)
+        if not os.path.isfile(filename):
+            return {}
+        try:
+            with open(filename, 'rb') as input:
+                signature, parse_cache = pickle.load(input)
+        except (pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, ImportError) as message:
+            self.logging.warning("Ignoring the parse cache \"" + filename + "\" which could not be read: " +
+                                 str(message))
+            return {}
+        if signature != self._parser_signature():
+            self.logging.debug("Ignoring the parse cache \"" + filename +
+                               "\" because the parser or the configuration changed")
+            return {}
+        return parse_cache
+
+    def _write_parse_cache(self):
+        """
+
+        Writes the parse results of this run next to the new meta-data
+        file so that the next run is able to skip unchanged files.
+
+        """
+
+        with open(self._parse_cache_filename(self.options.new_metadatafilename), 'wb') as output:
+            pickle.dump([self._parser_signature(), self.parse_cache], output)
+
+    def _look_up_parse_cache(self, filename, previous_parse_cache):
+        """
+
+        Looks up an Org-mode file in the parse cache of the previous
+        run. The cached parse result is valid if the file did not
+        change: either its modification time and size are unchanged or
+        its content has the same checksum as before. Otherwise, the
+        segments of the previous run are handed over in
+        'previous_segments' so that only the changed segments have to
+        be parsed again.
+
+        @param filename: string containing the name of an existing file
+        @param previous_parse_cache: dict as returned by _read_parse_cache()
+        @param return: entry for the parse cache of this run; with 'blog_data' and 'lines' only if the cached result is valid
+        """
+
+        filestat = os.stat(filename)
+        cached = previous_parse_cache.get(os.path.abspath(filename))
+        checksum = None
+        previous_segments = {}
+        if cached and (cached['mtime'], cached['size']) != (filestat.st_mtime_ns, filestat.st_size):
+            checksum = self._file_checksum(filename)
+            if checksum != cached['checksum']:
+                previous_segments = cached.get('segments', {})
+                cached = None
+
+        if cached:
+            return {'mtime': filestat.st_mtime_ns,
+                    'size': filestat.st_size,
+                    'checksum': cached['checksum'],
+                    'blog_data': cached['blog_data'],
+                    'lines': cached['lines'],
+                    'segments': cached.get('segments', {})}
+        return {'mtime': filestat.st_mtime_ns,
+                'size': filestat.st_size,
+                'checksum': checksum or self._file_checksum(filename),
+                'previous_segments': previous_segments}
+
+    def _parse_orgmode_file_using_cache(self, filename, parse_cache_entry, pending_parse_results=None):
+        """
+
+        Returns the parse result of an Org-mode file from its entry of
+        the parse cache as returned by _look_up_parse_cache().
+        Otherwise, the file gets parsed segment by segment (or the
+        result of worker processes is taken) and the result is added
+        to the entry. Either way, the entry is added to the parse cache
+        of this run.
+
+        @param filename: string containing one file name
+        @param parse_cache_entry: dict as returned by _look_up_parse_cache()
+        @param pending_parse_results: optional list of Futures of parse_orgmode_file_in_segments(), one per shard
+        @param return: array containing parsed Org-mode data
+        @param return: integer with number of lines parsed
+        """
+
+        if 'blog_data' in parse_cache_entry:
+            self.logging.debug("Using the parse cache for \"%s\" …" % filename)
+            self.stats_org_files_from_parse_cache += 1
+        else:
+            previous_segments = parse_cache_entry.pop('previous_segments', {})
+            if pending_parse_results:
+                self.logging.debug("Parsed \"%s\" in worker processes" % filename)
+                blog_data, lines, segments, reused_segments = \
+                    self._merge_parse_results_of_shards(filename, pending_parse_results, previous_segments)
+            else:
+                self.logging.debug("Parsing \"%s\" …" % filename)
+                blog_data, lines, ends_at_clean_cut, segments, reused_segments = \
+                    parse_orgmode_file_in_segments(filename, previous_segments)
+            if reused_segments:
+                self.logging.debug("Took %i segments of \"%s\" from the parse cache" % (reused_segments, filename))
+            self.stats_org_segments_from_parse_cache += reused_segments
+            parse_cache_entry['blog_data'], parse_cache_entry['lines'] = blog_data, lines
+            parse_cache_entry['segments'] = segments
+
+        self.parse_cache[os.path.abspath(filename)] = parse_cache_entry
+        return parse_cache_entry['blog_data'], parse_cache_entry['lines']
+
+    def _merge_parse_results_of_shards(self, filename, pending_parse_results, previous_segments):
+        """
+
+        Concatenates the parse results of the shards of an Org-mode
+        file in their order. If a shard was not cut at a position
+        where its parser ended in a state of a newly started parser,
+        the results of the following shards might differ from a
+        sequential parse. In this case, the whole file gets parsed
+        again as usual.
+
+        @param filename: string containing one file name
+        @param pending_parse_results: list of Futures of parse_orgmode_file_in_segments()
+        @param previous_segments: dict(checksum) of segments as returned by the previous run
+        @param return: array containing parsed Org-mode data
+        @param return: integer with number of lines parsed
+        @param return: dict(checksum) of segments as returned by parse_orgmode_file_in_segments()
+        @param return: integer with number of segments taken from previous_segments
+        """
+
+        blog_data, lines, segments, reused_segments = [], 0, {}, 0
+        for pending_parse_result in pending_parse_results:
+            shard_blog_data, shard_lines, ends_at_clean_cut, shard_segments, shard_reused_segments = \
+                pending_parse_result.result()
+            blog_data += shard_blog_data
+            lines += shard_lines
+            segments.update(shard_segments)
+            reused_segments += shard_reused_segments
+            if not ends_at_clean_cut:
+                self.logging.debug("Could not split \"%s\" into independent shards: parsing it as a whole" %
+                                   filename)
+                blog_data, lines, ends_at_clean_cut, segments, reused_segments = \
+                    parse_orgmode_file_in_segments(filename, previous_segments)
+                break
+        return blog_data, lines, segments, reused_segments
+
     def OLD_parse_HTML_output_template_and_generate_template_definitions(self):
         """
 
@@ -163,6 +537,62 @@ class Lazyblorg(object):
 
         return True
 
+    def _read_content_cache(self):
+        """
+
+        Reads the content cache of the previous run which is stored
+        next to the previous meta-data file.
+
+        @param return: dict(ID) of cache entries; empty if not found or outdated
+        """
+
+        filename = self._content_cache_filename(self.options.previous_metadatafilename)
+        if not os.path.isfile(filename):
+            return {}
+        try:
+            with open(filename, 'rb') as input:
+                signature, content_cache = pickle.load(input)
+        except (pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, ImportError) as message:
+            self.logging.warning("Ignoring the content cache \"" + filename + "\" which could not be read: " +
+                                 str(message))
+            return {}
+        if signature != self._htmlizer_signature():
+            self.logging.debug("Ignoring the content cache \"" + filename +
+                               "\" because the htmlizer or the configuration changed")
+            return {}
+        return content_cache
+
+    def _read_page_dependencies(self):
+        """
+
+        Reads the page dependency graph of the previous run and the
+        checksums of its inputs which are stored next to the previous
+        meta-data file. Without a readable graph, all pages are
+        generated like in a full build.
+
+        @param return: page_dependencies and input_signatures of the previous run; None if not found or outdated
+        """
+
+        filename = self._page_dependencies_filename(self.options.previous_metadatafilename)
+        if not os.path.isfile(filename):
+            return None, None
+        try:
+            with open(filename, 'rb') as input:
+                signature, page_dependencies, input_signatures = pickle.load(input)
+        except (pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, ImportError) as message:
+            self.logging.warning("Ignoring the page dependencies \"" + filename + "\" which could not be read: " +
+                                 str(message))
+            return None, None
+        if not isinstance(page_dependencies, dict) or not isinstance(input_signatures, dict):
+            self.logging.warning("Ignoring the page dependencies \"" + filename + "\" which could not be read")
+            return None, None
+        if signature != self._htmlizer_signature():
+            # the output files of the previous run are still known but their inputs are not comparable:
+            self.logging.debug("Ignoring the input checksums of the page dependencies \"" + filename +
+                               "\" because the htmlizer or the configuration changed")
+            return page_dependencies, None
+        return page_dependencies, input_signatures
+
     def generate_output(self, generate, marked_for_feed, increment_version):
         """
 
@@ -174,6 +604,8 @@ class Lazyblorg(object):
         @param return:
         """
 
+        previous_page_dependencies, previous_input_signatures = self._read_page_dependencies()
+
         htmlizer = Htmlizer(
             self.template_definitions,
             config.TAG_FOR_BLOG_ENTRY,
@@ -185,10 +617,35 @@ class Lazyblorg(object):
             increment_version,
             self.options.autotag_language,
             self.options.ignore_missing_ids,
-            getattr(self.options, 'external_url_file', None))
+            getattr(self.options, 'external_url_file', None),
+            getattr(self.options, 'incremental', False),
+            self.previous_metadata,
+            previous_page_dependencies,
+            getattr(self.options, 'pandoc_workers', 1),
+            self._read_content_cache(),
+            previous_input_signatures)
 
         # FIXXME: try except HtmlizerException?
-        return htmlizer.run()  # FIXXME: return value?
+        statistics_list = htmlizer.run()  # FIXXME: return value?
+
+        # store the page signatures so that the next (incremental) run
+        # is able to skip unchanged pages:
+        for entryid in htmlizer.page_signatures:
+            self.metadata[entryid]['page-signature'] = htmlizer.page_signatures[entryid]
+        self._write_metadata_file()
+
+        # store which output file was built from which entries,
+        # templates, and global inputs and the checksums of those
+        # inputs:
+        with open(self._page_dependencies_filename(self.options.new_metadatafilename), 'wb') as output:
+            pickle.dump([self._htmlizer_signature(), htmlizer.page_dependencies, htmlizer.input_signatures], output)
+
+        # store the htmlized content so that the next run is able to
+        # skip htmlizing unchanged entries:
+        with open(self._content_cache_filename(self.options.new_metadatafilename), 'wb') as output:
+            pickle.dump([self._htmlizer_signature(), htmlizer.content_cache], output)
+
+        return statistics_list
 
     def _parse_orgmode_file(self, filename):
         """
@@ -328,12 +785,9 @@ class Lazyblorg(object):
 
         5) and 6) known and matching previous run: ID, CREATED, checksum
         -> not changed (case 5/6 only differs in status of last timestamp)
-        -> generate
-
-        (FIXXME: in future, case 5 and 6 should result in "ignore". But
-        for this, I have to switch from "delete everything and re-generate
-        everything on every run" to "delete and re-generate only necessary
-        entries/pages")
+        -> generate; with "--incremental": ignore (the Htmlizer
+        re-generates its page nevertheless when other entries it
+        depends on got changed)
 
         7) known and matching: ID, CREATED, last timestamp; differs:
         checksum -> silent update -> generate
@@ -415,14 +869,19 @@ class Lazyblorg(object):
 
             elif metadata[entry]['created'] == previous_metadata[entry]['created'] and \
                     metadata[entry]['checksum'] == previous_metadata[entry]['checksum']:
-                self.logging.debug("case 5 or 6: old entry -> generate")
-                generate.append(entry)
+                if getattr(self.options, 'incremental', False):
+                    self.logging.debug("case 5 or 6: old entry -> ignore (incremental run)")
+                else:
+                    self.logging.debug("case 5 or 6: old entry -> generate")
+                    generate.append(entry)
                 continue
 
             elif metadata[entry]['created'] == previous_metadata[entry]['created'] and \
                     metadata[entry]['latestupdateTS'] == previous_metadata[entry]['latestupdateTS'] and \
                     metadata[entry]['checksum'] != previous_metadata[entry]['checksum']:
                 self.logging.debug("case 7: silent update -> generate")
+                self.logging.debug("changed fingerprints: " + ', '.join(
+                    Utils.get_changed_fingerprints(metadata[entry], previous_metadata[entry])))
                 generate.append(entry)
                 continue
 
@@ -431,6 +890,8 @@ class Lazyblorg(object):
                     metadata[entry]['checksum'] != previous_metadata[entry]['checksum']:
                 self.logging.debug(
                     "case 8: normal update -> generate, mark_for_feed, increment_version")
+                self.logging.debug("changed fingerprints: " + ', '.join(
+                    Utils.get_changed_fingerprints(metadata[entry], previous_metadata[entry])))
                 generate.append(entry)
                 marked_for_feed.append(entry)
                 increment_version.append(entry)
@@ -542,6 +1003,40 @@ if __name__ == "__main__":
         help="Path to a TSV file where all external URLs found in blog articles will be written to. " +
         "Useful as input for URL checkers.")
 
+    parser.add_argument(
+        "--incremental",
+        dest="incremental",
+        action="store_true",
+        help="Re-generate only pages whose content or dependencies changed since the previous run. " +
+        "Requires the result files of the previous run within the target directory.")
+
+    parser.add_argument(
+        "--pandoc-workers",
+        dest="pandoc_workers",
+        metavar='N',
+        type=int,
+        default=1,
+        help="Number of long-running pandoc processes that convert tables, lists, ... in parallel. " +
+        "Values greater than one convert the snippets of all articles upfront.")
+
+    parser.add_argument(
+        "--jobs",
+        dest="jobs",
+        metavar='N',
+        type=int,
+        default=1,
+        help="Number of worker processes that parse the Org-mode files in parallel. " +
+        "Files which did not change since the previous run are not parsed at all.")
+
+    parser.add_argument(
+        "--shard-orgfiles-above",
+        dest="shard_orgfiles_above",
+        metavar='MB',
+        type=int,
+        default=0,
+        help="With \"--jobs\", split Org-mode files larger than this number of megabytes " +
+        "at top-level headings and parse the parts in parallel as well. Default: 0 (disabled)")
+
     parser.add_argument("--version", dest="version", action="store_true",
                         help="Display version and exit.")
 
@@ -593,6 +1088,18 @@ if __name__ == "__main__":
                           "This does not make any sense, you silly fool :-)")
             Utils.error_exit(1)
 
+        if options.pandoc_workers < 1:
+            logging.error("Option \"--pandoc-workers\" requires a number greater than zero.")
+            Utils.error_exit(7)
+
+        if options.jobs < 1:
+            logging.error("Option \"--jobs\" requires a number greater than zero.")
+            Utils.error_exit(8)
+
+        if options.shard_orgfiles_above < 0:
+            logging.error("Option \"--shard-orgfiles-above\" requires a positive number or zero.")
+            Utils.error_exit(9)
+
         if not os.path.isdir(options.targetdir):
             logging.critical(
                 "Target directory \"" +
@@ -636,6 +1143,9 @@ if __name__ == "__main__":
             " lines (in %.2f seconds)" %
             (time_after_parsing -
              time_before_parsing))
+        logging.debug("Org mode files taken from the parse cache: " + str(lazyblorg.stats_org_files_from_parse_cache))
+        logging.debug("Segments of changed Org mode files taken from the parse cache: " +
+                      str(lazyblorg.stats_org_segments_from_parse_cache))
 
         statistics_list = lazyblorg.generate_output(generate, marked_for_feed, increment_version)
         # following lines seem inefficient but it allows me to add statistics in htmlizer without referencing here:
@@ -649,6 +1159,9 @@ if __name__ == "__main__":
         stats_generated_tagtree = statistics_list[7]
         stats_generated_feeds = statistics_list[8]
         stats_external_urls = statistics_list[9]
+        stats_pandoc_cache_hits = statistics_list[10]
+        stats_pandoc_cache_misses = statistics_list[11]
+        stats_content_cache_hits = statistics_list[12]
         time_after_htmlizing = time()
 
         external_urls_part = ""
@@ -678,6 +1191,8 @@ if __name__ == "__main__":
              time_after_parsing))
         logging.debug("Org mode snippets converted externally: " + str(stats_external_org_to_html5_conversion))
         logging.debug("LaTeX snippets converted externally:    " + str(stats_external_latex_to_html5_conversion))
+        logging.debug("pandoc cache hits/misses:               " + str(stats_pandoc_cache_hits) + "/" + str(stats_pandoc_cache_misses))
+        logging.debug("entries taken from the content cache:   " + str(stats_content_cache_hits))
 
         logging.debug("-------------> cleaning up the stage …")
 
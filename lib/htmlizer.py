@@ -11,10 +11,18 @@ from math import ceil  # for calculating reading time
 import random
 import re  # RegEx: for parsing/sanitizing
 import codecs
+import copy  # for the values of the content cache
 import urllib.parse
+import unicodedata  # for measuring lines like pandoc
+from hashlib import md5  # for generating page signatures
 from lib.utils import Utils  # for guess_language_from_stopword_percentages()
+from lib.orgparser import OrgParser  # for parsing list items
+from lib.placeholders import Placeholders  # for replacing the general placeholders in one pass
+from lib.pandocworkers import PandocWorkerPool  # for converting texts without starting pandoc for each one
 from shutil import copyfile  # for copying image files
 import cv2  # for scaling image files to their width of choice
+import threading  # for protecting statistics updated by pandoc worker threads
+from concurrent.futures import ThreadPoolExecutor  # for running pandoc conversions concurrently
 
 try:
     from werkzeug.utils import secure_filename  # for sanitizing path components
@@ -75,6 +83,13 @@ class Htmlizer(object):
     stats_images_resized = 0  # holds the current number of resized image files
     stats_external_org_to_html5_conversion = 0  # holds the number of invocations of external conversion tool (pypandoc so far)
     stats_external_latex_to_html5_conversion = 0  # holds the number of invocations of external conversion tool (pypandoc so far)
+    stats_pandoc_cache_hits = 0  # holds the number of conversions taken from config.PANDOC_CACHE_DIRECTORY
+    stats_pandoc_cache_misses = 0  # holds the number of conversions not found in config.PANDOC_CACHE_DIRECTORY
+    _pandoc_version = None  # version string of pandoc; part of the key of the pandoc cache
+    _pandoc_batch_results = None  # dict of (sourceformat, text) with HTML5 converted by _prepare_pandoc_conversions()
+    pandoc_workers = 1  # number of pandoc conversions which may run concurrently
+    _pandoc_worker_pool = None  # PandocWorkerPool while run() generates the output; see _run_pandoc()
+    _pandoc_statistics_lock = None  # threading.Lock() for the statistics updated by pandoc worker threads
 
     # { 'mytag': [ 'ID1', 'ID2', 'ID2'], 'anothertag': [...] }
     dict_of_tags_with_ids = None
@@ -92,6 +107,50 @@ class Htmlizer(object):
     # holds a list of tags whose tag pages have been generated
     list_of_tag_pages_generated = []
 
+    # texts which are converted by pandoc together with other texts of
+    # the same entry are separated by a paragraph consisting of this
+    # string followed by a hash value (see _prepare_pandoc_conversions()):
+    PANDOC_BATCH_SEPARATOR = 'LAZYBLORGPANDOCBATCHSEPARATOR'
+
+    # texts with headings, footnotes, or in-buffer settings are not
+    # converted in a batch since they influence each other:
+    PANDOC_BATCH_UNSUITABLE_ORG_REGEX = re.compile(r'(^\*+\s)|(\[fn:)|(^\s*#\+)', flags=re.MULTILINE)
+    PANDOC_BATCH_UNSUITABLE_LATEX_REGEX = re.compile(
+        r'\\(newcommand|renewcommand|providecommand|def|let|(sub)*section|chapter|paragraph|part|label|footnote|newenvironment)\b')
+
+    # content elements which are htmlized by _htmlize_blog_content()
+    # without invoking pandoc:
+    ELEMENTS_CONVERTED_WITHOUT_PANDOC = ['par', 'hr', 'heading', 'html-block', 'verse-block',
+                                         'example-block', 'colon-block', 'quote-block', 'src-block',
+                                         'cust_link_image']
+
+    # pandoc wraps its HTML output at this column; the native
+    # renderers for tables, lists, and paragraphs leave anything
+    # longer to pandoc (see _fits_pandoc_columns()):
+    PANDOC_COLUMNS = 72
+
+    # inline markup which is rendered natively: [[URL][description]],
+    # ~code~, and *bold* (with the Org-mode rules for characters
+    # before and after the markup):
+    INLINE_MARKUP_REGEX = re.compile(r'\[\[([^\[\]]+)\]\[([^\[\]]+)\]\]|' +
+                                     r'(?<![^\s(-])~(\S|\S[^~]*?\S)~(?=$|[\s.,:!?;)-])|' +
+                                     r'(?<![^\s(-])\*(\S|\S[^*]*?\S)\*(?=$|[\s.,:!?;)-])')
+
+    # text with anything that may be Org-mode syntax which is not
+    # supported by the native renderers (italic, underline, sub- and
+    # superscript, entities, timestamps, targets, quotes and dashes
+    # which pandoc replaces with typographic ones, ...); apostrophes
+    # within words are fine:
+    INLINE_UNSUPPORTED_REGEX = re.compile(r'[\\/_+^=$@{}\[\]"`~*|]|--|\.\.\.|<<|<\d|' +
+                                          r'(?<!\w)\'|\'(?!\w)')
+
+    # lines of center and ascii blocks which might be something else
+    # than text of a paragraph for pandoc:
+    PARAGRAPH_UNSUPPORTED_LINE_REGEX = re.compile(r'^\s*([|#:*+-]|\d+[.)](\s|$))')
+
+    # alignment cookies of Org-mode tables:
+    TABLE_ALIGNMENT_COOKIES = {'<l>': 'left', '<c>': 'center', '<r>': 'right', '': None}
+
     # FIXXME: improvement: introduce named regex groups for all regex:
 
     # find internal links to Org-mode IDs: [[id:simple]] and [[id:with][a
@@ -134,6 +193,27 @@ class Htmlizer(object):
     # find +strike through+ text:
     STRIKE_THROUGH_REGEX = re.compile(r'(\W|\A)\+([^~]+?)\+(\W|\Z)', flags=re.U)
 
+    # tokens of the inline markup of paragraphs and headings for
+    # htmlize_inline_markup(): links, stray '[[', bare URLs, *bold*,
+    # ~code~, =verbatim= and +strike through+ text (with the same
+    # rules as the regular expressions above), stray markup characters
+    # and characters to escape:
+    INLINE_TOKEN_REGEX = re.compile(r'(?P<link>\[\[(?P<target>[^\[\]]+)\](?:\[(?P<description>[^\[\]]+)\])?\])|' +
+                                    r'(?P<brackets>\[\[)|' +
+                                    r'(?P<url>https?://(?:(?!\[\[)\S)+)|' +
+                                    r'(?<!\w)(?P<markup>\*[^*]+?\*|~[^~]+?~|=[^=]+?=|\+[^~]+?\+)(?!\w)|' +
+                                    r'(?P<marker>[*~=+])|' +
+                                    r'(?P<escape>&(?:amp;)*|[<>—])', flags=re.U)
+
+    # characters to escape within tokens; '&amp;' is kept like
+    # fix_ampersands_in_url() does:
+    INLINE_ESCAPE_REGEX = re.compile(r'&(?:amp;)*|[<>—]', flags=re.U)
+    INLINE_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '—': '&mdash;'}
+
+    # HTML tags of the inline markup characters:
+    INLINE_MARKUP_TAGS = {'*': ('<b>', '</b>'), '~': ('<code>', '</code>'),
+                          '=': ('<code>', '</code>'), '+': ('<s>', '</s>')}
+
     # any ISO date-stamp of format YYYY-MM-DD:
     DATESTAMP = r'([12]\d\d\d)-([012345]\d)-([012345]\d)'
     DATESTAMP_REGEX = re.compile(DATESTAMP, flags=re.U)
@@ -153,6 +233,46 @@ class Htmlizer(object):
     # { 'https://example.com/page': { 'id:2024-01-15-article': set(['description1', ...]) } }
     _collected_external_urls = None
 
+    incremental = False  # boolean; if true, pages of unchanged entries are not re-generated
+    previous_metadata = None  # metadata of the previous run including the page signatures
+    page_signatures = None  # dict of IDs with the checksum of all inputs of their page; see _generate_page_signature()
+    stats_skipped_unchanged = 0  # holds the number of unchanged entries whose pages were not re-generated
+    stats_removed_stale_files = 0  # holds the number of output files of the previous run which were removed
+    stats_skipped_unchanged_files = 0  # holds the number of unchanged overview pages which were not re-generated
+    _htmlized_entries = None  # dict of IDs with the htmlized copies of their entries
+    _feed_fragments = None  # dict of IDs with the parts of their feed entries; see _get_feed_fragments()
+    _target_paths = None  # dict of IDs with their paths; see _target_path_for_id_without_targetdir()
+    _empty_tag_page_entries = None  # list of the entry stubs of the generated empty tag pages
+    _global_page_signature = None  # cached result of _get_global_page_signature()
+    _global_content_signature = None  # cached result of _get_global_content_signature()
+    _same_day_index = None  # cache for _get_same_day_candidates(): dict of (month, day) with lists of entries
+
+    # dict of output files (relative to targetdir) with the inputs they were built from:
+    # { 'tags/python/index.html': {'entries': ['2017-01-01-foo', ...], 'templates': ['tagpage-header', ...],
+    #                              'globals': ['config', 'tag:python', 'tags', ...]}, ... }
+    page_dependencies = None
+    previous_page_dependencies = None  # page_dependencies of the previous run
+
+    # dict of the inputs of page_dependencies with their checksums; see _get_input_signature():
+    # { 'entries': {'2017-01-01-foo': '...', ...}, 'templates': {'tagpage-header': '...', ...},
+    #   'globals': {'config': '...', 'tag:python': '...', ...} }
+    input_signatures = None
+    previous_input_signatures = None  # input_signatures of the previous run; None disables skipping overview pages
+    _input_signature_cache = None  # dict of (kind, name) with the results of _get_input_signature()
+    _archive_index = None  # cache for _get_input_signature(): result of _collect_all_entries_by_firstpublishTS()
+
+    # dict of IDs with the rendered content of their entries and the
+    # data to validate it; stored for the next run:
+    # { '2017-01-01-foo': {'properties': {'signature': '...', 'values': {'usertags': [...], 'autotags': {...},
+    #                                                                    'reading_minutes': 2}},
+    #                      'content': {'signature': '...', 'autotags': {...}, 'values': {'content': [...], ...},
+    #                                  'dependencies': {'entries': [...], 'templates': [...], 'globals': [...]}}}}
+    content_cache = None
+    CONTENT_CACHE_KEYS = ['content', 'htmlteaser', 'htmlteaser-equals-content', 'attachments']  # keys of htmlized entries in content_cache
+    previous_content_cache = None  # content_cache of the previous run; None disables the content cache
+    stats_content_cache_hits = 0  # holds the number of entries whose content was taken from previous_content_cache
+    _current_page_dependencies = None  # inputs of the output file which is generated right now
+
     SCALED_WIDTH_INDICATOR_TEXT = ' - scaled width '
     
     defined_languages = [x[0] for x in Utils.STOPWORDS]
@@ -174,7 +294,13 @@ class Htmlizer(object):
             increment_version,
             autotag_language,
             ignore_missing_ids,
-            external_url_file=None):
+            external_url_file=None,
+            incremental=False,
+            previous_metadata=None,
+            previous_page_dependencies=None,
+            pandoc_workers=1,
+            previous_content_cache=None,
+            previous_input_signatures=None):
         """
         This function initializes the class instance with the class variables.
 
@@ -188,6 +314,12 @@ class Htmlizer(object):
         @param increment_version: list of IDs which blog entries gets an update
         @param autotag_language: true, if guessing of language + its auto-tag should be done
         @param external_url_file: optional path to TSV file for external URL collection
+        @param incremental: true, if pages of unchanged entries should not be re-generated
+        @param previous_metadata: metadata of the previous run (used for incremental runs)
+        @param previous_page_dependencies: page_dependencies of the previous run (used for incremental runs)
+        @param pandoc_workers: number of pandoc processes which may run concurrently
+        @param previous_content_cache: content_cache of the previous run; None disables the content cache
+        @param previous_input_signatures: input_signatures of the previous run (used for incremental runs)
         """
 
         # initialize class variables
@@ -205,6 +337,24 @@ class Htmlizer(object):
         self.blog_data_by_id = {entry['id']: entry for entry in blog_data} if isinstance(blog_data, list) else {}
         if external_url_file:
             self._collected_external_urls = {}
+        self.incremental = incremental
+        self.previous_metadata = previous_metadata
+        self.page_signatures = {}
+        self._htmlized_entries = {}
+        self._feed_fragments = {}
+        self._target_paths = {}
+        self._empty_tag_page_entries = []
+        self.list_of_tag_pages_generated = []
+        self.page_dependencies = {}
+        self.previous_page_dependencies = previous_page_dependencies
+        self.input_signatures = {}
+        self.previous_input_signatures = previous_input_signatures
+        self._input_signature_cache = {}
+        self._pandoc_batch_results = {}
+        self.pandoc_workers = pandoc_workers
+        self._pandoc_statistics_lock = threading.Lock()
+        self.content_cache = {}
+        self.previous_content_cache = previous_content_cache
 
         # create logger (see
         # http://docs.python.org/2/howto/logging-cookbook.html)
@@ -218,12 +368,34 @@ class Htmlizer(object):
         """
         Basic method that creates all the output.
 
+        The pandoc conversions of the run are done by up to
+        pandoc_workers long-running pandoc processes which are stopped
+        at the end.
+
         @param: return: list of: stats_generated_total: total articles generated
                                  stats_generated_temporal: temporal articles generated
                                  stats_generated_persistent: persistent articles generated
                                  stats_generated_tags: tag articles generated
         """
 
+        try:
+            self._pandoc_worker_pool = PandocWorkerPool(self.pandoc_workers, pypandoc.get_pandoc_path())
+        except OSError:
+            self._pandoc_worker_pool = None  # pandoc not found: reported if anything needs to be converted
+        try:
+            return self._generate_output()
+        finally:
+            if self._pandoc_worker_pool:
+                self._pandoc_worker_pool.close()
+                self._pandoc_worker_pool = None
+
+    def _generate_output(self):
+        """
+        Creates all the output; see run().
+
+        @param: return: list of statistics; see run()
+        """
+
         self.blog_data = self._populate_backreferences(self.blog_data)
 
         self.dict_of_tags_with_ids = self._populate_dict_of_tags_with_ids(
@@ -252,10 +424,19 @@ class Htmlizer(object):
 
         self._generate_archive_pages()
 
+        if self.incremental:
+            self.logging.info('    Skipped ' + str(self.stats_skipped_unchanged_files) + ' unchanged overview pages')
+
         self._generate_feeds(entry_list_by_newest_timestamp)
 
         self._write_external_url_file()
 
+        self._store_input_signatures()
+
+        self._remove_stale_output_files()
+
+        self._keep_unused_content_cache_entries()
+
         return [stats_generated_total,
                 stats_generated_temporal,
                 stats_generated_persistent,
@@ -265,7 +446,10 @@ class Htmlizer(object):
                 self.stats_external_latex_to_html5_conversion,
                 stats_generated_tagtree,
                 self.stats_generated_feeds,
-                len(self._collected_external_urls) if self._collected_external_urls is not None else None]
+                len(self._collected_external_urls) if self._collected_external_urls is not None else None,
+                self.stats_pandoc_cache_hits,
+                self.stats_pandoc_cache_misses,
+                self.stats_content_cache_hits]
 
     def _populate_backreferences(self, blog_data):
         """
@@ -376,6 +560,18 @@ class Htmlizer(object):
             stats_generated_persistent, \
             stats_generated_tags = 0, 0, 0, 0
 
+        ids_to_generate = set(self.generate) if self.generate else set()
+
+        if self.pandoc_workers > 1:
+            # in incremental runs, only entries with new or updated
+            # content are known to be htmlized; entries with valid
+            # content cache entries are not htmlized at all:
+            self._prepare_pandoc_conversions_concurrently(
+                [entry for entry in self.blog_data
+                 if entry['category'] in [config.TAGS, config.PERSISTENT, config.TEMPORAL] and
+                 (not self.incremental or entry['id'] in ids_to_generate) and
+                 not self._content_cache_is_valid(entry)])
+
         for entry in self.blog_data:
 
             # example entry:
@@ -393,11 +589,38 @@ class Htmlizer(object):
 
             self.current_entry_id = entry['id']
 
-            entry = self.sanitize_and_htmlize_blog_content(entry)
+            # auto-tags are applied to every entry since they modify
+            # the usertags which are used by other pages as well:
+            self._populate_autotags_and_reading_minutes(entry)
+
+            if entry['category'] in [config.TAGS, config.PERSISTENT, config.TEMPORAL]:
+                signature = self._generate_page_signature(entry)
+                self.page_signatures[entry['id']] = signature
+
+                if self._page_is_unchanged(entry, signature, ids_to_generate):
+                    self.logging.debug(self.current_entry_id_str() + "entry and its dependencies are unchanged; " +
+                                       "skipping re-generation of its page")
+                    path = self._target_path_for_id_without_targetdir(entry['id'])
+                    for filename in [os.path.join(path, "index.html"), os.path.join(path, "source.org.txt")]:
+                        if filename in self.previous_page_dependencies:
+                            self.page_dependencies[filename] = self.previous_page_dependencies[filename]
+                    if entry['category'] == config.TAGS:
+                        self.list_of_tag_pages_generated.append(entry['title'])
+                    if self._collected_external_urls is not None:
+                        with codecs.open(os.path.join(self._target_path_for_id_with_targetdir(entry['id']), "index.html"),
+                                         'rb', encoding='utf-8') as inputhandle:
+                            self._collect_external_urls_from_html(inputhandle.read(), entry['id'])
+                    self.stats_skipped_unchanged += 1
+                    continue
+
+            elif entry['category'] == config.TEMPLATES and self.incremental:
+                # the content of the templates entry is not used for any page
+                continue
 
-            # populate reading time indicator:
-            if 'rawcontent' in entry.keys():
-                entry['reading_minutes'] = self._derive_reading_length(entry['rawcontent'])
+            # links within the content are dependencies of the page as well:
+            self._start_recording_page_dependencies([entry['id']])
+            entry = self._htmlize_blog_content(entry)
+            self._htmlized_entries[entry['id']] = entry
 
             htmlcontent = None
 
@@ -429,6 +652,9 @@ class Htmlizer(object):
                     'category'] == config.PERSISTENT or entry['category'] == config.TEMPORAL:
                 self.write_content_to_file(htmlfilename, htmlcontent)
                 self.write_orgcontent_to_file(orgfilename, entry['rawcontent'])
+                if entry['rawcontent']:
+                    self._store_page_dependencies(orgfilename, {'entries': set([entry['id']]),
+                                                                'templates': set(), 'globals': set()})
                 self._collect_external_urls_from_html(htmlcontent, entry['id'])
                 stats_generated_total += 1
 
@@ -437,6 +663,9 @@ class Htmlizer(object):
         stats_generated_total += stats_generated_empty_tags
         stats_generated_tags += stats_generated_empty_tags
 
+        if self.incremental:
+            self.logging.info('    Skipped ' + str(self.stats_skipped_unchanged) + ' unchanged articles')
+
         entry_list_by_newest_timestamp = self.generate_entry_list_by_newest_timestamp()
         self.generate_entry_page(entry_list_by_newest_timestamp, tags)
         stats_generated_total += 1
@@ -444,6 +673,501 @@ class Htmlizer(object):
         return entry_list_by_newest_timestamp, stats_generated_total, stats_generated_temporal, \
             stats_generated_persistent, stats_generated_tags
 
+    def _remove_stale_output_files(self):
+        """
+        Removes the output files of the previous run which were not
+        generated in this incremental run: e.g., the pages of deleted or
+        hidden entries and the archive pages of days without entries
+        any more. A full build would not generate them either.
+
+        A directory is removed if it contains no output file of this run
+        and no sub-directory any more. The image files which were copied
+        for the removed page are removed with it.
+        """
+
+        if not self.incremental or not self.previous_page_dependencies:
+            return
+
+        targetdir = os.path.abspath(self.targetdir)
+        current_files = set(os.path.join(targetdir, filename) for filename in self.page_dependencies)
+        stale_directories = set()
+
+        for filename in set(self.previous_page_dependencies) - set(self.page_dependencies):
+            path = os.path.abspath(os.path.join(targetdir, filename))
+            if not path.startswith(targetdir + os.sep):
+                continue
+            if os.path.isfile(path):
+                self.logging.debug('Removing output file of the previous run: ' + path)
+                os.remove(path)
+                self.stats_removed_stale_files += 1
+            stale_directories.add(os.path.dirname(path))
+
+        # deepest directories first so that their parents may get empty:
+        for directory in sorted(stale_directories, key=lambda directory: directory.count(os.sep), reverse=True):
+            while directory != targetdir and os.path.isdir(directory):
+                paths = [os.path.join(directory, name) for name in os.listdir(directory)]
+                if any(os.path.isdir(path) or path in current_files for path in paths):
+                    break
+                for path in paths:
+                    os.remove(path)
+                os.rmdir(directory)
+                directory = os.path.dirname(directory)
+
+        if self.stats_removed_stale_files:
+            self.logging.info('    Removed ' + str(self.stats_removed_stale_files) +
+                              ' output files of the previous run which were not generated any more')
+
+    def _page_is_unchanged(self, entry, signature, ids_to_generate):
+        """
+        Decides whether or not the page of an entry has to be re-generated in an incremental run.
+
+        @param entry: blog entry data
+        @param signature: the current page signature of the entry
+        @param ids_to_generate: set of IDs which got a new or updated content
+        @param return: True if the page of the previous run is still valid
+        """
+
+        if not self.incremental or entry['id'] in ids_to_generate:
+            return False
+
+        if not self.previous_metadata or entry['id'] not in self.previous_metadata or \
+           self.previous_metadata[entry['id']].get('page-signature') != signature:
+            return False
+
+        # the result files of the previous run and their dependencies have to be present:
+        path = self._target_path_for_id_without_targetdir(entry['id'])
+        if not self.previous_page_dependencies or \
+           os.path.join(path, "index.html") not in self.previous_page_dependencies:
+            return False
+        path = os.path.join(self.targetdir, path)
+        if not os.path.isfile(os.path.join(path, "index.html")):
+            return False
+        if entry.get('rawcontent') and not os.path.isfile(os.path.join(path, "source.org.txt")):
+            return False
+
+        return True
+
+    def _output_is_unchanged(self, filename):
+        """
+        Decides whether or not an output file which is not the page of
+        an entry (tag overview, tagtree, archive pages, ...) has to be
+        re-generated in an incremental run. The file of the previous
+        run is still valid if none of its dependencies of the previous
+        run changed. Its dependencies are taken over for the next run.
+
+        @param filename: the name of the output file including path
+        @param return: True if the file of the previous run is still valid
+        """
+
+        if not self.incremental or not self.previous_page_dependencies or not self.previous_input_signatures:
+            return False
+
+        relative_filename = os.path.relpath(filename, self.targetdir)
+        dependencies = self.previous_page_dependencies.get(relative_filename)
+        if not dependencies or not os.path.isfile(filename):
+            return False
+
+        for kind in dependencies:
+            previous_signatures = self.previous_input_signatures.get(kind, {})
+            for name in dependencies[kind]:
+                if name not in previous_signatures or \
+                   previous_signatures[name] != self._get_input_signature(kind, name):
+                    return False
+
+        self.logging.debug('Dependencies of ' + relative_filename + ' are unchanged; skipping its re-generation')
+        self.page_dependencies[relative_filename] = dependencies
+        self.stats_skipped_unchanged_files += 1
+        return True
+
+    def _get_input_signature(self, kind, name):
+        """
+        Returns a checksum of an input of page_dependencies. An entry
+        is represented by its page signature (see
+        _generate_page_signature()) which covers everything of the
+        entry that is shown on other pages as well. The input
+        'generation-time' never gets the same checksum twice.
+
+        @param kind: one of 'entries', 'templates', 'globals'
+        @param name: see _record_page_dependency()
+        @param return: hexadecimal value of the hash
+        """
+
+        if (kind, name) in self._input_signature_cache:
+            return self._input_signature_cache[(kind, name)]
+
+        # looking up the inputs must not add dependencies to the output file which is generated right now:
+        current_page_dependencies = self._current_page_dependencies
+        self._current_page_dependencies = None
+
+        if kind == 'entries':
+            if name in self.page_signatures:
+                data = self.page_signatures[name]
+            else:
+                data = [self._link_target_signature(name),
+                        sorted([(key, value) for key, value in (self.metadata or {}).get(name, {}).items()
+                                if key != 'page-signature'])]
+        elif kind == 'templates':
+            data = [definition for definition in self.template_definitions if definition[1] == name]
+        elif name == 'config':
+            data = [sorted([(key, repr(value)) for key, value in vars(config).items() if key.isupper()]),
+                    self.autotag_language,
+                    self.ignore_missing_ids,
+                    self._get_pandoc_version()]
+        elif name == 'tags':
+            data = sorted(self.dict_of_tags_with_ids.items())
+        elif name.startswith('tag:'):
+            data = self.dict_of_tags_with_ids.get(name[len('tag:'):])
+        elif name.startswith('same-day:'):
+            month, day = name[len('same-day:'):].split('-')
+            data = self._get_same_day_candidates(int(month), int(day))
+        elif name == 'entry-timeline':
+            data = self.generate_entry_list_by_newest_timestamp()
+        elif name.startswith('archive:'):
+            if self._archive_index is None:
+                self._archive_index = self._collect_all_entries_by_firstpublishTS()
+            prefix = name[len('archive:'):] + '-'
+            data = sorted([key, [[entry['id'], entry['title'], entry['category'], entry['firstpublishTS']]
+                                 for entry in entries]]
+                          for key, entries in self._archive_index.items()
+                          if ('%04d-%02d-%02d-' % key).startswith(prefix))
+        else:
+            data = ['generation-time', time()]
+
+        self._current_page_dependencies = current_page_dependencies
+        self._input_signature_cache[(kind, name)] = self._checksum(data)
+        return self._input_signature_cache[(kind, name)]
+
+    def _store_input_signatures(self):
+        """
+        Stores the checksums of all inputs of page_dependencies in
+        input_signatures so that the next incremental run is able to
+        skip the output files whose inputs did not change.
+        """
+
+        for dependencies in self.page_dependencies.values():
+            for kind in dependencies:
+                for name in dependencies[kind]:
+                    self.input_signatures.setdefault(kind, {})[name] = self._get_input_signature(kind, name)
+
+    @staticmethod
+    def _checksum(data):
+        """
+        Returns a hexadecimal hash value of the representation of data.
+
+        @param data: any data structure with a deterministic repr()
+        @param return: hexadecimal value of the hash
+        """
+
+        return md5(repr(data).encode('utf-8')).hexdigest()
+
+    def _generate_page_signature(self, entry):
+        """
+        Generates a checksum of all inputs that affect the page of an
+        entry: its own data, the URLs of its link targets, its
+        back-references, the same-day articles, the tag page list
+        (for tag pages), and everything that is shared by all pages
+        (see _get_global_page_signature()).
+
+        The signature has to be generated before the content gets
+        htmlized. If the signature equals the one of the previous
+        run, the page would be byte-identical and does not need to be
+        re-generated.
+
+        FIXXME: changed image files are not part of the signature. This
+        is the same behavior as for image files already copied to the
+        target directory.
+
+        @param entry: blog entry data
+        @param return: hexadecimal value of the hash
+        """
+
+        linked_ids = self._get_linked_ids(entry)
+        if entry.get('autotags'):
+            linked_ids.add('empty-language-autotag-page')
+
+        back_references = []
+        for back_reference_id in sorted(list(entry.get('back-references', []))):
+            back_reference = self.blog_data_by_id[back_reference_id]
+            back_references.append([self._link_target_signature(back_reference_id),
+                                    config.TAG_FOR_HIDDEN in back_reference.get('usertags', [])])
+
+        tag_page = None
+        if entry['category'] == config.TAGS:
+            tag = entry['title']
+            references = []
+            if self.dict_of_tags_with_ids and tag in self.dict_of_tags_with_ids:
+                references = [[self._link_target_signature(reference), self.metadata[reference]['latestupdateTS']]
+                              for reference in self.dict_of_tags_with_ids[tag]]
+            tag_page = [references, sorted(self._get_co_occurring_tags([tag]))]
+
+        return self._checksum([self._get_global_page_signature(),
+                               entry['id'],
+                               entry['title'],
+                               entry['category'],
+                               entry['usertags'],
+                               entry.get('autotags'),
+                               entry['firstpublishTS'],
+                               entry['latestupdateTS'],
+                               entry['content'],
+                               entry.get('rawcontent'),
+                               [self._link_target_signature(x) for x in sorted(linked_ids)],
+                               back_references,
+                               self._get_same_day_signature(entry),
+                               tag_page])
+
+    def _get_global_page_signature(self):
+        """
+        Returns a checksum of the inputs which are shared by all pages:
+        template definitions, configuration values, command line
+        options, the top tag list, and the link targets of the
+        templates.
+
+        @param return: hexadecimal value of the hash
+        """
+
+        if self._global_page_signature is None:
+            template_string = str(self.template_definitions)
+            linked_ids = set([x[1] for x in re.findall(self.ID_SIMPLE_LINK_REGEX, template_string)] +
+                             [x[1] for x in re.findall(self.ID_DESCRIBED_LINK_REGEX, template_string)] +
+                             [config.ID_OF_ABOUT_PAGE, config.ID_OF_HOWTO_PAGE])
+            config_values = sorted([(key, repr(value)) for key, value in vars(config).items() if key.isupper()])
+            if self._cached_top_tag_list is None:
+                self._cached_top_tag_list = self._generate_top_tag_list()
+
+            self._global_page_signature = self._checksum([template_string,
+                                                          config_values,
+                                                          self.autotag_language,
+                                                          self.ignore_missing_ids,
+                                                          self._cached_top_tag_list,
+                                                          [self._link_target_signature(x) for x in sorted(linked_ids)]])
+
+        return self._global_page_signature
+
+    def _link_target_signature(self, targetid):
+        """
+        Returns the data which determines the URL and the link
+        description of a link target.
+
+        @param targetid: ID of a blog entry
+        @param return: list of ID, category, first publish time-stamp, and title
+        """
+
+        if targetid in self.blog_data_by_id:
+            target = self.blog_data_by_id[targetid]
+        elif self.ignore_missing_ids and self.blog_data:
+            target = self.blog_data[0]  # see blog_data_with_id()
+        else:
+            return [targetid]
+
+        return [targetid, target['category'], target['firstpublishTS'], target['title']]
+
+    def _get_same_day_signature(self, entry):
+        """
+        Returns the data of all candidates for the same-day section of
+        _generate_same_day_articles_section().
+
+        @param entry: blog entry data
+        @param return: list of ID, title, and first publish time-stamp of the candidates
+        """
+
+        if entry['category'] != config.TEMPORAL or entry.get('firstpublishTS') is None:
+            return []
+
+        return [x for x in self._get_same_day_candidates(entry['firstpublishTS'].month, entry['firstpublishTS'].day)
+                if x[0] != entry['id']]
+
+    def _get_same_day_candidates(self, month, day):
+        """
+        Returns the non-hidden temporal entries which were published on
+        a given day of the year (in any year).
+
+        @param month: int month
+        @param day: int day
+        @param return: list of ID, title, and first publish time-stamp of the entries
+        """
+
+        if self._same_day_index is None:
+            self._same_day_index = {}
+            for other in self.blog_data:
+                if other['category'] != config.TEMPORAL or \
+                   config.TAG_FOR_HIDDEN in other.get('usertags', []) or \
+                   not other.get('firstpublishTS'):
+                    continue
+                key = (other['firstpublishTS'].month, other['firstpublishTS'].day)
+                if key not in self._same_day_index:
+                    self._same_day_index[key] = []
+                self._same_day_index[key].append([other['id'], other['title'], other['firstpublishTS']])
+
+        return self._same_day_index.get((month, day), [])
+
+    def _get_linked_ids(self, entry):
+        """
+        Returns the IDs of the internal links within the content of an entry.
+
+        @param entry: blog entry data
+        @param return: set of IDs
+        """
+
+        content_string = str(entry['content'])
+        return set([x[1] for x in re.findall(self.ID_SIMPLE_LINK_REGEX, content_string)] +
+                   [x[1] for x in re.findall(self.ID_DESCRIBED_LINK_REGEX, content_string)])
+
+    def _generate_content_signature(self, entry, autotags):
+        """
+        Generates a checksum of all inputs that affect the htmlized
+        content of an entry (see _render_blog_content()): its content
+        and level, its auto-tags (the language determines the clue
+        text of linked images), the URLs of its link targets, and
+        everything that is shared by the content of all entries (see
+        _get_global_content_signature()).
+
+        @param entry: blog entry data
+        @param autotags: auto-tags of the entry
+        @param return: hexadecimal value of the hash
+        """
+
+        return self._checksum([self._get_global_content_signature(),
+                               entry['id'],
+                               entry.get('level'),
+                               entry['content'],
+                               autotags,
+                               [self._link_target_signature(x) for x in sorted(self._get_linked_ids(entry))]])
+
+    def _get_global_content_signature(self):
+        """
+        Returns a checksum of the inputs which are shared by the
+        content of all entries: template definitions, configuration
+        values, the handling of missing IDs, and the version of pandoc.
+
+        @param return: hexadecimal value of the hash
+        """
+
+        if self._global_content_signature is None:
+            config_values = sorted([(key, repr(value)) for key, value in vars(config).items() if key.isupper()])
+            self._global_content_signature = self._checksum([str(self.template_definitions),
+                                                             config_values,
+                                                             self.ignore_missing_ids,
+                                                             self._get_pandoc_version()])
+
+        return self._global_content_signature
+
+    def _content_cache_is_valid(self, entry):
+        """
+        Checks whether the content cache holds the htmlized content of
+        an entry with unchanged inputs. The auto-tags of the cached
+        content are used because the auto-tags of the entry might not
+        be populated yet.
+
+        @param entry: blog entry data
+        @param return: True if _htmlize_blog_content() takes the content from the cache
+        """
+
+        if self.previous_content_cache is None:
+            return False
+        cached = self.previous_content_cache.get(entry['id'], {}).get('content')
+        return bool(cached) and cached['signature'] == self._generate_content_signature(entry, cached['autotags'])
+
+    def _cached_images_are_located(self, cached):
+        """
+        Checks whether the image files of cached content are still
+        found via IMAGE_INCLUDE_METHOD (see locate_cust_link_image()).
+
+        @param cached: content cache entry
+        @param return: True if all images of the cached content are found
+        """
+
+        images = [attachment[1] for attachment in cached['values'].get('attachments', [])
+                  if attachment[0] == 'cust_link_image']
+        if not images:
+            return True
+        if len(self.filename_dict) == 0:
+            self._populate_filename_dict()
+        return all(filename in self.filename_dict for filename in images)
+
+    def _keep_unused_content_cache_entries(self):
+        """
+        Entries which did not get htmlized in an incremental run keep
+        their content cache entries of the previous run for the next
+        run.
+        """
+
+        if not self.previous_content_cache:
+            return
+        for entryid, cached in self.previous_content_cache.items():
+            if entryid in self.blog_data_by_id:
+                for kind in cached:
+                    self.content_cache.setdefault(entryid, {}).setdefault(kind, cached[kind])
+
+    def _make_sure_entry_is_htmlized(self, entry):
+        """
+        Pages of unchanged entries are skipped in incremental runs. If
+        their content is needed for the entry page or the feeds, it
+        gets htmlized here on demand. The image files are already
+        in place; only their width and height are collected.
+
+        @param entry: blog entry data
+        @param return: htmlized copy of the entry; see _htmlize_blog_content()
+        """
+
+        if entry['id'] not in self._htmlized_entries:
+            previous_entry_id = self.current_entry_id
+            # the inputs of the content are recorded as dependencies of the entry's own page only:
+            current_page_dependencies = self._current_page_dependencies
+            self._current_page_dependencies = None
+            self.current_entry_id = entry['id']
+            htmlized_entry = self._htmlize_blog_content(entry)
+            self._htmlized_entries[entry['id']] = htmlized_entry
+            self._create_path_and_generate_filenames_and_copy_images(htmlized_entry)
+            self.current_entry_id = previous_entry_id
+            self._current_page_dependencies = current_page_dependencies
+
+        return self._htmlized_entries[entry['id']]
+
+    def _start_recording_page_dependencies(self, entryids=[]):
+        """
+        Starts collecting the inputs of the next output file. The
+        collected dependencies get stored by write_content_to_file().
+        The global input "config" is part of every output file.
+
+        @param entryids: list of IDs the output file depends on in any case
+        """
+
+        self._current_page_dependencies = {'entries': set(entryids),
+                                           'templates': set(),
+                                           'globals': set(['config'])}
+
+    def _record_page_dependency(self, kind, name):
+        """
+        Adds an input to the dependencies of the output file which is
+        generated right now (if any).
+
+        @param kind: one of 'entries', 'templates', 'globals'
+        @param name: ID of an entry, name of a template, or name of a global input like
+                     'tags' (all tags and their usage), 'tag:python' (all entries tagged with
+                     python), 'same-day:MM-DD', 'entry-timeline', 'archive:YYYY' (all entries of
+                     the archive page of a year; also 'archive:YYYY-MM' and 'archive:YYYY-MM-DD'),
+                     or 'generation-time'
+        """
+
+        if self._current_page_dependencies is not None:
+            self._current_page_dependencies[kind].add(name)
+
+    def _store_page_dependencies(self, filename, dependencies=None):
+        """
+        Stores the dependencies of an output file in page_dependencies.
+
+        @param filename: the name of the output file including path
+        @param dependencies: dict like in _start_recording_page_dependencies(); default: the current ones
+        """
+
+        if dependencies is None:
+            dependencies = self._current_page_dependencies
+        if dependencies is None or not filename.startswith(self.targetdir):
+            return
+
+        self.page_dependencies[os.path.relpath(filename, self.targetdir)] = \
+            {kind: sorted(dependencies[kind]) for kind in dependencies}
+
     def _generate_page(self, kind, originalentry):
         """
         Creates a blog article page of a few standard types.
@@ -577,8 +1301,13 @@ class Htmlizer(object):
             entry = dict(entry)
             entry['id'] = self.ID_PREFIX_FOR_EMPTY_TAG_PAGES + tag
             entry['title'] = tag
-            self.blog_data.append(entry)
+            self._empty_tag_page_entries.append(entry)
+            if self._output_is_unchanged(os.path.join(self._target_path_for_id_with_targetdir(entry['id']),
+                                                      'index.html')):
+                self.list_of_tag_pages_generated.append(tag)
+                continue
             logging.info('----> Generating tag page for: ' + tag)
+            self._start_recording_page_dependencies()
             htmlfilename, orgfilename, htmlcontent = self._generate_page(config.TAGS, entry)
             self.write_content_to_file(htmlfilename, htmlcontent)
             # omit writing org file since there is no user-generated org-mode file for it
@@ -715,6 +1444,80 @@ class Htmlizer(object):
 
         return feed.replace('>' + config.BASE_URL, '>http:' + config.BASE_URL).replace('\'' + config.BASE_URL, '\'http:' + config.BASE_URL).replace('\"' + config.BASE_URL, '\"http:' + config.BASE_URL)
 
+    @staticmethod
+    def _add_https_to_blog_urls(content):
+        """
+        Replaces "//example.com" with "https://example.com" to calm down
+        feed verifiers/aggregators. Only URLs starting right after
+        '>', "'", or '"' are replaced.
+
+        @param content: string with parts of a feed
+        @param return: the modified content
+        """
+
+        for old, new in [('>' + config.BASE_URL, '>https:' + config.BASE_URL),
+                         ('\'' + config.BASE_URL, '\'https:' + config.BASE_URL),
+                         ('"' + config.BASE_URL, '"https:' + config.BASE_URL)]:
+            content = content.replace(old, new)
+        return content
+
+    def _get_feed_fragments(self, entry, url):
+        """
+        Returns the parts of the feed entry of an article which are the
+        same in the global feeds and in the tag feeds. They are
+        generated once per run and article. The URLs of the blog get
+        their "https:" here already; see _add_https_to_blog_urls().
+
+        @param entry: blog entry data
+        @param url: string that holds the URL of the article
+        @param return: dict with the 'head' (title, link, time-stamps, and
+                       categories), the 'summary', and the 'content' of the feed entry
+        """
+
+        if entry['id'] in self._feed_fragments:
+            return self._feed_fragments[entry['id']]
+
+        entry = self._make_sure_entry_is_htmlized(entry)
+
+        head = """\n<!-- ############################################################################################# -->\n<entry>
+    <title type="text">""" + self.sanitize_feed_html_characters(entry['title']) + """</title>
+    <link href='""" + config.BASE_URL + "/" + url + """' />
+    <published>""" + entry['firstpublishTS'].strftime('%Y-%m-%dT%H:%M:%S' + config.TIME_ZONE_ADDON) + """</published>
+    <updated>""" + entry['latestupdateTS'].strftime('%Y-%m-%dT%H:%M:%S' + config.TIME_ZONE_ADDON) + "</updated>"
+
+        # adding all tags:
+        for tag in entry['usertags']:
+            head += "\n    <category scheme='" + config.BASE_URL + \
+                "/" + "tags" + "/" + tag + "' term='" + tag + "' />"
+        # handle autotags:
+        if 'autotags' in entry:
+            for autotag in entry['autotags']:
+                tag = autotag + ":" + entry['autotags'][autotag]
+                head += "\n    <category scheme='" + config.BASE_URL + "/" + \
+                    "autotags" + "/" + autotag + "' term='" + tag + "' />"
+
+        # what part of the data is to show on the entry page?
+        if entry['htmlteaser-equals-content']:
+            teaser_html_content = entry['content']
+        else:
+            teaser_html_content = entry['htmlteaser']
+
+        # adding article paths to embedded images:
+        teaser_html_content = self._add_absolute_path_to_image_src(teaser_html_content, url)
+
+        self._feed_fragments[entry['id']] = {
+            'head': self._add_https_to_blog_urls(head),
+            'summary': self._add_https_to_blog_urls(
+                "\n    <summary type='html'>" +
+                self.sanitize_feed_html_characters('\n'.join(teaser_html_content)) +
+                "\n    </summary>"),
+            'content': self._add_https_to_blog_urls(
+                "    <content type='html'>\n" +
+                self.sanitize_feed_html_characters('\n'.join(entry['content'])) +
+                "\n    </content>")}
+
+        return self._feed_fragments[entry['id']]
+
     def __generate_feeds_for_everything(self, entry_list_by_newest_timestamp):
         """
         Generator function for the global RSS/ATOM feed.
@@ -723,9 +1526,13 @@ class Htmlizer(object):
         """
 
         atom_targetfile_links, atom_targetfile_teaser, atom_targetfile_content = self.__generate_feed_file_path("all")
-        links_atom_feed = self.__generate_new_feed().replace('#LINKPOSTFIX#', self.LINKS_ONLY_FEED_POSTFIX)
-        teaser_atom_feed = self.__generate_new_feed().replace('#LINKPOSTFIX#', self.LINKS_AND_TEASER_FEED_POSTFIX)
-        content_atom_feed = self.__generate_new_feed().replace('#LINKPOSTFIX#', self.LINKS_AND_CONTENT_FEED_POSTFIX)
+        self._start_recording_page_dependencies()
+        self._record_page_dependency('globals', 'entry-timeline')
+        self._record_page_dependency('globals', 'generation-time')
+        # the parts of the feeds are joined once at the end:
+        links_atom_feed = [self.__generate_new_feed().replace('#LINKPOSTFIX#', self.LINKS_ONLY_FEED_POSTFIX)]
+        teaser_atom_feed = [self.__generate_new_feed().replace('#LINKPOSTFIX#', self.LINKS_AND_TEASER_FEED_POSTFIX)]
+        content_atom_feed = [self.__generate_new_feed().replace('#LINKPOSTFIX#', self.LINKS_AND_CONTENT_FEED_POSTFIX)]
 
         number_of_current_feed_entries = 0
         listentry = None
@@ -760,68 +1567,24 @@ class Htmlizer(object):
             if config.TAG_FOR_HIDDEN in blog_data_entry['usertags']:
                 continue
 
-            # filling feed entry string:
-            feedentry = """\n<!-- ############################################################################################# -->\n<entry>
-    <title type="text">""" + self.sanitize_feed_html_characters(blog_data_entry['title']) + """</title>
-    <link href='""" + config.BASE_URL + "/" + listentry['url'] + """' />
-    <published>""" + blog_data_entry['firstpublishTS'].strftime('%Y-%m-%dT%H:%M:%S' + config.TIME_ZONE_ADDON) + """</published>
-    <updated>""" + blog_data_entry['latestupdateTS'].strftime('%Y-%m-%dT%H:%M:%S' + config.TIME_ZONE_ADDON) + "</updated>"
-
-            # adding all tags:
-            for tag in blog_data_entry['usertags']:
-
-                feedentry += "\n    <category scheme='" + config.BASE_URL + \
-                    "/" + "tags" + "/" + tag + "' term='" + tag + "' />"
-            # handle autotags:
-            if 'autotags' in blog_data_entry:
-                for autotag in blog_data_entry['autotags']:
-                    tag = autotag + ":" + blog_data_entry['autotags'][autotag]
-                    feedentry += "\n    <category scheme='" + config.BASE_URL + "/" + \
-                        "autotags" + "/" + autotag + "' term='" + tag + "' />"
-
-            # write feedentry to links_atom_feed before any summary is added:
-            # NOTE: "config.BASE_URL.lower()" necessary for W3C XML validator to be happy. This might potentially break BASE_URLs that contain upper case characters which are necessary!
-            links_atom_feed += feedentry + "\n    <id>https:" + config.BASE_URL.lower() + "/" + \
-                listentry['url'] + "-from-feed-with-links" + "</id>\n</entry>"
-
-            # add article summary to feedentry:
-            feedentry += "\n    <summary type='html'>"
-
-            # what part of the data is to show on the entry page?
-            teaser_html_content = False
-            if blog_data_entry['htmlteaser-equals-content']:
-                teaser_html_content = blog_data_entry['content']
-            else:
-                teaser_html_content = blog_data_entry['htmlteaser']
-
-            # adding article paths to embedded images:
-            teaser_html_content = self._add_absolute_path_to_image_src(teaser_html_content, listentry['url'])
+            fragments = self._get_feed_fragments(blog_data_entry, listentry['url'])
 
-            feedentry += self.sanitize_feed_html_characters('\n'.join(teaser_html_content))
-            feedentry += "\n    </summary>"
-
-            # add content to content-feed OR end entry for links-feed:
+            # the links feed has no summary; the content feed has the content in addition:
             # NOTE: "config.BASE_URL.lower()" necessary for W3C XML validator to be happy. This might potentially break BASE_URLs that contain upper case characters which are necessary!
-            teaser_atom_feed += feedentry + "\n    <id>https:" + config.BASE_URL.lower() + "/" + \
-                listentry['url'] + "-from-feed-with-teaser" + "</id>\n</entry>"
-            content_atom_feed += feedentry + "    <content type='html'>\n" + \
-                self.sanitize_feed_html_characters('\n'.join(blog_data_entry['content'])) + \
-                "\n    </content>\n    <id>https:" + config.BASE_URL.lower() + "/" + \
-                listentry['url'] + "-from-feed-with-content" + "</id>\n</entry>"
-
-            # replace "//example.com" with "https://example.com" to calm down feed verifiers/aggregators:
-            for old, new in [('>' + config.BASE_URL, '>https:' + config.BASE_URL),
-                             ('\'' + config.BASE_URL, '\'https:' + config.BASE_URL),
-                             ('"' + config.BASE_URL, '"https:' + config.BASE_URL)]:
-                links_atom_feed = links_atom_feed.replace(old, new)
-                teaser_atom_feed = teaser_atom_feed.replace(old, new)
-                content_atom_feed = content_atom_feed.replace(old, new)
+            links_atom_feed += [fragments['head'], "\n    <id>https:" + config.BASE_URL.lower() + "/" +
+                                listentry['url'] + "-from-feed-with-links" + "</id>\n</entry>"]
+            teaser_atom_feed += [fragments['head'], fragments['summary'], "\n    <id>https:" +
+                                 config.BASE_URL.lower() + "/" + listentry['url'] + "-from-feed-with-teaser" +
+                                 "</id>\n</entry>"]
+            content_atom_feed += [fragments['head'], fragments['summary'], fragments['content'],
+                                  "\n    <id>https:" + config.BASE_URL.lower() + "/" +
+                                  listentry['url'] + "-from-feed-with-content" + "</id>\n</entry>"]
 
             number_of_current_feed_entries += 1
 
-        links_atom_feed += "</feed>"
-        teaser_atom_feed += "</feed>"
-        content_atom_feed += "</feed>"
+        links_atom_feed = ''.join(links_atom_feed) + "</feed>"
+        teaser_atom_feed = ''.join(teaser_atom_feed) + "</feed>"
+        content_atom_feed = ''.join(content_atom_feed) + "</feed>"
 
         assert(isinstance(links_atom_feed, str))
         assert(isinstance(teaser_atom_feed, str))
@@ -889,6 +1652,12 @@ class Htmlizer(object):
             return 0
         generated_tag_feeds.add(feed_key)
 
+        self._start_recording_page_dependencies()
+        self._record_page_dependency('globals', 'entry-timeline')
+        self._record_page_dependency('globals', 'generation-time')
+        for tag in tag_path:
+            self._record_page_dependency('globals', 'tag:' + tag)
+
         tag_set = set(tag_path)
         feed_filename = self._get_tag_feed_filename(tag_path)
         feed_filepath = os.path.join(self.targetdir, config.FEEDDIR, feed_filename)
@@ -914,6 +1683,8 @@ class Htmlizer(object):
   <rights>All content written by """ + config.AUTHOR_NAME + """</rights>
   <generator uri='https://github.com/novoid/lazyblorg'>Generated from Org-mode source code using lazyblorg which is written in Python. Industrial-strength technology, baby.</generator>"""
 
+        # the parts of the feed are joined once at the end:
+        feed = [feed]
         number_of_entries = 0
         listentry_index = 0
 
@@ -940,48 +1711,14 @@ class Htmlizer(object):
             if not tag_set.issubset(set(blog_data_entry['usertags'])):
                 continue
 
-            feedentry = """\n<!-- ############################################################################################# -->\n<entry>
-    <title type="text">""" + self.sanitize_feed_html_characters(blog_data_entry['title']) + """</title>
-    <link href='""" + config.BASE_URL + "/" + listentry['url'] + """' />
-    <published>""" + blog_data_entry['firstpublishTS'].strftime('%Y-%m-%dT%H:%M:%S' + config.TIME_ZONE_ADDON) + """</published>
-    <updated>""" + blog_data_entry['latestupdateTS'].strftime('%Y-%m-%dT%H:%M:%S' + config.TIME_ZONE_ADDON) + "</updated>"
-
-            for tag in blog_data_entry['usertags']:
-                feedentry += "\n    <category scheme='" + config.BASE_URL + \
-                    "/" + "tags" + "/" + tag + "' term='" + tag + "' />"
-            if 'autotags' in blog_data_entry:
-                for autotag in blog_data_entry['autotags']:
-                    tag = autotag + ":" + blog_data_entry['autotags'][autotag]
-                    feedentry += "\n    <category scheme='" + config.BASE_URL + "/" + \
-                        "autotags" + "/" + autotag + "' term='" + tag + "' />"
-
-            feedentry += "\n    <summary type='html'>"
-
-            teaser_html_content = False
-            if blog_data_entry['htmlteaser-equals-content']:
-                teaser_html_content = blog_data_entry['content']
-            else:
-                teaser_html_content = blog_data_entry['htmlteaser']
-
-            teaser_html_content = self._add_absolute_path_to_image_src(teaser_html_content, listentry['url'])
-            feedentry += self.sanitize_feed_html_characters('\n'.join(teaser_html_content))
-            feedentry += "\n    </summary>"
-
-            feed += feedentry + "    <content type='html'>\n" + \
-                self.sanitize_feed_html_characters('\n'.join(blog_data_entry['content'])) + \
-                "\n    </content>\n    <id>https:" + config.BASE_URL.lower() + "/" + \
-                listentry['url'] + "-from-tag-feed-with-content" + "</id>\n</entry>"
-
-            # replace "//example.com" with "https://example.com"
-            for old, new in [('>' + config.BASE_URL, '>https:' + config.BASE_URL),
-                             ('\'' + config.BASE_URL, '\'https:' + config.BASE_URL),
-                             ('"' + config.BASE_URL, '"https:' + config.BASE_URL)]:
-                feed = feed.replace(old, new)
+            fragments = self._get_feed_fragments(blog_data_entry, listentry['url'])
+            feed += [fragments['head'], fragments['summary'], fragments['content'],
+                     "\n    <id>https:" + config.BASE_URL.lower() + "/" +
+                     listentry['url'] + "-from-tag-feed-with-content" + "</id>\n</entry>"]
 
             number_of_entries += 1
 
-        feed += "</feed>"
-        self.write_content_to_file(feed_filepath, feed)
+        self.write_content_to_file(feed_filepath, ''.join(feed) + "</feed>")
         return 1
 
     def generate_entry_list_by_newest_timestamp(self):
@@ -995,7 +1732,7 @@ class Htmlizer(object):
 
         entrylist = []
 
-        for entry in self.blog_data:
+        for entry in self.blog_data + self._empty_tag_page_entries:
             entry_to_add = {
                 'id': entry['id'],
                 'latestupdateTS': entry['latestupdateTS'],
@@ -1025,6 +1762,10 @@ class Htmlizer(object):
         """
 
         entry_page_filename = os.path.join(self.targetdir, "index.html")
+        if self._output_is_unchanged(entry_page_filename):
+            return
+        self._start_recording_page_dependencies()
+        self._record_page_dependency('globals', 'entry-timeline')
 
         htmlcontent = '' + \
             self.template_definition_by_name('entrypage-header')
@@ -1067,6 +1808,7 @@ class Htmlizer(object):
             if entry['category'] == 'TEMPORAL' or entry[
                     'category'] == 'PERSISTENT':
 
+                entry = self._make_sure_entry_is_htmlized(entry)
                 content = ""
 
                 for articlepart in [
@@ -1189,10 +1931,11 @@ class Htmlizer(object):
 
         @param: content: list of elements that contain HTML sources
         @param: url: string that holds the URL of the article
-        @param: return: the modified content
+        @param: return: the modified copy of the content
         """
         # adding article paths to embedded images:
         absolute_prefix = 'http:' + config.BASE_URL + '/' + url + '/'
+        content = list(content)  # the htmlized content is used for more than one page or feed
         element_index = 0
         for element in content:
             if element.startswith('\n<figure class="'):
@@ -1220,6 +1963,7 @@ class Htmlizer(object):
         """
 
         result = ''
+        self._record_page_dependency('globals', 'tags')
 
         # removing tags that should be ignored due to user configuration:
         for tagitem in tags:
@@ -1268,6 +2012,9 @@ class Htmlizer(object):
         """
 
         tag_overview_filename = os.path.join(self.targetdir, 'tags', 'index.html')
+        if self._output_is_unchanged(tag_overview_filename):
+            return
+        self._start_recording_page_dependencies()
 
         htmlcontent = ''
         for articlepart in [
@@ -1311,7 +2058,7 @@ class Htmlizer(object):
 
         entries_by_date = {}
 
-        for entry in self.blog_data:
+        for entry in self.blog_data + self._empty_tag_page_entries:
             if entry['category'] not in (config.TEMPORAL, config.PERSISTENT, config.TAGS):
                 continue
             if config.TAG_FOR_HIDDEN in entry.get('usertags', []):
@@ -1416,6 +2163,10 @@ class Htmlizer(object):
         except OSError:
             pass
         filename = os.path.join(target_path, 'index.html')
+        if self._output_is_unchanged(filename):
+            return
+        self._start_recording_page_dependencies()
+        self._record_page_dependency('globals', 'archive:' + year_str)
 
         month_list_html = ''
         for month in sorted(months_dict.keys()):
@@ -1462,6 +2213,10 @@ class Htmlizer(object):
         except OSError:
             pass
         filename = os.path.join(target_path, 'index.html')
+        if self._output_is_unchanged(filename):
+            return
+        self._start_recording_page_dependencies()
+        self._record_page_dependency('globals', 'archive:' + year_str + '-' + month_str)
 
         day_list_html = ''
         for day in sorted(days_dict.keys()):
@@ -1511,6 +2266,10 @@ class Htmlizer(object):
         except OSError:
             pass
         filename = os.path.join(target_path, 'index.html')
+        if self._output_is_unchanged(filename):
+            return
+        self._start_recording_page_dependencies()
+        self._record_page_dependency('globals', 'archive:' + year_str + '-' + month_str + '-' + day_str)
 
         htmlcontent = self.template_definition_by_name('day-header')
         htmlcontent += self._generate_article_list_html(entries)
@@ -1543,6 +2302,7 @@ class Htmlizer(object):
                                           "Error when writing file: " + str(filename))
                     raise
                     return False
+            self._store_page_dependencies(filename)
             return True
         else:
             self.logging.critical(self.current_entry_id_str() +
@@ -1674,8 +2434,7 @@ class Htmlizer(object):
         """
 
         assert(isinstance(orgmode, str))
-        self.stats_external_org_to_html5_conversion += 1
-        return pypandoc.convert_text(orgmode, 'html5', format='org')
+        return self._convert_to_html5_with_pandoc(orgmode, 'org')
 
     def convert_latex_to_html5(self, latex):
         """Converts an arbitrary LaTeX syntax element (a string) to its
@@ -1686,8 +2445,592 @@ class Htmlizer(object):
         """
 
         assert(isinstance(latex, str))
-        self.stats_external_latex_to_html5_conversion += 1
-        return pypandoc.convert_text(latex, 'html5', format='latex')
+        return self._convert_to_html5_with_pandoc(latex, 'latex')
+
+    def _convert_to_html5_with_pandoc(self, text, sourceformat):
+        """Converts a string to HTML5 using pandoc.
+
+        If config.PANDOC_CACHE_DIRECTORY is an existing directory, the
+        result is taken from or stored to a file within this
+        directory. The name of the file is derived from the pandoc
+        version, the source format, and the text.
+
+        @param text: text to convert
+        @param sourceformat: pandoc input format: 'org' or 'latex'
+        @param return: HTML5 representation of the text
+        """
+
+        if (sourceformat, text) in self._pandoc_batch_results:
+            return self._pandoc_batch_results.pop((sourceformat, text))
+
+        cachefilename = self._pandoc_cache_filename(text, sourceformat)
+        result = self._read_pandoc_cache_file(cachefilename)
+        if result is not None:
+            return result
+
+        self._count_external_conversion(sourceformat)
+        result = self._run_pandoc(text, sourceformat)
+        self._write_pandoc_cache_file(cachefilename, result)
+
+        return result
+
+    def _run_pandoc(self, text, sourceformat):
+        """Converts a string to HTML5 with a pandoc worker of run() or
+        with a pandoc process of its own if there are no workers or if
+        they failed to convert the text. The latter reports errors of
+        pandoc as usual.
+
+        @param text: text to convert
+        @param sourceformat: pandoc input format: 'org' or 'latex'
+        @param return: HTML5 representation of the text
+        """
+
+        if self._pandoc_worker_pool:
+            result = self._pandoc_worker_pool.convert(text, sourceformat)
+            if result is not None:
+                return result
+        return pypandoc.convert_text(text, 'html5', format=sourceformat)
+
+    def _count_external_conversion(self, sourceformat):
+        """Increments the statistics of pandoc invocations.
+
+        @param sourceformat: pandoc input format: 'org' or 'latex'
+        """
+
+        with self._pandoc_statistics_lock:
+            if sourceformat == 'latex':
+                self.stats_external_latex_to_html5_conversion += 1
+            else:
+                self.stats_external_org_to_html5_conversion += 1
+
+    def _read_pandoc_cache_file(self, cachefilename):
+        """Returns the content of a pandoc cache file.
+
+        @param cachefilename: file name as returned by _pandoc_cache_filename()
+        @param return: cached HTML5 or None if the cache is disabled or holds no such file
+        """
+
+        if cachefilename and os.path.isfile(cachefilename):
+            with open(cachefilename, 'r', encoding='utf-8', newline='') as cachefile:
+                with self._pandoc_statistics_lock:
+                    self.stats_pandoc_cache_hits += 1
+                return cachefile.read()
+        return None
+
+    def _write_pandoc_cache_file(self, cachefilename, result):
+        """Stores the result of a pandoc conversion in its cache file.
+
+        @param cachefilename: file name as returned by _pandoc_cache_filename() or None if the cache is disabled
+        @param result: HTML5 returned by pandoc
+        """
+
+        if not cachefilename:
+            return
+
+        with self._pandoc_statistics_lock:
+            self.stats_pandoc_cache_misses += 1
+        # write to a temporary file first so that an interrupted run
+        # does not leave a truncated cache file behind; the thread ID
+        # keeps concurrent writers of the same text apart:
+        temporaryfilename = cachefilename + '.' + str(threading.get_ident()) + '.tmp'
+        try:
+            with open(temporaryfilename, 'w', encoding='utf-8', newline='') as cachefile:
+                cachefile.write(result)
+            os.replace(temporaryfilename, cachefilename)
+        except OSError as e:
+            self.logging.warning('Could not write pandoc cache file "' + cachefilename + '": ' + str(e))
+
+    def _is_suitable_for_pandoc_batch(self, text, sourceformat):
+        """Checks if a text can be converted together with other
+        texts without influencing their results (or vice versa).
+
+        Excluded are texts with elements which are numbered or
+        referenced document-wide by pandoc (headings get unique IDs,
+        footnotes get numbers) and texts with settings or definitions
+        which affect the rest of the document.
+
+        @param text: text to convert
+        @param sourceformat: pandoc input format: 'org' or 'latex'
+        @param return: True if the text may be part of a batch
+        """
+
+        if sourceformat == 'latex':
+            return not self.PANDOC_BATCH_UNSUITABLE_LATEX_REGEX.search(text)
+        return not self.PANDOC_BATCH_UNSUITABLE_ORG_REGEX.search(text)
+
+    def _prepare_pandoc_conversions_concurrently(self, entries):
+        """Converts the pandoc snippets of many entries upfront: the
+        batch of each entry (see _prepare_pandoc_conversions()) is
+        converted by a pool of pandoc_workers threads. Each thread
+        hands its texts to one of the pandoc workers of run() (see
+        _run_pandoc()), so the conversions run in parallel.
+
+        @param entries: list of blog entries which are going to be htmlized
+        """
+
+        # the links are sanitized once more when the entries get
+        # htmlized; do not record them as dependencies of any page here:
+        current_page_dependencies = self._current_page_dependencies
+        self._current_page_dependencies = None
+        previous_entry_id = self.current_entry_id
+        batches = []
+        for entry in entries:
+            self.current_entry_id = entry['id']
+            batches.append(list(self._collect_pandoc_conversions(entry).values()))
+        self.current_entry_id = previous_entry_id
+        self._current_page_dependencies = current_page_dependencies
+
+        if getattr(config, 'PANDOC_CACHE_DIRECTORY', ''):
+            # determine the version once instead of within each thread:
+            self._pandoc_cache_filename('', 'org')
+
+        self.logging.debug('Converting pandoc snippets of ' + str(len(batches)) + ' entries with ' +
+                           str(self.pandoc_workers) + ' workers …')
+        with ThreadPoolExecutor(max_workers=self.pandoc_workers) as executor:
+            # list() re-raises exceptions of the workers:
+            list(executor.map(self._prepare_pandoc_conversions, batches))
+
+    def _collect_pandoc_conversions(self, entry):
+        """Determines the input of pandoc for all content elements of
+        an entry which are converted by pandoc: tables, latex-blocks,
+        and all elements without special treatment in
+        _htmlize_blog_content() like lists.
+
+        Tables, lists, and center or ascii blocks which are supported
+        by the native renderers (render_org_table(), render_org_list(),
+        render_org_paragraphs()) are rendered right away and get the
+        sourceformat 'html' with the result as text.
+
+        @param entry: blog entry
+        @param return: dict of content index with (sourceformat, text) tuples
+        """
+
+        conversions = {}
+        for index, element in enumerate(entry['content']):
+            if element[0] == 'mytable':
+                lines = element[2]
+            elif element[0] in self.ELEMENTS_CONVERTED_WITHOUT_PANDOC:
+                continue
+            elif isinstance(element[1], list):
+                lines = element[1]
+            elif len(element) > 2 and isinstance(element[2], list):
+                lines = element[2]
+            else:
+                continue  # reported by _htmlize_blog_content()
+
+            # sanitize internal links and keep the Org-mode link format for pandoc:
+            sanitized_lines = []
+            for line in lines:
+                sanitized_lines.append(
+                    self.sanitize_internal_links(
+                        line,
+                        keep_orgmode_format=True))
+            html = None
+            if element[0] in ['table', 'mytable']:
+                html = self.render_org_table(sanitized_lines)
+            elif element[0] == 'list':
+                html = self.render_org_list(sanitized_lines)
+            elif element[0] in ['center-block', 'ascii-block']:
+                html = self.render_org_paragraphs(sanitized_lines)
+            if html is not None:
+                conversions[index] = ('html', html)
+                continue
+            conversions[index] = ('latex' if element[0] == 'latex-block' else 'org',
+                                  '\n'.join(sanitized_lines))
+
+        return conversions
+
+    def render_org_table(self, lines):
+        """Renders an Org-mode table natively without invoking pandoc.
+
+        The result equals the one of pandoc 3 including its plain
+        table rows (without classes like "odd" or "even" of older
+        versions). Cells which pandoc would wrap are not supported.
+
+        Supported are tables with rows of equal number of cells, an
+        optional row of alignment cookies (<l>, <c>, <r>) as first
+        row, an optional header row which is separated by a
+        horizontal line, and cells with plain text, *bold*, ~code~,
+        and described links to URLs (internal links have to be
+        sanitized before with keep_orgmode_format=True).
+
+        @param lines: list of table rows as strings (with internal links sanitized)
+        @param return: HTML5 of the table or None if the table contains anything not supported
+        """
+
+        rows = []  # list of lists of cell strings; None for horizontal lines
+        for line in lines:
+            line = line.strip()
+            if not line.startswith('|'):
+                return None
+            if line.startswith('|-'):
+                rows.append(None)
+                continue
+            if not line.endswith('|') or len(line) < 2:
+                return None
+            rows.append([cell.strip(' \t') for cell in line[1:-1].split('|')])
+
+        alignments = None
+        if rows and rows[0] is not None and \
+           all(cell in self.TABLE_ALIGNMENT_COOKIES for cell in rows[0]) and any(rows[0]):
+            alignments = [self.TABLE_ALIGNMENT_COOKIES[cell] for cell in rows[0]]
+            rows = rows[1:]
+
+        if not rows or rows[0] is None:
+            return None  # leading horizontal lines: not supported
+
+        # pandoc uses the first row as header if it is followed by a horizontal line:
+        header = None
+        if len(rows) > 1 and rows[1] is None:
+            header = rows[0]
+            rows = rows[2:]
+            if not any(header):
+                return None  # pandoc omits header rows of empty cells: not supported
+        elif None in rows:
+            return None  # more than one row before the first horizontal line: not supported
+        rows = [row for row in rows if row is not None]
+
+        numberofcells = len(header) if header else len(rows[0]) if rows else 0
+        if not rows or any(len(row) != numberofcells for row in rows) or \
+           (alignments and len(alignments) != numberofcells):
+            return None
+        if any(all(cell in self.TABLE_ALIGNMENT_COOKIES for cell in row) and any(row)
+               for row in ([header] if header else []) + rows):
+            return None  # alignment cookies in other rows than the first one: not supported
+
+        htmlrows = []
+        for rowindex, row in enumerate([header] + rows if header else rows):
+            cellelement = 'th' if rowindex == 0 and header else 'td'
+            htmlcells = []
+            for cellindex, cell in enumerate(row):
+                htmlcell = self._htmlize_inline_like_pandoc(cell)
+                if htmlcell is None:
+                    return None
+                starttag = '<' + cellelement
+                if alignments and alignments[cellindex]:
+                    starttag += ' style="text-align: ' + alignments[cellindex] + ';"'
+                htmlcell = starttag + '>' + htmlcell + '</' + cellelement + '>'
+                if not self._fits_pandoc_columns(htmlcell):
+                    return None
+                htmlcells.append(htmlcell)
+            htmlrows.append('<tr>\n' + '\n'.join(htmlcells) + '\n</tr>')
+
+        result = '<table>\n'
+        if header:
+            result += '<thead>\n' + htmlrows[0] + '\n</thead>\n'
+            htmlrows = htmlrows[1:]
+        result += '<tbody>\n' + '\n'.join(htmlrows) + '\n</tbody>\n</table>\n'
+        return result
+
+    def render_org_list(self, lines):
+        """Renders an Org-mode list natively without invoking pandoc.
+
+        Supported are ordered (starting with 1) and unordered lists
+        with check boxes and nested lists whose items are separated
+        by line breaks only. The text of the items is rendered like
+        in render_org_table().
+
+        @param lines: list of lines as collected by the OrgParser (with internal links sanitized)
+        @param return: HTML5 of the list or None if the list contains anything not supported
+        """
+
+        # nested structure of the list: list of dicts with 'indentation'
+        # (number of leading spaces), 'ordered', and 'items' where each
+        # item is a dict with 'textindentation', 'checkbox', 'text', and
+        # 'sublist':
+        toplevel = None
+        stack = []  # current list and its parent lists
+        for line in lines:
+            components = OrgParser.LIST_ITEM_REGEX.match(line)
+            if not components:
+                # follow-up line of the current list item:
+                if not stack or line.strip() == '' or \
+                   self.PARAGRAPH_UNSUPPORTED_LINE_REGEX.match(line) or \
+                   OrgParser._get_list_indentation_number(line) != stack[-1]['items'][-1]['textindentation']:
+                    return None  # empty lines between items, blocks, or tables: not supported
+                stack[-1]['items'][-1]['text'] += ' ' + line.strip()
+                continue
+
+            indentation = len(components.group(1))
+            bullet = components.group(2)
+            ordered = bullet[0].isdigit()
+            if (bullet == '*' and indentation == 0) or bullet.endswith(')'):
+                return None
+
+            while stack and indentation < stack[-1]['indentation']:
+                stack.pop()
+            if stack and indentation == stack[-1]['indentation']:
+                currentlist = stack[-1]
+                if currentlist['ordered'] != ordered:
+                    return None  # pandoc starts a new list here
+            elif stack and indentation < stack[-1]['items'][-1]['textindentation']:
+                return None  # indentation between two nesting levels: not supported
+            else:
+                if ordered and bullet[:-1] != '1':
+                    return None  # ordered lists not starting with 1: not supported
+                currentlist = {'indentation': indentation, 'ordered': ordered, 'items': []}
+                if stack:
+                    if stack[-1]['items'][-1]['sublist']:
+                        return None
+                    stack[-1]['items'][-1]['sublist'] = currentlist
+                elif toplevel:
+                    return None  # second list on top level
+                else:
+                    toplevel = currentlist
+                stack.append(currentlist)
+
+            checkbox = components.group(4)
+            text = components.group(5)
+            if checkbox and checkbox.upper() not in ['[ ]', '[X]', '[-]']:
+                return None
+            if checkbox and (not text.startswith(' ') or not text.strip()):
+                return None
+            currentlist['items'].append({'textindentation': OrgParser._get_list_indentation_number(line),
+                                         'checkbox': checkbox,
+                                         'text': text.strip(),
+                                         'sublist': None})
+
+        if not toplevel:
+            return None
+        result = self._render_org_list_natively(toplevel)
+        if result is None:
+            return None
+        return result + '\n'
+
+    def _render_org_list_natively(self, orglist):
+        """Renders a (nested) list of render_org_list().
+
+        @param orglist: dict with 'ordered' and 'items' as collected by render_org_list()
+        @param return: HTML5 of the list or None if an item contains anything not supported
+        """
+
+        element = 'ol' if orglist['ordered'] else 'ul'
+        htmlitems = []
+        for item in orglist['items']:
+            if ' :: ' in item['text'] or item['text'].endswith(' ::') or item['text'] == '::':
+                return None  # description lists: not supported
+            text = self._htmlize_inline_like_pandoc(item['text'])
+            if text is None:
+                return None
+            if item['checkbox']:
+                text = '<label><input type="checkbox" ' + \
+                    ('checked="" ' if item['checkbox'].upper() == '[X]' else '') + \
+                    '/>' + text + '</label>'
+            htmlitem = '<li>' + text
+            if not self._fits_pandoc_columns(htmlitem if item['sublist'] else htmlitem + '</li>'):
+                return None
+            if item['sublist']:
+                sublist = self._render_org_list_natively(item['sublist'])
+                if sublist is None:
+                    return None
+                htmlitem += ('\n' if text else '') + sublist  # pandoc: '<li><ul>' for empty items
+            htmlitems.append(htmlitem + '</li>')
+
+        starttag = '<' + element
+        if not orglist['ordered'] and all(item['checkbox'] for item in orglist['items']):
+            starttag += ' class="task-list"'
+        return starttag + '>\n' + '\n'.join(htmlitems) + '\n</' + element + '>'
+
+    def render_org_paragraphs(self, lines):
+        """Renders the content of center and ascii blocks natively
+        without invoking pandoc: paragraphs separated by empty lines.
+        The text of the paragraphs is rendered like in
+        render_org_table().
+
+        @param lines: list of lines (with internal links sanitized)
+        @param return: HTML5 of the paragraphs or None if the lines contain anything not supported
+        """
+
+        paragraphs = [[]]
+        for line in lines:
+            if line.strip() == '':
+                paragraphs.append([])
+            elif self.PARAGRAPH_UNSUPPORTED_LINE_REGEX.match(line):
+                return None  # lists, tables, blocks, drawers, ...: not supported
+            else:
+                paragraphs[-1].append(line.strip())
+
+        result = ''
+        for paragraph in paragraphs:
+            if not paragraph:
+                continue
+            text = self._htmlize_inline_like_pandoc(' '.join(paragraph))
+            if text is None:
+                return None
+            if not self._fits_pandoc_columns('<p>' + text + '</p>'):
+                return None
+            result += '<p>' + text + '</p>\n'
+        return result or None
+
+    def _htmlize_inline_like_pandoc(self, text, within_link=False):
+        """Renders text with inline markup for the native renderers
+        like pandoc does.
+
+        @param text: text
+        @param within_link: True if the text is the description of a link (no nested links)
+        @param return: HTML5 of the cell content or None if the text contains anything not supported
+        """
+
+        result = ''
+        position = 0
+        for match in self.INLINE_MARKUP_REGEX.finditer(text):
+            plaintext = self._htmlize_plain_text_like_pandoc(text[position:match.start()])
+            if plaintext is None:
+                return None
+            result += plaintext
+            position = match.end()
+
+            if match.group(1):
+                url, description = match.group(1), match.group(2)
+                if within_link or not url.isascii() or \
+                   not (url.startswith('http://') or url.startswith('https://') or
+                        url == config.BASE_URL or url.startswith(config.BASE_URL + '/')) or \
+                   any(character in url for character in ' \t"<>'):
+                    return None
+                description = self._htmlize_inline_like_pandoc(description.strip(' \t'), within_link=True)
+                if description is None:
+                    return None
+                result += '<a href="' + url.replace('&', '&amp;') + '">' + description + '</a>'
+            elif match.group(3):
+                if '  ' in match.group(3):
+                    return None
+                result += '<code>' + self._escape_html_like_pandoc(match.group(3)) + '</code>'
+            else:
+                bold = self._htmlize_plain_text_like_pandoc(match.group(4))
+                if bold is None:
+                    return None
+                result += '<strong>' + bold + '</strong>'
+
+        plaintext = self._htmlize_plain_text_like_pandoc(text[position:])
+        if plaintext is None:
+            return None
+        return result + plaintext
+
+    def _htmlize_plain_text_like_pandoc(self, text):
+        """Renders text without markup for _htmlize_inline_like_pandoc().
+
+        @param text: text without markup
+        @param return: HTML5 of the text or None if it contains anything which might be Org-mode syntax
+        """
+
+        if self.INLINE_UNSUPPORTED_REGEX.search(text):
+            return None
+        return self._escape_html_like_pandoc(re.sub(r'[ \t]+', ' ', text))
+
+    @staticmethod
+    def _escape_html_like_pandoc(text):
+        """Escapes the characters that pandoc escapes in HTML5 text.
+
+        @param text: text
+        @param return: escaped text
+        """
+
+        return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+    def _fits_pandoc_columns(self, line):
+        """Checks whether pandoc keeps a line of HTML as it is instead
+        of breaking it at PANDOC_COLUMNS characters. Like pandoc, wide
+        East Asian characters count as two columns.
+
+        Internal links are measured with the "file:///" prefix pandoc
+        adds to them (see the workaround in _htmlize_blog_content())
+        because pandoc wraps before this prefix gets removed.
+
+        @param line: HTML without line breaks
+        @param return: True if pandoc does not wrap the line
+        """
+
+        width = len(line) + line.count('href="' + config.BASE_URL) * len('file:///')
+        if width <= self.PANDOC_COLUMNS and not line.isascii():
+            width += sum(1 for character in line if unicodedata.east_asian_width(character) in 'WF')
+        return width <= self.PANDOC_COLUMNS
+
+    def _prepare_pandoc_conversions(self, conversions):
+        """Converts all texts which are neither in the pandoc cache
+        nor converted so far with one pandoc invocation per source
+        format instead of one per text.
+
+        The texts are joined with a unique separator paragraph and
+        the HTML5 result gets split at its rendering. If the result
+        does not contain the expected number of separators, nothing
+        gets stored and the texts get converted one by one later on.
+
+        The results are kept until _convert_to_html5_with_pandoc() is
+        called for the same text and source format.
+
+        @param conversions: list of (sourceformat, text) tuples
+        """
+
+        for sourceformat in ['org', 'latex']:
+            pending = []
+            for currentformat, text in conversions:
+                if currentformat != sourceformat or text in pending or \
+                   (sourceformat, text) in self._pandoc_batch_results or \
+                   not self._is_suitable_for_pandoc_batch(text, sourceformat):
+                    continue
+                cachefilename = self._pandoc_cache_filename(text, sourceformat)
+                if cachefilename and os.path.isfile(cachefilename):
+                    continue
+                pending.append(text)
+
+            if not pending:
+                continue
+            if len(pending) == 1:
+                # no batch necessary but the conversion may run in a worker thread:
+                self._pandoc_batch_results[(sourceformat, pending[0])] = \
+                    self._convert_to_html5_with_pandoc(pending[0], sourceformat)
+                continue
+
+            separator = self.PANDOC_BATCH_SEPARATOR + md5('\0'.join(pending).encode('utf-8')).hexdigest()
+            if any(separator in text for text in pending):
+                continue
+
+            self._count_external_conversion(sourceformat)
+            batch_result = self._run_pandoc(('\n\n' + separator + '\n\n').join(pending), sourceformat)
+            results = batch_result.split('<p>' + separator + '</p>\n')
+
+            if len(results) != len(pending):
+                self.logging.debug(self.current_entry_id_str() + 'pandoc batch of ' + str(len(pending)) +
+                                   ' ' + sourceformat + ' texts could not be split. Converting them one by one.')
+                continue
+
+            for text, result in zip(pending, results):
+                self._pandoc_batch_results[(sourceformat, text)] = result
+                self._write_pandoc_cache_file(self._pandoc_cache_filename(text, sourceformat), result)
+
+    @staticmethod
+    def _get_pandoc_version():
+        """
+        Returns the version of pandoc which is determined once.
+
+        @param return: version string
+        """
+
+        if Htmlizer._pandoc_version is None:
+            Htmlizer._pandoc_version = pypandoc.get_pandoc_version()
+        return Htmlizer._pandoc_version
+
+    def _pandoc_cache_filename(self, text, sourceformat):
+        """Returns the file name within config.PANDOC_CACHE_DIRECTORY
+        which holds the HTML5 conversion of the text. Conversions of
+        the pandoc workers and of the pandoc command line get
+        different file names.
+
+        @param text: text to convert
+        @param sourceformat: pandoc input format: 'org' or 'latex'
+        @param return: file name or None if the cache is disabled
+        """
+
+        cachedirectory = getattr(config, 'PANDOC_CACHE_DIRECTORY', '')
+        if not cachedirectory or not os.path.isdir(cachedirectory):
+            return None
+
+        if self._pandoc_worker_pool and self._pandoc_worker_pool.available:
+            mode = PandocWorkerPool.CONVERSION_MODE
+        else:
+            mode = 'command-line'
+        key = md5('\0'.join([self._get_pandoc_version(), mode, sourceformat, 'html5', text]).encode('utf-8')).hexdigest()
+        return os.path.join(cachedirectory, key + '.html')
 
     def sanitize_and_htmlize_blog_content(self, entry):
         """
@@ -1696,45 +3039,169 @@ class Htmlizer(object):
 
         The teaser text of temporal articles is generated as well: entry['htmlteaser']
 
+        The parsed entry['content'] is not modified: the HTML is
+        stored in a copy of the entry which is returned.
+
         Currently things that get sanitized:
         - [[foo][bar]] -> <a href="foo">bar</a>
         - id:foo -> internal links to blog article if "foo" is found as an id
         - [[id:foo]] -> see id:foo above
 
         @param entry: blog entry data
-        @param return: entry containing partially sanitized and completely htmlized entry['content']
+        @param return: copy of the entry containing partially sanitized and completely htmlized entry['content']
         """
 
-        # debug:  [x[0] for x in entry['content']] -> which element types
+        if self.autotag_language:
+            self._populate_language_autotag(entry)
 
-        teaser_finished = False  # teaser is finished on first sub-heading or <hr>-element
+        return self._htmlize_blog_content(entry)
+
+    def _populate_autotags_and_reading_minutes(self, entry):
+        """
+        Sets the language auto-tag (if enabled) and the reading time
+        indicator of an entry. Entries with the same raw content and
+        tags as in the previous run get them from the content cache.
+
+        @param entry: blog entry data
+        """
+
+        signature = None
+        if self.previous_content_cache is not None:
+            signature = self._checksum([self.autotag_language,
+                                        entry.get('rawcontent'),
+                                        entry.get('usertags'),
+                                        entry.get('autotags')])
+            cached = self.previous_content_cache.get(entry['id'], {}).get('properties')
+            if cached and cached['signature'] == signature:
+                for key in cached['values']:
+                    entry[key] = copy.deepcopy(cached['values'][key])
+                self.content_cache.setdefault(entry['id'], {})['properties'] = cached
+                return
 
         if self.autotag_language:
+            self._populate_language_autotag(entry)
 
-            if 'autotags' not in entry:
-                entry['autotags'] = {}
+        # populate reading time indicator:
+        if 'rawcontent' in entry.keys():
+            entry['reading_minutes'] = self._derive_reading_length(entry['rawcontent'])
 
-            usertag_overriding_language_set = set(self.defined_languages).intersection(entry['usertags'])
-            language_is_within_usertags = len(usertag_overriding_language_set) == 1
+        if signature:
+            self.content_cache.setdefault(entry['id'], {})['properties'] = \
+                {'signature': signature,
+                 'values': copy.deepcopy({key: entry[key] for key in ['usertags', 'autotags', 'reading_minutes']
+                                          if key in entry})}
 
-            if language_is_within_usertags:
-                usertag_overriding_language = usertag_overriding_language_set.pop()
-                self.logging.debug('guessing the language auto-tag was overridden by a manual tag "' + str(usertag_overriding_language) + '"')
-                entry['autotags']['language'] = usertag_overriding_language  # set auto-tag
-                entry['usertags'].remove(usertag_overriding_language)  # remove manual language tag from usertags because it will be handled as auto-tag; FIXXME: as of 2019-10-17, this does not get re-propagated back to the "tags" variable
+    def _populate_language_autotag(self, entry):
+        """
+        Sets the language auto-tag of an entry: either from a manual
+        language tag (which gets removed from the usertags) or by
+        guessing the language of the raw content.
+
+        @param entry: blog entry data
+        @param return: entry with entry['autotags']['language']
+        """
+
+        if 'autotags' not in entry:
+            entry['autotags'] = {}
+
+        usertag_overriding_language_set = set(self.defined_languages).intersection(entry['usertags'])
+        language_is_within_usertags = len(usertag_overriding_language_set) == 1
+
+        if language_is_within_usertags:
+            usertag_overriding_language = usertag_overriding_language_set.pop()
+            self.logging.debug('guessing the language auto-tag was overridden by a manual tag "' + str(usertag_overriding_language) + '"')
+            entry['autotags']['language'] = usertag_overriding_language  # set auto-tag
+            entry['usertags'].remove(usertag_overriding_language)  # remove manual language tag from usertags because it will be handled as auto-tag; FIXXME: as of 2019-10-17, this does not get re-propagated back to the "tags" variable
+        else:
+            guessed_language_autotag = Utils.guess_language_from_stopword_percentages(
+                [entry['rawcontent']])
+
+            if guessed_language_autotag:
+                entry['autotags']['language'] = guessed_language_autotag
             else:
-                guessed_language_autotag = Utils.guess_language_from_stopword_percentages(
-                    [entry['rawcontent']])
+                # language could not be determined clearly and user
+                # did not override language tag:
+                self.logging.warning(self.current_entry_id_str() + "language of ID " +
+                                     str(entry['id']) +
+                                     " is not recognized clearly; using guessed_language_autotag \"unsure\"")
+                entry['autotags']['language'] = 'unsure'
 
-                if guessed_language_autotag:
-                    entry['autotags']['language'] = guessed_language_autotag
-                else:
-                    # language could not be determined clearly and user
-                    # did not override language tag:
-                    self.logging.warning(self.current_entry_id_str() + "language of ID " +
-                                         str(entry['id']) +
-                                         " is not recognized clearly; using guessed_language_autotag \"unsure\"")
-                    entry['autotags']['language'] = 'unsure'
+        return entry
+
+    def _htmlize_blog_content(self, entry):
+        """
+        Returns the htmlized copy of an entry; see
+        _render_blog_content().
+
+        If the inputs of the content did not change since the previous
+        run, the content is taken from the content cache. The
+        dependencies recorded while rendering are cached as well so
+        that the page of the entry depends on the same inputs either
+        way.
+
+        @param entry: blog entry data
+        @param return: copy of the entry containing partially sanitized and completely htmlized entry['content']
+        """
+
+        if self.previous_content_cache is None:
+            return self._render_blog_content(entry)
+
+        signature = self._generate_content_signature(entry, entry.get('autotags'))
+        cached = self.previous_content_cache.get(entry['id'], {}).get('content')
+
+        if cached and cached['signature'] == signature and self._cached_images_are_located(cached):
+            self.logging.debug(self.current_entry_id_str() + "taking the htmlized content from the content cache")
+            htmlized_entry = entry.copy()
+            htmlized_entry.pop('attachments', None)
+            for key in cached['values']:
+                htmlized_entry[key] = copy.deepcopy(cached['values'][key])
+            self.stats_content_cache_hits += 1
+        else:
+            # record the dependencies of the content on their own:
+            current_page_dependencies = self._current_page_dependencies
+            self._start_recording_page_dependencies()
+            htmlized_entry = self._render_blog_content(entry)
+            cached = {'signature': signature,
+                      'autotags': copy.deepcopy(entry.get('autotags')),
+                      'values': copy.deepcopy({key: htmlized_entry[key] for key in self.CONTENT_CACHE_KEYS
+                                               if key in htmlized_entry}),
+                      'dependencies': {kind: sorted(names) for kind, names in
+                                       self._current_page_dependencies.items()}}
+            self._current_page_dependencies = current_page_dependencies
+
+        for kind in cached['dependencies']:
+            for name in cached['dependencies'][kind]:
+                self._record_page_dependency(kind, name)
+        self.content_cache.setdefault(entry['id'], {})['content'] = cached
+
+        return htmlized_entry
+
+    def _render_blog_content(self, entry):
+        """
+        Htmlizes entry['content'] element by element and generates
+        the teaser. See sanitize_and_htmlize_blog_content() for
+        details.
+
+        The elements of the parsed entry are left untouched so that
+        the content can be htmlized again; the HTML, the teaser, and
+        the attachments are stored in a (shallow) copy of the entry.
+
+        @param entry: blog entry data
+        @param return: copy of the entry containing partially sanitized and completely htmlized entry['content']
+        """
+
+        # debug:  [x[0] for x in entry['content']] -> which element types
+
+        htmlized_entry = entry.copy()
+        htmlized_entry['content'] = htmlcontent = []  # the HTML of the elements processed so far
+        htmlized_entry.pop('attachments', None)
+
+        teaser_finished = False  # teaser is finished on first sub-heading or <hr>-element
+
+        # convert all elements which require pandoc with as few pandoc
+        # invocations as possible:
+        pandoc_conversions = self._collect_pandoc_conversions(entry)
+        self._prepare_pandoc_conversions(list(pandoc_conversions.values()))
 
         # for element in entry['content']:
         for index in range(0, len(entry['content'])):
@@ -1755,18 +3222,14 @@ class Htmlizer(object):
                 # line in order to enable sanitizing URLs and such:
                 result = ' '.join(entry['content'][index][1:])
 
-                result = self.sanitize_html_characters(result)
-                result = self.sanitize_internal_links(result)
-                result = self.sanitize_external_links(result)
-                result = self.htmlize_simple_text_formatting(result)
-                result = self.fix_ampersands_in_url(result)
+                result = self.htmlize_inline_markup(result)
                 template = self.template_definition_by_name('paragraph')
                 result = template.replace('#PAR-CONTENT#', result)
 
             elif entry['content'][index][0] == 'hr':
 
                 if not teaser_finished:
-                    entry['htmlteaser'] = entry['content'][:index]
+                    htmlized_entry['htmlteaser'] = htmlcontent[:index]
                     teaser_finished = True
 
                 result = "<div class=\"orgmode-hr\" ></div>"
@@ -1774,7 +3237,7 @@ class Htmlizer(object):
             elif entry['content'][index][0] == 'heading':
 
                 if not teaser_finished:
-                    entry['htmlteaser'] = entry['content'][:index]
+                    htmlized_entry['htmlteaser'] = htmlcontent[:index]
                     teaser_finished = True
 
                 # example:
@@ -1791,35 +3254,11 @@ class Htmlizer(object):
                                    '] has relative level ' + str(relative_level))
 
                 result = entry['content'][index][1]['title']
-                result = self.sanitize_html_characters(result)
-                result = self.sanitize_internal_links(result)
-                result = self.sanitize_external_links(result)
-                result = self.htmlize_simple_text_formatting(result)
-                result = self.fix_ampersands_in_url(result)
+                result = self.htmlize_inline_markup(result)
                 result = self.template_definition_by_name(
                     'section-begin').replace('#SECTION-TITLE#', result)
                 result = result.replace('#SECTION-LEVEL#', str(relative_level))
 
-            elif entry['content'][index][0] == 'DISABLEDlist':
-
-                # For now, let's use the fall-back of pandoc to render lists instead.
-
-                # example:
-                # FIXXME example for list
-
-                result = self.template_definition_by_name('ul-begin')
-                for listitem in entry['content'][index][1]:
-                    content = self.sanitize_html_characters(listitem)
-                    content = self.sanitize_internal_links(content)
-                    content = self.sanitize_external_links(content)
-                    content = self.htmlize_simple_text_formatting(result)
-                    content = self.fix_ampersands_in_url(content)
-                    content += self.template_definition_by_name(
-                        'ul-item').replace('#CONTENT#', content)
-                    result += content
-
-                result += self.template_definition_by_name('ul-end')
-
             elif entry['content'][index][0] == 'html-block':
 
                 # example:
@@ -1935,13 +3374,13 @@ class Htmlizer(object):
                 # FIXXME: table name is ignored so far; probably don't separate
                 # it in orgparser?
 
-                sanitized_lines = []
-                for tablerow in entry['content'][index][2]:
-                    sanitized_lines.append(
-                        self.sanitize_internal_links(
-                            tablerow,
-                            keep_orgmode_format=True))
-                result = self.convert_org_to_html5('\n'.join(sanitized_lines))
+                # internal links are sanitized in _collect_pandoc_conversions()
+                # where simple tables are rendered natively as well:
+                sourceformat, pandoc_input = pandoc_conversions[index]
+                if sourceformat == 'html':
+                    result = pandoc_input
+                else:
+                    result = self.convert_org_to_html5(pandoc_input)
 
             elif entry['content'][index][0] == 'cust_link_image':
                 # ['cust_link_image',
@@ -1955,9 +3394,8 @@ class Htmlizer(object):
 
                 # check if filename is the original one or was replaced by a similar one:
                 if filename != entry['content'][index][1]:
-                    # write back new filename if an alternative filename was derived:
+                    # use the new filename if an alternative filename was derived:
                     logging.info('filename ' + filename + ' is an alternative to ' + entry['content'][index][1])
-                    entry['content'][index][1] = filename
 
                 # issue a warning if
                 # WARN_IF_IMAGE_FILE_NOT_TAGGED_WITH is non-empty and
@@ -1975,7 +3413,7 @@ class Htmlizer(object):
                 caption = entry['content'][index][3].strip()
                 if caption:
                     caption = caption.strip()
-                attributes = entry['content'][index][4]
+                attributes = dict(entry['content'][index][4])  # gets width and height of the scaled image
 
                 # start building the result string
                 result = '\n' + '<figure'
@@ -2085,10 +3523,10 @@ class Htmlizer(object):
                 # Example:
                 # entry['attachments'] => [['cust_link_image', u'2017-03-11T18.29.20 Sterne im Baum -- mytag.jpg', {}],
                 #                          ['cust_link_image', u'2017-03-11T18.29.20 Sterne im Baum with attributes -- mytag.jpg', {u'width': u'300', u'alt': u'Stars in a Tree', u'align': u'right', u'title': u'Some Stars'}]]
-                if 'attachments' in entry:
-                    entry['attachments'].append(['cust_link_image', filename, attributes])
+                if 'attachments' in htmlized_entry:
+                    htmlized_entry['attachments'].append(['cust_link_image', filename, attributes])
                 else:
-                    entry['attachments'] = [['cust_link_image', filename, attributes]]
+                    htmlized_entry['attachments'] = [['cust_link_image', filename, attributes]]
 
             else:  # fall-back for all content elements which do not require special treatment:
 
@@ -2114,17 +3552,16 @@ class Htmlizer(object):
                     self.logging.critical(message)
                     raise HtmlizerException(self.current_entry_id, message)
 
-                # sanitize internal links and send to pypandoc:
-                sanitized_lines = []
-                for list_item in list_with_element_data:
-                    sanitized_lines.append(
-                        self.sanitize_internal_links(
-                            list_item,
-                            keep_orgmode_format=True))
-                if entry['content'][index][0] == 'latex-block':
-                    result = self.convert_latex_to_html5('\n'.join(sanitized_lines))
+                # send to pypandoc (internal links are sanitized in
+                # _collect_pandoc_conversions()):
+                sourceformat, pandoc_input = pandoc_conversions[index]
+                if sourceformat == 'html':
+                    # table, list, or block rendered natively
+                    result = pandoc_input
+                elif sourceformat == 'latex':
+                    result = self.convert_latex_to_html5(pandoc_input)
                 else:
-                    result = self.convert_org_to_html5('\n'.join(sanitized_lines))
+                    result = self.convert_org_to_html5(pandoc_input)
 
                 # pandoc is converting
                 #   [[//Karl-Voit.at/foo][bar]]
@@ -2148,19 +3585,19 @@ class Htmlizer(object):
                     self.logging.warning(self.current_entry_id_str() + 'Block of type ' +
                                          {str(entry['content'][index][0])} +
                                          ' could not converted into html5 via pypandoc (or it is empty): ' +
-                                         '\n'.join(sanitized_lines))
+                                         pandoc_input)
 
-            # replace element in entry with the result string:
-            entry['content'][index] = result
+            # the result string replaces the element in the htmlized entry:
+            htmlcontent.append(result)
 
         # in case no sub-heading or <hr>-element was found: everything is the
         # teaser:
         if not teaser_finished:
-            entry['htmlteaser-equals-content'] = True
+            htmlized_entry['htmlteaser-equals-content'] = True
         else:
-            entry['htmlteaser-equals-content'] = False
+            htmlized_entry['htmlteaser-equals-content'] = False
 
-        return entry
+        return htmlized_entry
 
     def get_scaled_filename(self, filename, width):
         """
@@ -2225,6 +3662,141 @@ class Htmlizer(object):
 
         return content
 
+    def htmlize_inline_markup(self, content):
+        """
+        Transforms the Org-mode inline markup of a paragraph or a
+        heading into HTML: escapes HTML characters and converts links,
+        bare URLs and simple text formatting.
+
+        Instead of the chain of sanitize_html_characters(),
+        sanitize_internal_links(), sanitize_external_links(),
+        htmlize_simple_text_formatting() and fix_ampersands_in_url(),
+        the text is rendered in one pass by _tokenize_inline_markup().
+        Each ID gets resolved (and a missing one reported) only once.
+
+        @param content: string
+        @param return: HTMLized string
+        """
+
+        return self._tokenize_inline_markup(content, {})
+
+    def _escape_inline_text(self, text):
+        """
+        Escapes HTML characters like sanitize_html_characters() followed
+        by fix_ampersands_in_url().
+
+        @param text: string
+        @param return: escaped string
+        """
+
+        return self.INLINE_ESCAPE_REGEX.sub(lambda match: self.INLINE_ESCAPES[match.group(0)[0]], text)
+
+    def _htmlize_inline_link(self, match, link_urls):
+        """
+        Returns the HTML of a link like [[id:foo][bar]] or [[foo]] as
+        sanitize_internal_links() and sanitize_external_links() generate
+        it.
+
+        @param match: match of the link of INLINE_TOKEN_REGEX
+        @param link_urls: dict of target IDs to the URLs resolved already; gets extended
+        @param return: HTML string
+        """
+
+        target = self._escape_inline_text(match.group('target'))
+        description = match.group('description')
+        if description is not None:
+            # a description may contain markup but no links:
+            description = self._tokenize_inline_markup(description, link_urls, nested=True, links=False)
+
+        if target == 'id:':
+            # a link without an ID stays text:
+            return self._escape_inline_text(match.group(0))
+        if target.startswith('id:') and 'ignoreme' not in target:
+            url = self._generate_absolute_url_once(target[3:], link_urls)
+            if type(url) != str:
+                return self._escape_inline_text(match.group(0))
+            url = self.fix_ampersands_in_url(url)
+            return '<a href="' + url + '">' + (target[3:] if description is None else description) + '</a>'
+
+        if description is None:
+            return '<a href="' + target + '">' + target + '</a>'
+        if target.startswith('http') and len(target) > 4 and ' ' not in target:
+            return '<a href="' + target + '">' + description + '</a>'
+        return '<a href="' + target + '][' + description + '">' + target + '][' + description + '</a>'
+
+    def _tokenize_inline_markup(self, content, link_urls, nested=False, links=True):
+        """
+        Transforms the Org-mode inline markup of a paragraph or a
+        heading into HTML in one pass over the tokens of
+        INLINE_TOKEN_REGEX.
+
+        The text of *bold* and +strike through+ markup is transformed
+        the same way so that it may contain links and other markup.
+
+        @param content: string
+        @param link_urls: dict of target IDs to the URLs resolved already; gets extended
+        @param nested: boolean: True if content is the text of a markup or a link
+        @param links: boolean: if False, links and bare URLs stay text
+        @param return: HTMLized string
+        """
+
+        htmlized = []
+        position = 0
+
+        while True:
+            match = self.INLINE_TOKEN_REGEX.search(content, position)
+            if not match:
+                break
+            start = match.start()
+            if start > position:
+                htmlized.append(content[position:start])
+            position = match.end()
+            token = match.group(0)
+            kind = match.lastgroup
+
+            if kind == 'escape':
+                htmlized.append(self.INLINE_ESCAPES[token[0]])
+
+            elif kind in ('link', 'url') and not links:
+                htmlized.append(self._escape_inline_text(token))
+
+            elif kind == 'link':
+                htmlized.append(self._htmlize_inline_link(match, link_urls))
+
+            elif kind == 'url':
+                if (start == 0 and not nested) or (htmlized and htmlized[-1][-1] in '"<>[/'):
+                    # not a link for sanitize_external_links():
+                    htmlized.append(token[0])
+                    position = start + 1
+                    continue
+                url = self._escape_inline_text(token)
+                htmlized.append('<a href="' + url + '">' + url + '</a>')
+
+            elif kind == 'markup':
+                marker = token[0]
+                begin_tag, end_tag = self.INLINE_MARKUP_TAGS[marker]
+                if marker in '*+':
+                    text = self._tokenize_inline_markup(token[1:-1], link_urls, nested=True, links=links)
+                else:
+                    text = self._escape_inline_text(token[1:-1])
+                htmlized.append(begin_tag + text + end_tag)
+
+            elif kind == 'brackets':
+                # a '[[' which is not part of a link; the second '['
+                # might start one:
+                htmlized.append('[')
+                position = start + 1
+
+            else:
+                # a markup character which is not part of a markup:
+                htmlized.append(token)
+
+        if not htmlized:
+            return content
+        if position < len(content):
+            htmlized.append(content[position:])
+        return ''.join(htmlized)
+
     def sanitize_html_characters(self, content):
         """
         Replaces all occurrences of [<>] with their HTML representation.
@@ -2281,6 +3853,20 @@ class Htmlizer(object):
             return False
         return config.BASE_URL + '/' + url_for_the_target_id
 
+    def _generate_absolute_url_once(self, targetid, link_urls):
+        """
+        Returns generate_absolute_url() of an ID unless link_urls
+        contains the URL of the ID already.
+
+        @param targetid: ID of blog_data entry
+        @param link_urls: dict of target IDs to the URLs resolved already; gets extended
+        @param return: string with URL or False like generate_absolute_url()
+        """
+
+        if targetid not in link_urls:
+            link_urls[targetid] = self.generate_absolute_url(targetid)
+        return link_urls[targetid]
+
     def sanitize_internal_links(
             self,
             content,
@@ -2295,55 +3881,34 @@ class Htmlizer(object):
 
         assert(type(content) == str)
 
-        allmatches = re.findall(self.ID_SIMPLE_LINK_REGEX, content)
-        if allmatches != []:
-            # allmatches == [(u'[[id:2014-03-02-my-persistent]]', u'2014-03-02-my-persistent')]
-            #   ... FOR ONE MATCH OR FOR MULTIPLE:
-            #               [(u'[[id:2014-03-02-my-temporal]]', u'2014-03-02-my-temporal'), \
-            #                (u'[[id:2015-03-02-my-additional-temporal]]', u'2015-03-02-my-additional-temporal')]
-            for currentmatch in allmatches:
-                # internal links that contain "ignoreme" will be
-                # ignored. This is the only way I can think of for
-                # providing the ability to add demo links to
-                # colon-blocks and so forth.
-                if 'ignoreme' in currentmatch[1]:
-                    continue
-
-                internal_link = currentmatch[0]
-                targetid = currentmatch[1]
-                url = self.generate_absolute_url(targetid)
-                if type(url) != str:
-                    return False
-                if keep_orgmode_format:
-                    content = content.replace(
-                        internal_link, "[[" + url + "][" + targetid + "]]")
-                else:
-                    content = content.replace(
-                        internal_link, "<a href=\"" + url + "\">" + targetid + "</a>")
-
-        allmatches = re.findall(self.ID_DESCRIBED_LINK_REGEX, content)
-        if allmatches != []:
-            for currentmatch in allmatches:
-                # internal links that contain "ignoreme" will be
-                # ignored. This is the only way I can think of for
-                # providing the ability to add demo links to
-                # colon-blocks and so forth.
-                if 'ignoreme' in currentmatch[1]:
-                    continue
-
-                internal_link = currentmatch[0]
-                targetid = currentmatch[1]
-                description = currentmatch[2]
-                url = self.generate_absolute_url(targetid)
-                if type(url) != str:
-                    return False
-                if keep_orgmode_format:
-                    content = content.replace(
-                        internal_link, "[[" + url + "][" + description + "]]")
-                else:
-                    content = content.replace(
-                        internal_link, "<a href=\"" + url + "\">" + description + "</a>")
+        if '[[id:' not in content:
+            return content
 
+        targetids_without_url = []
+
+        def replace_link(match, description):
+            targetid = match.group(2)
+            # internal links that contain "ignoreme" will be
+            # ignored. This is the only way I can think of for
+            # providing the ability to add demo links to
+            # colon-blocks and so forth.
+            if 'ignoreme' in targetid or targetids_without_url:
+                return match.group(1)
+            url = self.generate_absolute_url(targetid)
+            if type(url) != str:
+                targetids_without_url.append(targetid)
+                return match.group(1)
+            if keep_orgmode_format:
+                return "[[" + url + "][" + description + "]]"
+            return "<a href=\"" + url + "\">" + description + "</a>"
+
+        # e.g., [[id:2014-03-02-my-persistent]] -> the link description is the ID:
+        content = self.ID_SIMPLE_LINK_REGEX.sub(lambda match: replace_link(match, match.group(2)), content)
+        # e.g., [[id:2014-03-02-my-persistent][my description]]:
+        content = self.ID_DESCRIBED_LINK_REGEX.sub(lambda match: replace_link(match, match.group(3)), content)
+
+        if targetids_without_url:
+            return False
         return content
 
     def sanitize_external_links(self, content):
@@ -2493,6 +4058,7 @@ class Htmlizer(object):
                     content += self.template_definition_by_name('backreference-header-en')
 
             for back_reference_id in sorted(list(entry['back-references'])):
+                self._record_page_dependency('entries', back_reference_id)
 
                 # determine the blog_data entry whose id is like
                 # back_reference_id which is a list with only one
@@ -2616,42 +4182,59 @@ class Htmlizer(object):
         - and further more
 
         This method replaces all placeholders from above with their
-        corresponding content.
+        corresponding content in one pass over the content.
 
         @param content: string with placeholders instead of content data
         @param return: content with replaced placeholders
         """
 
-        content = content.replace(
-            '#COMMON-SIDEBAR#',
-            self.template_definition_by_name('common-sidebar'))
-        if self._cached_top_tag_list is None:
-            self._cached_top_tag_list = self._generate_top_tag_list()
-        content = content.replace('#TOP-TAG-LIST#', self._cached_top_tag_list)
-        content = content.replace('#DOMAIN#', config.DOMAIN)
-        content = content.replace('#BASE-URL#', config.BASE_URL)
-        content = content.replace('#CSS-URL#', config.CSS_URL)
-        content = content.replace('#AUTHOR-NAME#', config.AUTHOR_NAME)
-        content = content.replace('#BLOG-NAME#', config.BLOG_NAME)
-        content = content.replace('#BLOG-HASH-TAG#', config.BLOG_HASH_TAG)
-        content = content.replace('#BLOG-LOGO#', config.BLOG_LOGO)
-        content = content.replace('#DISQUS-NAME#', config.DISQUS_NAME)
-        content = content.replace('#ABOUT-PAGE-ID#', config.ID_OF_ABOUT_PAGE)
-        content = content.replace('#HOWTO-PAGE-ID#', config.ID_OF_HOWTO_PAGE)
-        content = content.replace('#COMMENT-EMAIL-ADDRESS#', config.COMMENT_EMAIL_ADDRESS)
-        content = content.replace('#TWITTER-HANDLE#', config.TWITTER_HANDLE)
-        content = content.replace('#TWITTER-IMAGE#', config.TWITTER_IMAGE)
-        content = content.replace('#FEEDURL_LINKS#', config.BASE_URL + '/' + config.FEEDDIR + '/' + self.__generate_feed_file_names("all")[0])
-        content = content.replace('#FEEDURL_TEASER#', config.BASE_URL + '/' + config.FEEDDIR + '/' + self.__generate_feed_file_names("all")[1])
-        content = content.replace('#FEEDURL_CONTENT#', config.BASE_URL + '/' + config.FEEDDIR + '/' + self.__generate_feed_file_names("all")[2])
-        if config.MASTODON_USER_URL:
-            mastodon_entry = self.template_definition_by_name('mastodon-footer-entry').replace(
+        return Placeholders.replace(content, self._general_blog_placeholder_steps())
+
+    def _general_blog_placeholder_steps(self):
+        """
+        Returns the placeholders of _replace_general_blog_placeholders()
+        and their values in the order of replacement. Values which
+        record page dependencies are generated when their placeholder
+        is found.
+
+        @param return: list of (placeholder, value) tuples for Placeholders.replace()
+        """
+
+        def top_tag_list():
+            self._record_page_dependency('globals', 'tags')
+            if self._cached_top_tag_list is None:
+                self._cached_top_tag_list = self._generate_top_tag_list()
+            return self._cached_top_tag_list
+
+        def mastodon_footer_entry():
+            if not config.MASTODON_USER_URL:
+                return ''
+            return self.template_definition_by_name('mastodon-footer-entry').replace(
                 '#MASTODON_USER_URL#', config.MASTODON_USER_URL)
-            content = content.replace('#MASTODON-FOOTER-ENTRY#', mastodon_entry)
-        else:
-            content = content.replace('#MASTODON-FOOTER-ENTRY#', '')
-        content = content.replace('\n     #SAME-DAY-ARTICLES-SECTION#', '')
-        return content
+
+        feed_url = config.BASE_URL + '/' + config.FEEDDIR + '/'
+        feed_file_names = self.__generate_feed_file_names("all")
+
+        return [('#COMMON-SIDEBAR#', lambda: self.template_definition_by_name('common-sidebar')),
+                ('#TOP-TAG-LIST#', top_tag_list),
+                ('#DOMAIN#', config.DOMAIN),
+                ('#BASE-URL#', config.BASE_URL),
+                ('#CSS-URL#', config.CSS_URL),
+                ('#AUTHOR-NAME#', config.AUTHOR_NAME),
+                ('#BLOG-NAME#', config.BLOG_NAME),
+                ('#BLOG-HASH-TAG#', config.BLOG_HASH_TAG),
+                ('#BLOG-LOGO#', config.BLOG_LOGO),
+                ('#DISQUS-NAME#', config.DISQUS_NAME),
+                ('#ABOUT-PAGE-ID#', config.ID_OF_ABOUT_PAGE),
+                ('#HOWTO-PAGE-ID#', config.ID_OF_HOWTO_PAGE),
+                ('#COMMENT-EMAIL-ADDRESS#', config.COMMENT_EMAIL_ADDRESS),
+                ('#TWITTER-HANDLE#', config.TWITTER_HANDLE),
+                ('#TWITTER-IMAGE#', config.TWITTER_IMAGE),
+                ('#FEEDURL_LINKS#', feed_url + feed_file_names[0]),
+                ('#FEEDURL_TEASER#', feed_url + feed_file_names[1]),
+                ('#FEEDURL_CONTENT#', feed_url + feed_file_names[2]),
+                ('#MASTODON-FOOTER-ENTRY#', mastodon_footer_entry),
+                ('\n     #SAME-DAY-ARTICLES-SECTION#', '')]
 
     def _get_entry_language_suffix(self, entry):
         """
@@ -2684,6 +4267,7 @@ class Htmlizer(object):
             self.template_definition_by_name(name)
 
         if name in self._template_cache:
+            self._record_page_dependency('templates', name)
             return self._template_cache[name]
 
         if fallback_name and fallback_name in self._template_cache:
@@ -2692,6 +4276,7 @@ class Htmlizer(object):
                 "Falling back to '" + fallback_name + "'. "
                 "To add the missing template, create a #+NAME: " + name +
                 " HTML block in the 'General elements' section of your template file.")
+            self._record_page_dependency('templates', fallback_name)
             return self._template_cache[fallback_name]
 
         message = (
@@ -2749,111 +4334,107 @@ class Htmlizer(object):
         - and further more
 
         This method replaces all placeholders from above with their
-        blog article content.
+        blog article content in one pass over the template (together
+        with the general blog placeholders).
 
         @param entry: blog entry data
         @param template: string with placeholders instead of content data
         @param return: template with replaced placeholders
         """
 
-        content = template.replace('#PUBLISHED-ON#',
-                                   self.template_definition_by_name('published-on'))
-        if config.TAG_FOR_HIDDEN in entry.get('usertags', []):
-            content = content.replace('#SHARE-ON-MASTODON-BUTTON#', '')
-        else:
-            content = content.replace('#SHARE-ON-MASTODON-BUTTON#',
-                                       self.template_definition_by_name('share-on-mastodon-button'))
-        content = content.replace('#DISQUS-SNIPPET#',
-                                   self.template_definition_by_name('disqus-snippet'))
+        return Placeholders.replace(template, self._general_article_placeholder_steps(entry))
 
-        # Replace #COMMENT-LINE# with language-specific comment line
-        if '#COMMENT-LINE#' in content:
-            if config.TAG_FOR_HIDDEN in entry.get('usertags', []):
-                # Hidden entries: use plain comment line without Mastodon
-                comment_line = self._try_template_definition_by_name(
-                    'comment-line-hidden', 'comment-line-hidden')
-            else:
-                lang_suffix = self._get_entry_language_suffix(entry)
-                comment_line_name = 'comment-line-' + lang_suffix
-                comment_line = self._try_template_definition_by_name(
-                    comment_line_name, 'comment-line-en')
-                article_hashtag = self._generate_article_hashtag(entry)
-                mastodon_comment_url = self._generate_mastodon_comment_url(entry)
-                mastodon_svg = self.template_definition_by_name('mastodon-logo-svg')
-                comment_line = comment_line.replace('#COMMENT-MASTODON-URL#', mastodon_comment_url)
-                comment_line = comment_line.replace('#MASTODON-LOGO-SVG#', mastodon_svg)
-                comment_line = comment_line.replace('#ARTICLE-HASH-TAG#', article_hashtag)
-            content = content.replace('#COMMENT-LINE#', comment_line)
-
-        # Replace #ARTICLE-HASH-TAG# anywhere else it might appear
-        if '#ARTICLE-HASH-TAG#' in content:
-            content = content.replace('#ARTICLE-HASH-TAG#', self._generate_article_hashtag(entry))
-        if entry['category'] == config.TEMPORAL:
-            same_day_section = self._generate_same_day_articles_section(entry)
-            sidebar = self.template_definition_by_name('common-sidebar').replace(
-                '\n     #SAME-DAY-ARTICLES-SECTION#', same_day_section)
-            content = content.replace('#COMMON-SIDEBAR#', sidebar)
-        content = self._replace_general_blog_placeholders(content)
-
-        content = content.replace(
-            '#ARTICLE-TITLE#',
-            self.sanitize_external_links(
-                self.sanitize_html_characters(
-                    entry['title'])))
+    def _general_article_placeholder_steps(self, entry):
+        """
+        Returns the placeholders of _replace_general_article_placeholders()
+        and their values in the order of replacement. Values which
+        are expensive or record page dependencies are generated when
+        their placeholder is found.
 
-        year, month, day, hours, minutes = Utils.get_YY_MM_DD_HH_MM_from_datetime(entry['firstpublishTS'])
-        iso_timestamp = '-'.join([year, month, day]) + \
-            'T' + hours + ':' + minutes
+        @param entry: blog entry data
+        @param return: list of (placeholder, value) tuples for Placeholders.replace()
+        """
 
-        content = content.replace('#ARTICLE-ID#', entry['id'])
-        article_path = str(self._target_path_for_id_without_targetdir(entry['id']))
-        content = content.replace('#ARTICLE-URL#', article_path)
-        content = content.replace('#ARTICLE-TITLE-URL-ENCODED#', urllib.parse.quote(entry['title'], safe=''))
-        content = content.replace('#ARTICLE-FULL-URL-ENCODED#', urllib.parse.quote('https:' + config.BASE_URL + '/' + article_path, safe=''))
-        content = content.replace('#ARTICLE-YEAR#', year)
-        content = content.replace('#ARTICLE-MONTH#', month)
-        content = content.replace('#ARTICLE-DAY#', day)
-        content = content.replace(
-            '#ARTICLE-PUBLISHED-HTML-DATETIME#',
-            iso_timestamp + config.TIME_ZONE_ADDON)
-        content = content.replace(
-            '#ARTICLE-PUBLISHED-HUMAN-READABLE#',
-            iso_timestamp)
+        hidden = config.TAG_FOR_HIDDEN in entry.get('usertags', [])
 
-        if entry['category'] == config.TAGS:
-            # replace #TAG-PAGE-LIST#
-            content = content.replace(
-                '#TAG-PAGE-LIST#',
-                self._generate_tag_page_list(
-                    entry['title']))
-
-            # replace #TAG-FEED-URL# and #TAG-FEED-INFO#
-            tag_feed_url = self._get_tag_feed_url([entry['title']])
-            content = content.replace('#TAG-FEED-URL#', tag_feed_url)
+        def comment_line():
+            # language-specific comment line
+            if hidden:
+                # Hidden entries: use plain comment line without Mastodon
+                return self._try_template_definition_by_name('comment-line-hidden', 'comment-line-hidden')
+            lang_suffix = self._get_entry_language_suffix(entry)
+            comment_line_name = 'comment-line-' + lang_suffix
+            comment_line = self._try_template_definition_by_name(
+                comment_line_name, 'comment-line-en')
+            article_hashtag = self._generate_article_hashtag(entry)
+            mastodon_comment_url = self._generate_mastodon_comment_url(entry)
+            mastodon_svg = self.template_definition_by_name('mastodon-logo-svg')
+            comment_line = comment_line.replace('#COMMENT-MASTODON-URL#', mastodon_comment_url)
+            comment_line = comment_line.replace('#MASTODON-LOGO-SVG#', mastodon_svg)
+            return comment_line.replace('#ARTICLE-HASH-TAG#', article_hashtag)
+
+        def common_sidebar_with_same_day_articles():
+            return self.template_definition_by_name('common-sidebar').replace(
+                '\n     #SAME-DAY-ARTICLES-SECTION#', self._generate_same_day_articles_section(entry))
+
+        def article_path():
+            return str(self._target_path_for_id_without_targetdir(entry['id']))
+
+        def tag_feed_info():
             tag_feed_info = self.template_definition_by_name('tag-feed-info')
-            tag_feed_info = tag_feed_info.replace('#TAG-FEED-URL#', tag_feed_url)
+            tag_feed_info = tag_feed_info.replace('#TAG-FEED-URL#', self._get_tag_feed_url([entry['title']]))
             tag_feed_info = tag_feed_info.replace('#ARTICLE-TITLE#',
                 self.sanitize_html_characters(entry['title']))
-            tag_feed_info = self._replace_general_blog_placeholders(tag_feed_info)
-            content = content.replace('#TAG-FEED-INFO#\n', tag_feed_info)
+            return self._replace_general_blog_placeholders(tag_feed_info)
 
-            # replace #TAG-PAGE-TAGTREE#
+        def tag_page_tagtree():
             co_tags = self._get_co_occurring_tags([entry['title']])
-            if co_tags:
-                tagtree_cloud = '  <p>\n' + \
-                    '  Articles with the tag ' + self.sanitize_html_characters(entry['title']) + \
-                    ' also have other tags you might use to drill down your navigation:\n' + \
-                    '  </p>\n\n  <ul class="common-tags">\n' + \
-                    self._generate_tagtree_tag_cloud([entry['title']], co_tags) + \
-                    '  </ul>\n\n'
-            else:
-                tagtree_cloud = ''
-            content = content.replace('#TAG-PAGE-TAGTREE#\n', tagtree_cloud)
+            if not co_tags:
+                return ''
+            return '  <p>\n' + \
+                '  Articles with the tag ' + self.sanitize_html_characters(entry['title']) + \
+                ' also have other tags you might use to drill down your navigation:\n' + \
+                '  </p>\n\n  <ul class="common-tags">\n' + \
+                self._generate_tagtree_tag_cloud([entry['title']], co_tags) + \
+                '  </ul>\n\n'
+
+        year, month, day, hours, minutes = Utils.get_YY_MM_DD_HH_MM_from_datetime(entry['firstpublishTS'])
+        iso_timestamp = '-'.join([year, month, day]) + \
+            'T' + hours + ':' + minutes
+
+        steps = [('#PUBLISHED-ON#', lambda: self.template_definition_by_name('published-on')),
+                 ('#SHARE-ON-MASTODON-BUTTON#',
+                  '' if hidden else lambda: self.template_definition_by_name('share-on-mastodon-button')),
+                 ('#DISQUS-SNIPPET#', lambda: self.template_definition_by_name('disqus-snippet')),
+                 ('#COMMENT-LINE#', comment_line),
+                 # #ARTICLE-HASH-TAG# anywhere else it might appear:
+                 ('#ARTICLE-HASH-TAG#', lambda: self._generate_article_hashtag(entry))]
+        if entry['category'] == config.TEMPORAL:
+            steps.append(('#COMMON-SIDEBAR#', common_sidebar_with_same_day_articles))
+        steps += self._general_blog_placeholder_steps()
+        steps += [('#ARTICLE-TITLE#',
+                   lambda: self.sanitize_external_links(self.sanitize_html_characters(entry['title']))),
+                  ('#ARTICLE-ID#', entry['id']),
+                  ('#ARTICLE-URL#', article_path),
+                  ('#ARTICLE-TITLE-URL-ENCODED#', lambda: urllib.parse.quote(entry['title'], safe='')),
+                  ('#ARTICLE-FULL-URL-ENCODED#',
+                   lambda: urllib.parse.quote('https:' + config.BASE_URL + '/' + article_path(), safe='')),
+                  ('#ARTICLE-YEAR#', year),
+                  ('#ARTICLE-MONTH#', month),
+                  ('#ARTICLE-DAY#', day),
+                  ('#ARTICLE-PUBLISHED-HTML-DATETIME#', iso_timestamp + config.TIME_ZONE_ADDON),
+                  ('#ARTICLE-PUBLISHED-HUMAN-READABLE#', iso_timestamp)]
+
+        if entry['category'] == config.TAGS:
+            steps += [('#TAG-PAGE-LIST#', lambda: self._generate_tag_page_list(entry['title'])),
+                      ('#TAG-FEED-URL#', lambda: self._get_tag_feed_url([entry['title']])),
+                      ('#TAG-FEED-INFO#\n', tag_feed_info),
+                      ('#TAG-PAGE-TAGTREE#\n', tag_page_tagtree)]
 
         if 'reading_minutes' in entry.keys():
-            content = content.replace('#READINGMINUTES#', str(entry['reading_minutes']))
+            steps.append(('#READINGMINUTES#', str(entry['reading_minutes'])))
 
-        return content
+        return steps
 
     def _generate_top_tag_list(self):
         """
@@ -2903,6 +4484,7 @@ class Htmlizer(object):
         if pub_ts is None:
             return ''
 
+        self._record_page_dependency('globals', 'same-day:' + str(pub_ts.month).zfill(2) + '-' + str(pub_ts.day).zfill(2))
         same_day = []
         for other in self.blog_data:
             if other['category'] != config.TEMPORAL:
@@ -2913,6 +4495,7 @@ class Htmlizer(object):
                 continue
             other_ts = other.get('firstpublishTS')
             if other_ts and other_ts.month == pub_ts.month and other_ts.day == pub_ts.day:
+                self._record_page_dependency('entries', other['id'])
                 same_day.append(other)
 
         if not same_day:
@@ -2943,6 +4526,7 @@ class Htmlizer(object):
         """
 
         content = '\n<ul class=\'tag-pages-link-list\'>\n'
+        self._record_page_dependency('globals', 'tag:' + tag)
 
         if not self.dict_of_tags_with_ids or tag not in self.dict_of_tags_with_ids:
             return '\nNo blog entries with this tag so far.\n'
@@ -2993,9 +4577,12 @@ class Htmlizer(object):
                            config.TAG_FOR_TEMPLATES_ENTRY,
                            config.TAG_FOR_HIDDEN])
 
+        self._record_page_dependency('globals', 'tags')
+
         # Find all non-hidden article IDs that have ALL tags in tag_path
         matching_ids = None
         for tag in tag_path:
+            self._record_page_dependency('globals', 'tag:' + tag)
             if tag not in self.dict_of_tags_with_ids:
                 return []
             tag_ids = set(self.dict_of_tags_with_ids[tag])
@@ -3012,6 +4599,7 @@ class Htmlizer(object):
         tag_path_set = set(tag_path)
         for entry in self.blog_data:
             if entry['id'] in matching_ids and config.TAG_FOR_HIDDEN not in entry['usertags']:
+                self._record_page_dependency('entries', entry['id'])
                 for usertag in entry['usertags']:
                     if usertag not in tag_path_set and usertag not in system_tags:
                         co_occurring_tags.add(usertag)
@@ -3057,6 +4645,7 @@ class Htmlizer(object):
         # Find all article IDs that have ALL tags in tag_path
         matching_ids = None
         for tag in tag_path:
+            self._record_page_dependency('globals', 'tag:' + tag)
             if tag not in self.dict_of_tags_with_ids:
                 return '\nNo blog entries with these tags so far.\n'
             tag_ids = set(self.dict_of_tags_with_ids[tag])
@@ -3140,8 +4729,8 @@ class Htmlizer(object):
             new_path = tag_path + [subtag]
 
             # Generate this tagtree page
-            self._write_tagtree_page(new_path)
-            count += 1
+            if self._write_tagtree_page(new_path):
+                count += 1
 
             # Recurse deeper
             count += self._generate_tagtree_pages_recursive(new_path, depth + 1)
@@ -3153,8 +4742,16 @@ class Htmlizer(object):
         Generates and writes a single tagtree page for the given tag path.
 
         @param tag_path: list of tag strings (e.g., ['foo', 'bar'])
+        @param return: False if the page of the previous run is still valid
         """
 
+        tag_dir = os.path.join(self.targetdir, 'tags', *tag_path)
+        filename = os.path.join(tag_dir, 'index.html')
+        if self._output_is_unchanged(filename):
+            return False
+
+        self._start_recording_page_dependencies()
+
         # Build breadcrumb HTML (matching the logo+raquo style of other pages)
         breadcrumb_parts = ['<a href="' + config.BASE_URL + '/tags/">Tags</a>']
         for i, tag in enumerate(tag_path):
@@ -3215,12 +4812,11 @@ class Htmlizer(object):
         htmlcontent = self.sanitize_internal_links(htmlcontent)
 
         # Write to file
-        tag_dir = os.path.join(self.targetdir, 'tags', *tag_path)
         if not os.path.isdir(tag_dir):
             os.makedirs(tag_dir)
-        filename = os.path.join(tag_dir, 'index.html')
 
         self.write_content_to_file(filename, htmlcontent)
+        return True
 
     def _get_entry_folder_name_from_entryid(self, entryid):
         """
@@ -3305,6 +4901,9 @@ class Htmlizer(object):
         TAGS: "tags/TITLE" if title consists of a single word.
         TEMPORAL: "2013/02/12/ID" from the oldest finished time-stamp.
 
+        The paths of existing entries are computed once and looked up
+        in self._target_paths afterwards.
+
         @param entryid: ID of a blog entry
         @param return: the resulting path as os.path string
         """
@@ -3313,7 +4912,26 @@ class Htmlizer(object):
             # if it is a pseudo entry for an empty tag page, extract the tag name from entryid
             return os.path.join("tags", entryid[len(self.ID_PREFIX_FOR_EMPTY_TAG_PAGES):])
 
+        if entryid in self._target_paths:
+            self._record_page_dependency('entries', entryid)
+            return self._target_paths[entryid]
+
         entry = self.blog_data_with_id(entryid)
+        if entryid in self.blog_data_by_id:
+            # missing IDs are not stored: see blog_data_with_id()
+            self._target_paths[entryid] = self._compute_target_path(entryid, entry)
+            return self._target_paths[entryid]
+        return self._compute_target_path(entryid, entry)
+
+    def _compute_target_path(self, entryid, entry):
+        """
+        Computes the path of _target_path_for_id_without_targetdir().
+
+        @param entryid: ID of a blog entry
+        @param entry: blog entry data of the ID (or its replacement if the ID is missing)
+        @param return: the resulting path as os.path string
+        """
+
         folder = self._get_entry_folder_name_from_entryid(entryid)
 
         if entry['category'] == config.TAGS:
@@ -3385,6 +5003,7 @@ class Htmlizer(object):
                 self._template_cache[x[1]] = '\n'.join(x[2:][0])
 
         if name in self._template_cache:
+            self._record_page_dependency('templates', name)
             return self._template_cache[name]
         else:
             message = "template_definition_by_name(\"" + str(name) + \
@@ -3400,6 +5019,8 @@ class Htmlizer(object):
         @param return: blog_data element
         """
 
+        self._record_page_dependency('entries', entryid)
+
         if entryid in self.blog_data_by_id:
             return self.blog_data_by_id[entryid]
         else:
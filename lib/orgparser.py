@@ -4,7 +4,8 @@
 import config
 import re
 from os import path
-import codecs  # open, close with Unicode
+import mmap  # for pre-scanning files without reading them into memory
+from bisect import bisect_left  # for finding the next candidate of a blog heading
 import logging
 import datetime
 from orgformat import *
@@ -145,11 +146,26 @@ class OrgParser(object):
     __entry_data = {}  # dict of currently parsed blog entry data: gets "filled"
     # while parsing the entry
 
-    def __init__(self, filename):
+    __skipped_lines = 0  # number of lines skipped by the pre-scan
+    __parsed_lines = 0  # number of lines parsed by iterate_blog_entries()
+
+    __start = 0  # byte offset of the first line to parse
+    __end = None  # byte offset after the last line to parse; None: end of file
+    __ends_at_clean_cut = True  # see ends_at_clean_cut()
+
+    # size of the chunks for counting the lines of skipped regions:
+    LINE_COUNTING_CHUNK_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, filename, start=0, end=None):
         """
         This function handles the communication with the parser object and returns the blog data.
 
+        A shard of a large file is parsed by handing over the byte
+        offsets of its top-level headings from find_shard_offsets().
+
         @param filename: string containing one file name
+        @param start: byte offset of the first line to parse
+        @param end: byte offset of the line following the last line to parse; None for end of file
         """
 
         assert filename.__class__ == str
@@ -157,6 +173,11 @@ class OrgParser(object):
         self.__filename = filename
         self.__blog_data = []
         self.__entry_data = {}
+        self.__skipped_lines = 0
+        self.__parsed_lines = 0
+        self.__start = start
+        self.__end = end
+        self.__ends_at_clean_cut = True
 
         # create logger (see
         # http://docs.python.org/2/howto/logging-cookbook.html)
@@ -371,7 +392,8 @@ class OrgParser(object):
         else:
             return self.SEARCHING_BLOG_HEADER
 
-    def _get_list_indentation_number(self, list_item):
+    @classmethod
+    def _get_list_indentation_number(cls, list_item):
         """
         Returns the number of characters of the indentation of a list item.
 
@@ -381,7 +403,7 @@ class OrgParser(object):
 
         assert(type(list_item) == str)
 
-        list_item_components = self.LIST_ITEM_REGEX.match(list_item)
+        list_item_components = cls.LIST_ITEM_REGEX.match(list_item)
         if list_item_components:
             # return length of leading spaces, length of bullet length, plus 1
             # for space at end:
@@ -392,6 +414,209 @@ class OrgParser(object):
             # return number of leading spaces:
             return len(list_item) - len(list_item.lstrip(' '))
 
+    @staticmethod
+    def _find_blog_heading_candidates(content, start=0, end=None):
+        """
+        Pre-scans the content of an Org-mode file for lines which
+        might be headings of blog entries: lines containing an
+        asterisk, BLOG_FINISHED_STATE, and the tag TAG_FOR_BLOG_ENTRY.
+        Only BLOG_FINISHED_STATE is searched in the whole content;
+        only the few lines containing it get decoded.
+
+        @param content: bytes-like object (e.g., an mmap) with the UTF-8 encoded file content
+        @param start: byte offset of the beginning of a line where the scan starts
+        @param end: byte offset of the beginning of a line where the scan stops; None for end of content
+        @param return: sorted list of byte offsets of the beginnings of the candidate lines
+        """
+
+        state = config.BLOG_FINISHED_STATE.encode('utf-8')
+        tag = ':' + config.TAG_FOR_BLOG_ENTRY + ':'
+        end = len(content) if end is None else end
+        candidates = []
+        position = content.find(state, start, end)
+        while position != -1:
+            linestart = content.rfind(b'\n', 0, position) + 1
+            lineend = content.find(b'\n', position)
+            if lineend == -1:
+                lineend = len(content)
+            line = content[linestart:lineend].decode('utf-8', errors='replace')
+            if '*' in line and tag in line.lower():
+                candidates.append(linestart)
+            position = content.find(state, lineend, end)
+        return candidates
+
+    @staticmethod
+    def find_shard_offsets(filename, shards):
+        """
+        Splits an Org-mode file into about equally sized shards which
+        can be parsed independently of each other. Blog entries can
+        not span a top-level heading, so the shards are cut at the
+        beginnings of lines starting with "* ". Fewer shards are
+        returned if the file has not got enough top-level headings.
+
+        Whether or not a shard got cut at a position where the
+        parser of the whole file would have been in the same state
+        as a new parser is told by ends_at_clean_cut().
+
+        @param filename: string containing one file name
+        @param shards: integer with the number of shards wanted
+        @param return: list of (start, end) tuples of byte offsets; end of the last shard is None
+        """
+
+        offsets = [0]
+        with open(filename, 'rb') as orgfile:
+            size = path.getsize(filename)
+            if size > 0 and shards > 1:
+                with mmap.mmap(orgfile.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    for shard in range(1, shards):
+                        position = content.find(b'\n* ', max(offsets[-1], size * shard // shards - 1))
+                        if position == -1:
+                            break
+                        offsets.append(position + 1)
+        return list(zip(offsets, offsets[1:] + [None]))
+
+    @staticmethod
+    def find_segment_offsets(filename, start=0, end=None):
+        """
+        Splits an Org-mode file (or a shard of it) into segments which
+        start with a line that might be the heading of a blog entry
+        (see _find_blog_heading_candidates()). The first segment
+        starts at the beginning of the range in any case.
+
+        @param filename: string containing one file name
+        @param start: byte offset of the beginning of the range
+        @param end: byte offset of the end of the range; None for end of file
+        @param return: list of (start, end) tuples of byte offsets; end of the last segment is end
+        """
+
+        offsets = [start]
+        if path.getsize(filename) > 0:
+            with open(filename, 'rb') as orgfile:
+                with mmap.mmap(orgfile.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    offsets += [candidate for candidate in
+                                OrgParser._find_blog_heading_candidates(content, start, end)
+                                if candidate > start]
+        return list(zip(offsets, offsets[1:] + [end]))
+
+    def ends_at_clean_cut(self):
+        """
+        Returns False if the parsed range ended at a position where the
+        parser of the whole file would not have been in the same state
+        as a new parser starting with the following range: within a
+        block, a list, a blog header without drawers, after a #+NAME:,
+        #+CAPTION:, or #+ATTR_HTML: line, before a sub-heading of the
+        current blog entry, or before a heading with NOEXPORT tag
+        which would skip parts of the following range. In this case,
+        both ranges have to be parsed together.
+
+        Always True when the file was parsed up to its end.
+
+        @param return: boolean value
+        """
+
+        return self.__ends_at_clean_cut
+
+    def __is_clean_cut(self, state, noexport_level):
+        """
+        Checks whether the parser of the whole file would handle the
+        line at the end of the parsed range like a new parser: either
+        it is searching for blog headings or the line is a heading
+        which ends the current blog entry.
+
+        @param state: state of the parser after the last line of the range
+        @param noexport_level: level of the heading skipped in state SKIPPING_NOEXPORT_HEADING
+        @param return: boolean value
+        """
+
+        if state == self.SEARCHING_BLOG_HEADER:
+            return True
+        if state not in [self.ENTRY_CONTENT, self.SKIPPING_NOEXPORT_HEADING]:
+            return False
+        next_heading = self.HEADING_REGEX.match(self.__read_line_at(self.__end))
+        if not next_heading:
+            return False
+        level = len(next_heading.group(self.HEADING_STARS_IDX))
+        if state == self.SKIPPING_NOEXPORT_HEADING and level > noexport_level:
+            return False
+        return "NOEXPORT" not in (next_heading.group(self.HEADING_TAGS_IDX) or '').upper() and \
+            level <= self.__entry_data['level']
+
+    def __read_line_at(self, offset):
+        """
+        Returns the line of the file starting at a byte offset.
+
+        @param offset: byte offset of the beginning of a line
+        @param return: string containing the line without trailing whitespace
+        """
+
+        with open(self.__filename, 'rb') as orgfile:
+            orgfile.seek(offset)
+            return orgfile.readline().decode('utf-8').rstrip()
+
+    def __count_lines(self, content, start, end):
+        """
+        Returns the number of lines within a region of the file content.
+
+        @param content: bytes-like object with the file content
+        @param start: byte offset of the beginning of a line
+        @param end: byte offset of the beginning of a line or the end of the content
+        @param return: integer with the number of lines
+        """
+
+        lines = 0
+        for chunkstart in range(start, end, self.LINE_COUNTING_CHUNK_SIZE):
+            lines += content[chunkstart:min(end, chunkstart + self.LINE_COUNTING_CHUNK_SIZE)].count(b'\n')
+        if end == len(content) and end > start and content[end - 1:end] != b'\n':
+            lines += 1  # last line without line break
+        return lines
+
+    def __read_lines(self, is_searching_blog_header):
+        """
+        Yields the lines of the file. Whenever the parser is searching
+        for the next blog heading, all lines up to the next candidate
+        of _find_blog_heading_candidates() get skipped since the
+        parser would ignore them anyway. The number of skipped lines
+        is added to self.__skipped_lines.
+
+        @param is_searching_blog_header: function returning True if the parser is in state SEARCHING_BLOG_HEADER
+        @param return: generator of lines (with line breaks like codecs.open() returns them)
+        """
+
+        with open(self.__filename, 'rb') as orgfile:
+            if path.getsize(self.__filename) == 0:
+                return
+            with mmap.mmap(orgfile.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                size = len(content) if self.__end is None else self.__end
+                candidates = self._find_blog_heading_candidates(content, self.__start, size)
+                position = self.__start
+                while position < size:
+                    if is_searching_blog_header():
+                        nextcandidate = bisect_left(candidates, position)
+                        target = candidates[nextcandidate] if nextcandidate < len(candidates) else size
+                        self.__skipped_lines += self.__count_lines(content, position, target)
+                        position = target
+                        if position == size:
+                            break
+                    lineend = content.find(b'\n', position)
+                    lineend = size if lineend == -1 else lineend + 1
+                    # splitlines() splits like codecs.open() does:
+                    for line in content[position:lineend].decode('utf-8').splitlines(keepends=True):
+                        yield line
+                    position = lineend
+
+    @staticmethod
+    def __might_be_list_item(first_character):
+        """
+        Returns False if a line starting with the given character
+        can not be matched by LIST_ITEM_REGEX.
+
+        @param first_character: first character of a line or empty string
+        @param return: True if LIST_ITEM_REGEX has to be checked
+        """
+
+        return first_character.isspace() or first_character.isdigit() or \
+            (first_character != '' and first_character in '+*-\\')
+
     def parse_orgmode_file(self):
         """
         Parses the Org-mode file.
@@ -400,6 +625,29 @@ class OrgParser(object):
         @param return: integer with number of lines parsed
         """
 
+        blog_data = list(self.iterate_blog_entries())
+        return blog_data, self.__parsed_lines
+
+    def number_of_parsed_lines(self):
+        """
+        Returns the number of lines parsed by iterate_blog_entries().
+        It is set when the generator is exhausted.
+
+        @param return: integer with number of lines parsed
+        """
+
+        return self.__parsed_lines
+
+    def iterate_blog_entries(self):
+        """
+        Parses the Org-mode file and yields each blog entry as soon as
+        it is complete. Contrary to parse_orgmode_file(), the parser
+        does not keep the entries: the caller is able to process them
+        while the rest of the file is parsed.
+
+        @param return: generator of blog entries (dicts as in the result of parse_orgmode_file())
+        """
+
         self.logging.debug(
             "OrgParser: doing file \"%s\" ..." %
             self.__filename)
@@ -441,22 +689,30 @@ class OrgParser(object):
         noexport_level = False
 
         # collect the lines of the raw Org-mode entry (without
-        # noexport-headings):
-        rawcontent = ""
+        # noexport-headings); joined at the end of the entry:
+        rawcontent = []
         ignore_line_for_rawcontent = True
         line = ''
 
-        for rawline in codecs.open(self.__filename, 'r', encoding='utf-8'):
+        # tracing every line is expensive: only if it gets logged at all
+        trace_lines = self.logging.isEnabledFor(logging.DEBUG)
+
+        for rawline in self.__read_lines(lambda: state == self.SEARCHING_BLOG_HEADER):
+
+            if self.__blog_data:
+                # hand over the entry accepted by __handle_blog_end():
+                yield from self.__blog_data
+                self.__blog_data = []
 
             if not ignore_line_for_rawcontent:
                 # first blog header is lost if file starts directly with it: is
                 # fixed below
-                rawcontent += line + '\n'
+                rawcontent.append(line + '\n')
             ignore_line_for_rawcontent = False
 
             line = rawline.rstrip()  # remove trailing whitespace
 
-            if not state == self.SEARCHING_BLOG_HEADER:  ## limit the output to interesting lines
+            if trace_lines and not state == self.SEARCHING_BLOG_HEADER:  ## limit the output to interesting lines
                 self.logging.debug(
                     "OrgParser: ------------------------------- %s" %
                     state)
@@ -465,14 +721,16 @@ class OrgParser(object):
                     (state, line))
             stats_parsed_org_lines += 1  # increment statistical counter variable
 
-            list_item_components = self.LIST_ITEM_REGEX.match(line)
+            # most regular expressions can only match lines starting
+            # with a specific character: match them only if needed
+            first_character = line[:1]
 
             if state == self.SKIPPING_NOEXPORT_HEADING:
 
                 # ignore until end of blog entry  OR
                 # ignore until next heading on same level  OR
                 # ignore until next heading on higher level
-                components = self.HEADING_REGEX.match(line)
+                components = self.HEADING_REGEX.match(line) if first_character == '*' else None
 
                 # next heading: if level same or higher: set status to
                 # self.ENTRY_CONTENT
@@ -496,7 +754,7 @@ class OrgParser(object):
 
                 # search for header line of a blog entry -> BLOG_HEADER
 
-                components = self.HEADING_REGEX.match(line)
+                components = self.HEADING_REGEX.match(line) if first_character == '*' else None
 
                 # NOTE: this following section is a pre-filter that
                 # is looking for blog-like headings. All other
@@ -519,7 +777,7 @@ class OrgParser(object):
                             # rawcontent:
                             # fixes: first blog header is lost if file starts
                             # directly with it
-                            rawcontent += line + '\n'
+                            rawcontent.append(line + '\n')
                         continue
                     else:
                         self.__entry_data = {}  # empty current entry data
@@ -574,22 +832,24 @@ class OrgParser(object):
                 # default/main state: parse entry content and look out for
                 # content that has got its own state
 
-                if 'content' not in list(self.__entry_data.keys()):
+                if 'content' not in self.__entry_data:
                     # append empty content list to __entry_data
                     self.__entry_data['content'] = []
 
-                heading_components = self.HEADING_REGEX.match(line)
-                hr_components = self.HR_REGEX.match(line)
-                cust_link_image_components = self.CUST_LINK_IMAGE_REGEX.match(line)
-                drawer_matches = self.DRAWER_REGEX.match(line)
+                heading_components = self.HEADING_REGEX.match(line) if first_character == '*' else None
+                hr_components = self.HR_REGEX.match(line) if first_character == '-' else None
+                cust_link_image_components = self.CUST_LINK_IMAGE_REGEX.match(line) if first_character == '[' else None
+                drawer_matches = self.DRAWER_REGEX.match(line) if first_character == ':' else None
+                list_item_components = self.LIST_ITEM_REGEX.match(line) \
+                    if self.__might_be_list_item(first_character) else None
 
-                if line.upper() == ':PROPERTIES:':
+                if first_character == ':' and line.upper() == ':PROPERTIES:':
                     self.logging.debug("OrgParser: found PROPERTIES drawer")
                     state = self.DRAWER_PROP
                     previous_line = line
                     continue
 
-                elif line.upper() == ':LOGBOOK:':
+                elif first_character == ':' and line.upper() == ':LOGBOOK:':
                     self.logging.debug("OrgParser: found LOGBOOK drawer")
                     state = self.DRAWER_LOGBOOK
                     previous_line = line
@@ -619,7 +879,7 @@ class OrgParser(object):
                     previous_line = line
                     continue
 
-                elif line.upper().startswith('#+NAME: '):
+                elif first_character == '#' and line.upper().startswith('#+NAME: '):
                     previous_name = line[8:].strip()
                     self.logging.debug(
                         "OrgParser: found #+NAME: [%s]" %
@@ -627,7 +887,7 @@ class OrgParser(object):
                     previous_line = line
                     continue
 
-                elif line.upper().startswith('#+BEGIN_'):
+                elif first_character == '#' and line.upper().startswith('#+BEGIN_'):
 
                     block_components = self.BLOCK_REGEX.match(line)
                     if not block_components:
@@ -723,10 +983,10 @@ class OrgParser(object):
                             ['table', previous_name, [line]])
                     previous_line = line
 
-                elif line.upper().startswith('#+CAPTION: '):
+                elif first_character == '#' and line.upper().startswith('#+CAPTION: '):
                     previous_caption = line[11:].strip()
 
-                elif line.upper().startswith('#+ATTR_HTML: '):
+                elif first_character == '#' and line.upper().startswith('#+ATTR_HTML: '):
                     matches = re.findall(self.ATTR_HTML_REGEX, line)
                     if matches:
                         # lower-case the keys and remove trailing spaces from the parameters
@@ -775,14 +1035,14 @@ class OrgParser(object):
                     if level <= self.__entry_data['level']:
                         # level is same or higher as main heading of blog
                         # entry: end of blog entry
-                        state = self.__handle_blog_end(line, rawcontent)
+                        state = self.__handle_blog_end(line, ''.join(rawcontent))
                         if state == self.BLOG_HEADER:
                             # The current line is the heading of the next
                             # blog entry — seed rawcontent with it so
                             # it appears in source.org.txt
-                            rawcontent = line + '\n'
+                            rawcontent = [line + '\n']
                         else:
-                            rawcontent = ""
+                            rawcontent = []
                         previous_line = line
                         ignore_line_for_rawcontent = True
                         continue
@@ -845,7 +1105,7 @@ class OrgParser(object):
                     previous_line = line
                     continue
 
-                if 'id' in list(self.__entry_data.keys()) and 'created' in list(self.__entry_data.keys()):
+                if 'id' in self.__entry_data and 'created' in self.__entry_data:
                     # if all properties already found, ignore rest of
                     # PROPERTIES and all other PROPERTIES (of sub-headings)
                     self.logging.debug(
@@ -896,7 +1156,7 @@ class OrgParser(object):
                         components.group(self.LOG_TIMESTAMP_IDX))
 
                     # add to finished-timestamp-history
-                    if 'finished-timestamp-history' in list(self.__entry_data.keys()):
+                    if 'finished-timestamp-history' in self.__entry_data:
                         self.__entry_data[
                             'finished-timestamp-history'].append(datetimestamp)
                     else:
@@ -905,7 +1165,7 @@ class OrgParser(object):
 
                     # (over)write latestupdateTS of blogentry if
                     # current datetimestamp is newer:
-                    if 'latestupdateTS' in list(self.__entry_data.keys()):
+                    if 'latestupdateTS' in self.__entry_data:
                         if datetimestamp > self.__entry_data['latestupdateTS']:
                             self.__entry_data['latestupdateTS'] = datetimestamp
                     else:
@@ -913,7 +1173,7 @@ class OrgParser(object):
 
                     # (over)write firstpublishTS of blogentry if
                     # current datetimestamp is older:
-                    if 'firstpublishTS' in list(self.__entry_data.keys()):
+                    if 'firstpublishTS' in self.__entry_data:
                         if datetimestamp < self.__entry_data['firstpublishTS']:
                             self.__entry_data['firstpublishTS'] = datetimestamp
                     else:
@@ -977,7 +1237,7 @@ class OrgParser(object):
                     state = self.ENTRY_CONTENT
                     previous_line = line
                     continue
-                elif list_item_components:
+                elif self.__might_be_list_item(first_character) and self.LIST_ITEM_REGEX.match(line):
                     # append to the last element of content (which is a list from the current block) to
                     # its last element (which contains the list of the block
                     # content):
@@ -1047,20 +1307,31 @@ class OrgParser(object):
 
             previous_line = line
 
+        if self.__end is not None:
+            # parsing a shard: the parser of the whole file would add
+            # the last line to rawcontent when reading the next line
+            if not ignore_line_for_rawcontent:
+                rawcontent.append(line + '\n')
+            self.__ends_at_clean_cut = previous_name == '' and previous_caption == '' and \
+                attr_html_dict == {} and self.__is_clean_cut(state, noexport_level)
+
         if state != self.SEARCHING_BLOG_HEADER:
             # in case file ends while parsing an blog entry (no following
             # heading is finishing current entry):
             self.logging.debug(
                 "OrgParser: finished file \"%s\" while parsing blog entry. Finishing it." %
                 self.__filename)
-            self.__handle_blog_end("", rawcontent)
+            self.__handle_blog_end("", ''.join(rawcontent))
 
+        stats_parsed_org_lines += self.__skipped_lines
+        self.__parsed_lines = stats_parsed_org_lines
         self.logging.debug("OrgParser: finished file \"%s\"" % self.__filename)
         # debug:   data = self._OrgParser__entry_data ; data['content']
         # self._OrgParser__blog_data
         # self._OrgParser__entry_data
         # self._OrgParser__filename
-        return self.__blog_data, stats_parsed_org_lines
+        yield from self.__blog_data
+        self.__blog_data = []
 
 
 # Local Variables:
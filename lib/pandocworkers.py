@@ -0,0 +1,209 @@
+# -*- coding: utf-8; mode: python; -*-
+
+import logging
+import queue  # for handing idle workers over to the threads
+import subprocess
+import threading
+
+
+class PandocWorkerPool(object):
+    """
+    Converts texts to HTML5 with long-running pandoc processes instead
+    of starting pandoc for each text.
+
+    Each worker is a "pandoc lua" process which runs WORKER_SCRIPT:
+    it reads requests like "org 11\\n| a | b |\\n" (source format and
+    length of the text in bytes followed by the text) from its
+    standard input and answers with "OK <length>\\n<HTML5>" or
+    "ERROR <length>\\n<message>" on its standard output. The HTML5 is
+    the same as the one of "pandoc --from=<format> --to=html5" except
+    for the final newline which the command line adds. Like the
+    command line, convert() expands tabs before (see TAB_STOP).
+
+    ("pandoc server" would avoid the start-up time as well but it
+    requires a pandoc built with the threaded runtime which is not
+    the case for the binaries distributed with pypandoc.)
+
+    Up to size workers are started on demand; each one converts one
+    text at a time. convert() returns None whenever a worker could
+    not convert a text; the caller converts it with a one-shot pandoc
+    invocation then which reports errors of pandoc as usual.
+    """
+
+    WORKER_SCRIPT = """
+io.stdout:setvbuf('full')
+while true do
+  local header = io.stdin:read('l')
+  if not header then break end
+  local format, length = header:match('^(%S+) (%d+)$')
+  length = tonumber(length)
+  local text = ''
+  if length > 0 then
+    text = io.stdin:read(length)
+  end
+  local ok, result = pcall(function() return pandoc.write(pandoc.read(text, format), 'html5') end)
+  if ok then
+    io.stdout:write('OK ', #result, '\\n', result)
+  else
+    result = tostring(result)
+    io.stdout:write('ERROR ', #result, '\\n', result)
+  end
+  io.stdout:flush()
+end
+"""
+
+    TAB_STOP = 4  # default of "pandoc --tab-stop"; pandoc.read() does not expand tabs by itself
+    CONVERSION_MODE = 'lua-workers-tab-stop-' + str(TAB_STOP)  # tells the results of the workers apart in cache keys
+
+    def __init__(self, size, pandoc_path):
+        """
+        @param size: maximum number of worker processes
+        @param pandoc_path: file name of the pandoc executable
+        """
+
+        self.size = size
+        self.pandoc_path = pandoc_path
+        self.available = True  # False if workers could not be started at all
+        self._idle_workers = queue.Queue()
+        self._workers = []  # all running worker processes
+        self._lock = threading.Lock()  # protects _workers and available
+
+    def _get_worker(self):
+        """
+        Returns an idle worker. A new one is started if all workers are
+        busy and the pool is not full; otherwise, this waits for the
+        next idle worker.
+
+        Must not be called with _lock held.
+
+        @param return: subprocess.Popen of the worker or None if no worker could be started
+        """
+
+        while True:
+            try:
+                worker = self._idle_workers.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    if not self.available:
+                        return None
+                    if len(self._workers) < self.size:
+                        return self._start_worker()
+                worker = self._idle_workers.get()
+            # None is put into the queue for each stopped worker:
+            if worker is not None:
+                return worker
+
+    def _start_worker(self):
+        """
+        Starts a worker and adds it to the pool.
+
+        @param return: subprocess.Popen of the worker or None if pandoc could not be started
+        """
+
+        try:
+            worker = subprocess.Popen([self.pandoc_path, 'lua', '-e', self.WORKER_SCRIPT],
+                                      stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL)
+        except OSError as message:
+            logging.debug('Could not start a pandoc worker: ' + str(message))
+            self.available = False
+            return None
+        worker.converted_texts = 0
+        self._workers.append(worker)
+        return worker
+
+    def _stop_worker(self, worker):
+        """
+        Stops a worker and removes it from the pool.
+
+        @param worker: subprocess.Popen of the worker
+        """
+
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        # wake up a thread which waits for an idle worker; it may start a new one:
+        self._idle_workers.put(None)
+        try:
+            worker.stdin.close()
+        except OSError:
+            pass
+        worker.kill()
+        worker.wait()
+        worker.stdout.close()
+
+    def convert(self, text, sourceformat):
+        """
+        Converts a text to HTML5 with a worker.
+
+        @param text: text to convert
+        @param sourceformat: pandoc input format like 'org' or 'latex'
+        @param return: HTML5 like "pandoc --to=html5" returns it or None if no worker could convert the text
+        """
+
+        if not self.available:
+            return None
+        worker = self._get_worker()
+        if worker is None:
+            return None
+
+        if '\t' in text:
+            text = self._expand_tabs(text)
+        encoded_text = text.encode('utf-8')
+        try:
+            worker.stdin.write((sourceformat + ' ' + str(len(encoded_text)) + '\n').encode('utf-8') + encoded_text)
+            worker.stdin.flush()
+            status, length = worker.stdout.readline().split()
+            result = worker.stdout.read(int(length)).decode('utf-8')
+        except (OSError, ValueError) as message:
+            # a worker which never converted anything does not work at all (e.g., pandoc without "pandoc lua"):
+            if worker.converted_texts == 0:
+                logging.debug('pandoc workers are not available: ' + str(message))
+                with self._lock:
+                    self.available = False
+            self._stop_worker(worker)
+            return None
+
+        worker.converted_texts += 1
+        self._idle_workers.put(worker)
+        if status != b'OK':
+            return None
+        return result + '\n'
+
+    @classmethod
+    def _expand_tabs(cls, text):
+        """
+        Replaces the tabs of a text with spaces up to the next tab stop
+        like the pandoc command line does. Carriage returns are removed
+        before (pandoc.read() ignores them anyway); they do not count
+        as columns.
+
+        @param text: text to convert
+        @param return: text without tabs
+        """
+
+        lines = []
+        for line in text.replace('\r', '').split('\n'):
+            parts = line.split('\t')
+            expanded = parts[0]
+            for part in parts[1:]:
+                expanded += ' ' * (cls.TAB_STOP - len(expanded) % cls.TAB_STOP) + part
+            lines.append(expanded)
+        return '\n'.join(lines)
+
+    def close(self):
+        """
+        Stops all workers.
+        """
+
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            self._stop_worker(worker)
+        self._idle_workers = queue.Queue()
+
+
+# Local Variables:
+# mode: flyspell
+# eval: (ispell-change-dictionary "en_US")
+# End:
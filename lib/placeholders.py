@@ -0,0 +1,88 @@
+# -*- coding: utf-8; mode: python; -*-
+
+import re
+
+
+class Placeholders(object):
+    """
+    Replaces placeholders like #BASE-URL# in templates and pages in
+    one pass over the string.
+
+    The placeholders and their values are given as a list of steps
+    like [('#DOMAIN#', 'example.org'), ('#BLOG-NAME#', 'My Blog')].
+    The result is the same as the one of the chain of
+    content.replace(placeholder, value) calls in the order of the
+    steps: a placeholder within a value gets replaced if its step
+    follows the step of the value. A placeholder may be part of more
+    than one step.
+
+    Values may be callables which are called only if their
+    placeholder is found and only once per replace() call. This way,
+    expensive values and their page dependencies are generated only
+    when they are used.
+
+    The pattern for each sequence of placeholders is compiled once.
+    """
+
+    # tuple of placeholders -> (compiled pattern, dict of placeholder -> list of its steps)
+    _compiled = {}
+
+    @staticmethod
+    def _compile(placeholders):
+        """
+        Returns the compiled pattern and the steps of each placeholder.
+
+        @param placeholders: tuple of placeholders in the order of the steps
+        @param return: (compiled pattern, dict of placeholder -> list of its step indices)
+        """
+
+        if placeholders not in Placeholders._compiled:
+            steps_of_placeholder = {}
+            for index, placeholder in enumerate(placeholders):
+                steps_of_placeholder.setdefault(placeholder, []).append(index)
+            # longest first in order to prefer placeholders with surrounding white-space:
+            pattern = re.compile('|'.join(re.escape(placeholder) for placeholder in
+                                          sorted(steps_of_placeholder, key=len, reverse=True)))
+            Placeholders._compiled[placeholders] = (pattern, steps_of_placeholder)
+
+        return Placeholders._compiled[placeholders]
+
+    @staticmethod
+    def replace(content, steps):
+        """
+        Replaces the placeholders of the steps within content.
+
+        @param content: string with placeholders
+        @param steps: list of (placeholder, value) tuples in the order of replacement;
+                      value is a string or a callable returning a string
+        @param return: content with replaced placeholders
+        """
+
+        if not steps:
+            return content
+
+        pattern, steps_of_placeholder = Placeholders._compile(tuple(step[0] for step in steps))
+        values = [step[1] for step in steps]
+
+        def value_of_step(index):
+            if callable(values[index]):
+                values[index] = values[index]()
+            return values[index]
+
+        def replace_from_step(text, first_step):
+            def replace_match(match):
+                for index in steps_of_placeholder[match.group(0)]:
+                    if index >= first_step:
+                        # later steps are applied to the inserted value as well:
+                        return replace_from_step(value_of_step(index), index + 1)
+                return match.group(0)
+
+            return pattern.sub(replace_match, text)
+
+        return replace_from_step(content, 0)
+
+
+# Local Variables:
+# mode: flyspell
+# eval: (ispell-change-dictionary "en_US")
+# End:
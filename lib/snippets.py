@@ -28,16 +28,19 @@ class SnippetResolver(object):
     the reference.
     """
 
-    # Pattern for [[id:something]] links (Org-mode internal links)
-    BRACKET_ID_LINK_RE = re.compile(r'\[\[id:([^\]]+)\]\]')
-    # Pattern for [[id:something][description]] links (should warn)
-    DESCRIBED_ID_LINK_RE = re.compile(r'\[\[id:([^\]]+)\]\[([^\]]+)\]\]')
     # Pattern for bare id:something references
-    BARE_ID_RE = re.compile(r'(?<!\[)id:(\S+?)(?=[\s,;.!?\)\]\}]|$)')
+    BARE_ID_PATTERN = r'(?<!\[)id:(?P<bare>\S+?)(?=[\s,;.!?\)\]\}]|$)'
 
     def __init__(self, blog_data):
         self.blog_data = blog_data
         self.snippet_dict = {}
+        self.expanded_snippet_ids = set()  # snippet IDs expanded into the current entry (including nested ones)
+        self.nested_snippet_ids = {}  # snippet ID -> set of snippet IDs expanded within this snippet
+        self.expanded_snippet_contents = {}  # snippet ID -> list of its content elements with all snippets expanded
+        self.snippet_body_rawcontents = {}  # snippet ID -> body of its rawcontent; see _get_snippet_body_rawcontent()
+        self.inline_snippet_texts = {}  # snippet ID -> text of its paragraphs; see _inline_replace()
+        self.reference_re = None  # all forms of snippet references; see _compile_reference_patterns()
+        self.rawcontent_reference_re = None  # snippet references replaced within rawcontent
         self._build_snippet_dict()
 
     def _build_snippet_dict(self):
@@ -51,6 +54,32 @@ class SnippetResolver(object):
 
         logging.debug("SnippetResolver: found %d snippets" % len(self.snippet_dict))
 
+        if self.snippet_dict:
+            self._compile_reference_patterns()
+
+    def _compile_reference_patterns(self):
+        """
+        Compiles one pattern for all forms of snippet references so
+        that a text gets scanned only once: [[id:snippet-id]],
+        [[id:snippet-id][description]], and bare id:snippet-id.
+
+        The link forms match the IDs of the snippets only; other
+        links are skipped so that bare references within them are
+        found. The ID of a bare reference has to be looked up in
+        snippet_dict. The name of the group which holds the ID of a
+        match is match.lastgroup.
+        """
+
+        # longest IDs first in order to prefer them over their prefixes:
+        snippet_ids = '|'.join(re.escape(snippet_id) for snippet_id in
+                               sorted(self.snippet_dict, key=len, reverse=True))
+        described = r'\[\[id:(?P<described>' + snippet_ids + r')\]\[[^\]]+\]\]'
+        bracket = r'\[\[id:(?P<bracket>' + snippet_ids + r')\]\]'
+
+        self.reference_re = re.compile('|'.join([described, bracket, self.BARE_ID_PATTERN]))
+        # described links are not replaced within rawcontent:
+        self.rawcontent_reference_re = re.compile('|'.join([bracket, self.BARE_ID_PATTERN]))
+
     def resolve_all(self):
         """
         Main entry point. Resolves all snippet references.
@@ -58,6 +87,11 @@ class SnippetResolver(object):
         First resolves snippet-within-snippet references, then resolves
         all non-snippet entries. Returns blog_data with snippet entries removed.
 
+        Each snippet gets resolved exactly once: referenced snippets
+        are resolved on demand before the snippet referencing them
+        (topological order). All references share the resolved
+        content elements of a snippet.
+
         @param return: blog_data with snippets resolved and snippet entries removed
         """
 
@@ -65,13 +99,17 @@ class SnippetResolver(object):
             return self.blog_data
 
         # First pass: resolve snippets within snippets
-        for snippet_id, snippet_entry in self.snippet_dict.items():
-            self._resolve_entry_snippets(snippet_entry, [snippet_id])
+        for snippet_id in self.snippet_dict:
+            self._resolve_snippet(snippet_id, [])
 
         # Second pass: resolve snippets in all non-snippet entries
         for entry in self.blog_data:
             if entry.get('category') != config.SNIPPET:
+                self.expanded_snippet_ids = set()
                 self._resolve_entry_snippets(entry, [])
+                if self.expanded_snippet_ids:
+                    # used for the fingerprints of the meta-data:
+                    entry['snippets'] = sorted(self.expanded_snippet_ids)
 
         # Remove snippet entries from blog_data
         return [e for e in self.blog_data if e.get('category') != config.SNIPPET]
@@ -98,6 +136,31 @@ class SnippetResolver(object):
         if 'rawcontent' in entry:
             entry['rawcontent'] = self._resolve_rawcontent(entry['rawcontent'], expansion_chain)
 
+    def _resolve_snippet(self, snippet_id, expansion_chain):
+        """
+        Resolves the snippet references within a snippet unless this
+        was done before. Snippets referenced by the snippet get
+        resolved first.
+
+        @param snippet_id: ID of the snippet
+        @param expansion_chain: list of IDs in current expansion path (for loop detection)
+        @param return: list of the expanded content elements of the snippet; shared, do not modify
+        @raises SnippetException: if loop detected
+        """
+
+        self._check_loop(snippet_id, expansion_chain)
+
+        if snippet_id not in self.expanded_snippet_contents:
+            expanded_snippet_ids = self.expanded_snippet_ids
+            self.expanded_snippet_ids = set()
+            snippet = self.snippet_dict[snippet_id]
+            self._resolve_entry_snippets(snippet, expansion_chain + [snippet_id])
+            self.nested_snippet_ids[snippet_id] = self.expanded_snippet_ids
+            self.expanded_snippet_ids = expanded_snippet_ids
+            self.expanded_snippet_contents[snippet_id] = snippet.get('content', [])
+
+        return self.expanded_snippet_contents[snippet_id]
+
     def _expand_element(self, element, entry, content_before, expansion_chain):
         """
         For ['par', text] elements, check for snippet references.
@@ -119,14 +182,6 @@ class SnippetResolver(object):
         if not refs:
             return [element]
 
-        # Check for described links and warn
-        described = self.DESCRIBED_ID_LINK_RE.findall(text)
-        for ref_id, desc in described:
-            if ref_id in self.snippet_dict:
-                logging.warning(
-                    "Snippet reference [[id:%s][%s]] has a description which will be ignored. "
-                    "Use [[id:%s]] instead." % (ref_id, desc, ref_id))
-
         # Determine if block or inline replacement
         # Block: the entire paragraph is one snippet reference
         stripped = text.strip()
@@ -149,7 +204,9 @@ class SnippetResolver(object):
         """
         Find snippet references in text that reference known snippets.
 
-        Finds [[id:snippet-id]] and bare id:snippet-id patterns.
+        Finds [[id:snippet-id]], [[id:snippet-id][description]], and
+        bare id:snippet-id patterns in one scan. Warns about
+        references with a description since it gets ignored.
 
         @param text: string to search
         @param return: list of snippet IDs found
@@ -157,25 +214,19 @@ class SnippetResolver(object):
 
         refs = []
 
-        # Find described links first (to exclude them from bracket matches)
-        described_ids = set()
-        for match in self.DESCRIBED_ID_LINK_RE.finditer(text):
-            ref_id = match.group(1)
-            if ref_id in self.snippet_dict:
-                described_ids.add(ref_id)
-                refs.append(ref_id)
-
-        # Find bracket links [[id:...]]
-        for match in self.BRACKET_ID_LINK_RE.finditer(text):
-            ref_id = match.group(1)
-            if ref_id in self.snippet_dict and ref_id not in described_ids:
-                refs.append(ref_id)
+        if 'id:' not in text:
+            return refs
 
-        # Find bare id:... references
-        for match in self.BARE_ID_RE.finditer(text):
-            ref_id = match.group(1)
+        for match in self.reference_re.finditer(text):
+            ref_id = match.group(match.lastgroup)
             if ref_id in self.snippet_dict:
                 refs.append(ref_id)
+                if match.lastgroup == 'described':
+                    # the description follows "[[id:<ID>][":
+                    description = match.group(0)[len(ref_id) + 7:-2]
+                    logging.warning(
+                        "Snippet reference [[id:%s][%s]] has a description which will be ignored. "
+                        "Use [[id:%s]] instead." % (ref_id, description, ref_id))
 
         return refs
 
@@ -191,18 +242,10 @@ class SnippetResolver(object):
         @param return: list of content elements from the snippet
         """
 
-        self._check_loop(snippet_id, expansion_chain)
-
-        snippet = self.snippet_dict[snippet_id]
-        snippet_content = copy.deepcopy(snippet.get('content', []))
-
-        # Resolve nested snippets within this snippet's content
-        if snippet_content:
-            temp_entry = {'content': snippet_content}
-            self._resolve_entry_snippets(temp_entry, expansion_chain + [snippet_id])
-            snippet_content = temp_entry['content']
+        snippet_content = list(self._resolve_snippet(snippet_id, expansion_chain))
+        self._note_expansion(snippet_id)
 
-        # Adapt heading levels
+        # Adapt heading levels (copies the headings which get changed)
         snippet_content = self._adapt_heading_levels(snippet_content, entry, content_before)
 
         return snippet_content
@@ -219,17 +262,11 @@ class SnippetResolver(object):
         """
 
         for ref_id in ref_ids:
-            self._check_loop(ref_id, expansion_chain)
-
-            snippet = self.snippet_dict[ref_id]
-            snippet_content = snippet.get('content', [])
+            resolved_content = self._resolve_snippet(ref_id, expansion_chain)
+            self._note_expansion(ref_id)
 
-            # Resolve nested snippets
-            resolved_content = copy.deepcopy(snippet_content)
-            if resolved_content:
-                temp_entry = {'content': resolved_content}
-                self._resolve_entry_snippets(temp_entry, expansion_chain + [ref_id])
-                resolved_content = temp_entry['content']
+            if ref_id in self.inline_snippet_texts:
+                continue
 
             # Extract text from snippet content
             par_elements = [e for e in resolved_content if isinstance(e, list) and e[0] == 'par']
@@ -238,21 +275,11 @@ class SnippetResolver(object):
                     "Snippet '%s' contains non-paragraph elements (headings, lists, etc.) "
                     "but is used inline. Only paragraph text will be substituted." % ref_id)
 
-            snippet_text = ' '.join(e[1] for e in par_elements) if par_elements else ''
-
-            # Replace described links first
-            described_pattern = r'\[\[id:' + re.escape(ref_id) + r'\]\[[^\]]*\]\]'
-            text = re.sub(described_pattern, snippet_text, text)
+            self.inline_snippet_texts[ref_id] = ' '.join(e[1] for e in par_elements) if par_elements else ''
 
-            # Replace bracket links
-            bracket_pattern = r'\[\[id:' + re.escape(ref_id) + r'\]\]'
-            text = re.sub(bracket_pattern, snippet_text, text)
-
-            # Replace bare id: references
-            bare_pattern = r'(?<!\[)id:' + re.escape(ref_id) + r'(?=[\s,;.!?\)\]\}]|$)'
-            text = re.sub(bare_pattern, snippet_text, text)
-
-        return text
+        # Replace all references in one pass; bare id: references to other entries are kept:
+        return self.reference_re.sub(
+            lambda match: self.inline_snippet_texts.get(match.group(match.lastgroup), match.group(0)), text)
 
     def _adapt_heading_levels(self, snippet_content, entry, content_before):
         """
@@ -316,24 +343,18 @@ class SnippetResolver(object):
         @param return: modified rawcontent
         """
 
-        # Replace [[id:snippet-id]] references
-        for match in self.BRACKET_ID_LINK_RE.finditer(rawcontent):
-            ref_id = match.group(1)
-            if ref_id in self.snippet_dict:
-                self._check_loop(ref_id, expansion_chain)
-                snippet_raw = self._get_snippet_body_rawcontent(ref_id)
-                rawcontent = rawcontent.replace('[[id:%s]]' % ref_id, snippet_raw)
+        if 'id:' not in rawcontent:
+            return rawcontent
 
-        # Replace bare id:... references
-        for match in self.BARE_ID_RE.finditer(rawcontent):
-            ref_id = match.group(1)
-            if ref_id in self.snippet_dict:
-                self._check_loop(ref_id, expansion_chain)
-                snippet_raw = self._get_snippet_body_rawcontent(ref_id)
-                bare_pattern = r'(?<!\[)id:' + re.escape(ref_id) + r'(?=[\s,;.!?\)\]\}]|$)'
-                rawcontent = re.sub(bare_pattern, snippet_raw, rawcontent)
+        def replace_reference(match):
+            ref_id = match.group(match.lastgroup)
+            if ref_id not in self.snippet_dict:
+                return match.group(0)
+            self._resolve_snippet(ref_id, expansion_chain)
+            return self._get_snippet_body_rawcontent(ref_id)
 
-        return rawcontent
+        # Replace [[id:snippet-id]] and bare id:snippet-id references in one pass
+        return self.rawcontent_reference_re.sub(replace_reference, rawcontent)
 
     def _get_snippet_body_rawcontent(self, snippet_id):
         """
@@ -344,6 +365,9 @@ class SnippetResolver(object):
         @param return: body rawcontent string
         """
 
+        if snippet_id in self.snippet_body_rawcontents:
+            return self.snippet_body_rawcontents[snippet_id]
+
         snippet = self.snippet_dict[snippet_id]
         rawcontent = snippet.get('rawcontent', '')
 
@@ -372,7 +396,19 @@ class SnippetResolver(object):
                 body_start = i
                 break
 
-        return '\n'.join(lines[body_start:]).strip()
+        self.snippet_body_rawcontents[snippet_id] = '\n'.join(lines[body_start:]).strip()
+        return self.snippet_body_rawcontents[snippet_id]
+
+    def _note_expansion(self, snippet_id):
+        """
+        Remember that a snippet got expanded into the current entry,
+        together with all snippets which got expanded within it.
+
+        @param snippet_id: ID of the expanded snippet
+        """
+
+        self.expanded_snippet_ids.add(snippet_id)
+        self.expanded_snippet_ids.update(self.nested_snippet_ids.get(snippet_id, set()))
 
     def _check_loop(self, snippet_id, expansion_chain):
         """
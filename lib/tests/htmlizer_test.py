@@ -3,6 +3,7 @@
 
 from config import *
 import unittest
+import random
 from lib.htmlizer import *
 from lib.utils import *
 
@@ -116,6 +117,14 @@ class TestHtmlizer(unittest.TestCase):
         self.assertTrue(
             htmlized_entry_test['htmlteaser-equals-content'] is False)
 
+        # the parsed entry is left untouched and can be htmlized again:
+        self.assertEqual(entry['content'], [
+            ['par', 'First paragraph'],
+            ['heading', {'title': 'My article header', 'level': 3}],
+            ['par', 'Second paragraph']])
+        self.assertNotIn('htmlteaser', entry)
+        self.assertEqual(htmlizer.sanitize_and_htmlize_blog_content(entry), htmlized_entry_test)
+
     def test_sanitize_and_htmlize_simple_table(self):
         """
         This tests the correct htmlization of tables
@@ -157,19 +166,19 @@ class TestHtmlizer(unittest.TestCase):
         ], 'level': 1, 'category': 'TEMPORAL'}
         htmlized_table_expected = '''<table>
 <thead>
-<tr class="header">
+<tr>
 <th>My</th>
 <th>table</th>
 <th></th>
 </tr>
 </thead>
 <tbody>
-<tr class="odd">
+<tr>
 <td>23</td>
 <td>42</td>
 <td>65</td>
 </tr>
-<tr class="even">
+<tr>
 <td>foo</td>
 <td>bar</td>
 <td>baz</td>
@@ -272,7 +281,7 @@ class TestHtmlizer(unittest.TestCase):
         ], 'level': 1, 'category': 'TEMPORAL'}
         htmlized_table_expected = '''<table>
 <thead>
-<tr class="header">
+<tr>
 <th><strong>What</strong></th>
 <th><strong>\u20ac</strong></th>
 <th><strong>Amount</strong></th>
@@ -281,14 +290,14 @@ class TestHtmlizer(unittest.TestCase):
 </tr>
 </thead>
 <tbody>
-<tr class="odd">
+<tr>
 <td><a href="https://roses.example.com/myroses.html">My Roses</a></td>
 <td>42.23</td>
 <td>12</td>
 <td>506.76</td>
 <td><strong>best</strong> roses <code>evar</code></td>
 </tr>
-<tr class="even">
+<tr>
 <td><a href="''' + config.BASE_URL + '''/2007/01/29/my-temporal">internal
 <strong>link</strong> test</a></td>
 <td>10</td>
@@ -796,6 +805,21 @@ class TestHtmlizer(unittest.TestCase):
             print("value         : [" + value + "]")
         self.assertEqual(expectedoutput, value)
 
+        # links to ignore:
+        self.assertEqual(htmlizer.sanitize_internal_links("[[id:ignoreme-foo]] and [[id:ignoreme-bar][bar]]"),
+                         "[[id:ignoreme-foo]] and [[id:ignoreme-bar][bar]]")
+
+        # the paths of the linked IDs are computed once:
+        self.assertEqual(htmlizer._target_paths['2014-03-02-my-temporal'], '2007/01/29/my-temporal')
+
+        # missing IDs:
+        with self.assertRaises(HtmlizerException):
+            htmlizer.sanitize_internal_links("[[id:2014-03-02-my-persistent]] [[id:a-missing-id][foo]]")
+        self.assertNotIn('a-missing-id', htmlizer._target_paths)
+        htmlizer.ignore_missing_ids = True
+        self.assertEqual(htmlizer.sanitize_internal_links("[[id:2014-03-02-a-missing-id][foo]]"),
+                         "<a href=\"" + config.BASE_URL + "/a-missing-id\">foo</a>")
+
     def test_sanitize_external_links(self):
 
         template_definitions = 'foo'
@@ -927,6 +951,555 @@ class TestHtmlizer(unittest.TestCase):
             "in different mode."
         self.assertEqual(htmlizer.fix_ampersands_in_url(mystring), expected)
 
+    def test_htmlize_inline_markup(self):
+
+        blog_data = [{'id': '2014-03-02-my-persistent',
+                      'category': config.PERSISTENT,
+                      'firstpublishTS' : datetime.datetime(2008, 1, 29, 19, 40),
+                      'latestupdateTS' : datetime.datetime(2008, 12, 29, 19, 40),
+                      'finished-timestamp-history': [datetime.datetime(2008, 12, 29, 19, 40)]}]
+
+        htmlizer = Htmlizer('foo', 'foo', 'mytargetdir', blog_data, None, {}, 'foo', 'foo', False, False)
+
+        def chain(text):
+            text = htmlizer.sanitize_html_characters(text)
+            text = htmlizer.sanitize_internal_links(text)
+            text = htmlizer.sanitize_external_links(text)
+            text = htmlizer.htmlize_simple_text_formatting(text)
+            return htmlizer.fix_ampersands_in_url(text)
+
+        # same result as the chain of the single methods:
+        for text in ["no markup here",
+                     "An & and <this> will be — &amp; escaped.",
+                     "*This* is *bold face* and ~code~, =verbatim= and +strike through+. With *end*",
+                     "*ohne Umlaut und Anfang und Ende* and ~mit Umlaut Öäß~",
+                     "~x + 1~ and (*bold*) ~&lt;tag&gt;~ or =a/b=",
+                     "*a*, *b* and *a*&*b*",
+                     "1 + 2 and x = 3 or a*b",
+                     "1 + 1 = 2 or C++",
+                     "[[id:2014-03-02-my-persistent]] and [[id:2014-03-02-my-persistent][a description]].",
+                     "[[id:ignoreme-demo]] and [[id:ignoreme-demo][demo]]",
+                     "[[http://foo.bar/index.html?a=1&b=2][a link]] and [[https://example.org]]",
+                     "[[file:foo.org][other]] and [[http://a b][c]] and [[foo bar]]",
+                     "[[http://foo.bar][a link with *bold*]]",
+                     "see https://example.org/foo?a=b&c=d. or (http://example.org) or <http://example.org>",
+                     "http://example.org at the beginning and \"http://example.org\" in quotes and [http://example.org]",
+                     "[[https://web.archive.org/web/20260125032122/https://example.com/][archived]]"]:
+            self.assertEqual(htmlizer.htmlize_inline_markup(text), chain(text))
+
+        self.assertEqual(htmlizer.htmlize_inline_markup("[[id:2014-03-02-my-persistent]] and " +
+                                                        "[[id:2014-03-02-my-persistent][a description]]."),
+                         "<a href=\"" + config.BASE_URL + "/my-persistent\">2014-03-02-my-persistent</a> and " +
+                         "<a href=\"" + config.BASE_URL + "/my-persistent\">a description</a>.")
+        self.assertEqual(htmlizer.htmlize_inline_markup("see https://example.org/foo?a=b&c=d. or (http://example.org) " +
+                                                        "or <http://example.org>"),
+                         "see <a href=\"https://example.org/foo?a=b&amp;c=d.\">https://example.org/foo?a=b&amp;c=d.</a> " +
+                         "or (<a href=\"http://example.org)\">http://example.org)</a> or " +
+                         "&lt;<a href=\"http://example.org&gt;\">http://example.org&gt;</a>")
+
+        # markup next to markup, links within markup and links next to
+        # links are rendered one by one; code and verbatim text stays
+        # as it is:
+        for text, html in [("*a* *b*", "<b>a</b> <b>b</b>"),
+                           ("~a~ ~b~ and ~C++~", "<code>a</code> <code>b</code> and <code>C++</code>"),
+                           ("~f(*args, **kwargs)~", "<code>f(*args, **kwargs)</code>"),
+                           ("*a ~b* c~", "<b>a ~b</b> c~"),
+                           ("*see [[http://foo.bar][link]]* and *bold*",
+                            "<b>see <a href=\"http://foo.bar\">link</a></b> and <b>bold</b>"),
+                           ("*important: http://example.org*",
+                            "<b>important: <a href=\"http://example.org\">http://example.org</a></b>"),
+                           ("=x [[http://foo.bar][link]]", "=x <a href=\"http://foo.bar\">link</a>"),
+                           ("=x [[http://foo.bar][link]]=", "<code>x [[http://foo.bar][link]]</code>"),
+                           ("[[http://a]][[http://b][c]]",
+                            "<a href=\"http://a\">http://a</a><a href=\"http://b\">c</a>"),
+                           ("http://example.org/[[http://b]]",
+                            "http://example.org/<a href=\"http://b\">http://b</a>"),
+                           ("[[id:2014-03-02-my-persistent][see http://example.org]]",
+                            "<a href=\"" + config.BASE_URL + "/my-persistent\">see http://example.org</a>"),
+                           ("a [[ b [[[id:2014-03-02-my-persistent]]",
+                            "a [[ b [<a href=\"" + config.BASE_URL + "/my-persistent\">2014-03-02-my-persistent</a>"),
+                           ("[[id:]] stays", "[[id:]] stays")]:
+            self.assertEqual(htmlizer.htmlize_inline_markup(text), html)
+
+        # missing IDs are handled like by sanitize_internal_links():
+        with self.assertRaises(HtmlizerException):
+            htmlizer.htmlize_inline_markup("[[id:this-is-not-an-id][text]]")
+
+        # each ID is resolved once: a missing ID is reported once only
+        htmlizer = Htmlizer('foo', 'foo', 'mytargetdir', blog_data, None, {}, 'foo', 'foo', False, True)
+        with self.assertLogs('lazyblorg.htmlizer', level='WARNING') as cm:
+            htmlizer.htmlize_inline_markup("[[id:missing-id][x]] *a* *b* [[id:missing-id]]")
+        self.assertEqual(len(cm.output), 1)
+        self.assertIn('blog_data_with_id("missing-id")', cm.output[0])
+
+        # URLs with markup characters and ampersands:
+        original_base_url = config.BASE_URL
+        config.BASE_URL = '//example.org/a+b&amp;amp;c'
+        try:
+            self.assertEqual(htmlizer.htmlize_inline_markup("see [[id:2014-03-02-my-persistent][this]] and *that* +strike+"),
+                             "see <a href=\"//example.org/a+b&amp;c/my-persistent\">this</a> and <b>that</b> <s>strike</s>")
+        finally:
+            config.BASE_URL = original_base_url
+
+    def test_generate_page_signature(self):
+
+        template_definitions = [['html-block', 'paragraph', ['<p>#PAR-CONTENT#</p>']]]
+        prefix_dir = 'foo'
+        targetdir = 'foo'
+        generate = []
+        increment_version = []
+        autotag_language = False
+        ignore_missing_ids = False
+        entries_timeline_by_published = {}
+
+        def generate_blog_data(linking_title, linked_content):
+            return [{'id': '2017-01-01-linking',
+                     'title': linking_title,
+                     'category': config.TEMPORAL,
+                     'usertags': ['mytest'],
+                     'firstpublishTS': datetime.datetime(2017, 1, 1, 12, 0),
+                     'latestupdateTS': datetime.datetime(2017, 1, 1, 12, 0),
+                     'content': [['par', 'See [[id:2018-02-02-linked][this article]].']]},
+                    {'id': '2018-02-02-linked',
+                     'title': 'Linked',
+                     'category': config.TEMPORAL,
+                     'usertags': ['mytest'],
+                     'firstpublishTS': datetime.datetime(2018, 2, 2, 12, 0),
+                     'latestupdateTS': datetime.datetime(2018, 2, 2, 12, 0),
+                     'content': [['par', linked_content]]}]
+
+        def generate_signatures(blog_data):
+            htmlizer = Htmlizer(
+                template_definitions,
+                prefix_dir,
+                targetdir,
+                blog_data,
+                None,
+                entries_timeline_by_published,
+                generate,
+                increment_version,
+                autotag_language,
+                ignore_missing_ids)
+            htmlizer._populate_backreferences(htmlizer.blog_data)
+            htmlizer.dict_of_tags_with_ids = htmlizer._populate_dict_of_tags_with_ids(htmlizer.blog_data)
+            return [htmlizer._generate_page_signature(entry) for entry in htmlizer.blog_data]
+
+        original = generate_signatures(generate_blog_data('Linking', 'Foo'))
+
+        # signatures are stable:
+        self.assertEqual(original, generate_signatures(generate_blog_data('Linking', 'Foo')))
+
+        # content change only affects the page of the changed entry:
+        changed = generate_signatures(generate_blog_data('Linking', 'Bar'))
+        self.assertEqual(original[0], changed[0])
+        self.assertNotEqual(original[1], changed[1])
+
+        # the title of the linking article is part of the back-references of the linked article:
+        changed = generate_signatures(generate_blog_data('Renamed', 'Foo'))
+        self.assertNotEqual(original[0], changed[0])
+        self.assertNotEqual(original[1], changed[1])
+
+    def test_page_dependencies(self):
+
+        template_definitions = [['html-block', 'paragraph', ['<p>#PAR-CONTENT#</p>']]]
+        prefix_dir = 'foo'
+        targetdir = 'foo'
+        generate = []
+        increment_version = []
+        autotag_language = False
+        ignore_missing_ids = False
+        entries_timeline_by_published = {}
+
+        blog_data = [{'id': '2017-01-01-linking',
+                      'title': 'Linking',
+                      'category': config.TEMPORAL,
+                      'usertags': ['mytest'],
+                      'firstpublishTS': datetime.datetime(2017, 1, 1, 12, 0),
+                      'latestupdateTS': datetime.datetime(2017, 1, 1, 12, 0)},
+                     {'id': '2018-02-02-linked',
+                      'title': 'Linked',
+                      'category': config.TEMPORAL,
+                      'usertags': ['mytest'],
+                      'firstpublishTS': datetime.datetime(2018, 2, 2, 12, 0),
+                      'latestupdateTS': datetime.datetime(2018, 2, 2, 12, 0)}]
+
+        htmlizer = Htmlizer(
+            template_definitions,
+            prefix_dir,
+            targetdir,
+            blog_data,
+            None,
+            entries_timeline_by_published,
+            generate,
+            increment_version,
+            autotag_language,
+            ignore_missing_ids)
+
+        # nothing gets recorded outside of output files:
+        htmlizer.template_definition_by_name('paragraph')
+        htmlizer._store_page_dependencies(os.path.join(targetdir, 'index.html'))
+        self.assertEqual(htmlizer.page_dependencies, {})
+
+        htmlizer._start_recording_page_dependencies(['2017-01-01-linking'])
+        htmlizer.sanitize_internal_links(htmlizer.template_definition_by_name('paragraph').replace(
+            '#PAR-CONTENT#', '[[id:2018-02-02-linked][a link]]'))
+        htmlizer._store_page_dependencies(os.path.join(targetdir, '2017', '01', '01', 'linking', 'index.html'))
+
+        self.assertEqual(htmlizer.page_dependencies,
+                         {os.path.join('2017', '01', '01', 'linking', 'index.html'):
+                          {'entries': ['2017-01-01-linking', '2018-02-02-linked'],
+                           'templates': ['paragraph'],
+                           'globals': ['config']}})
+
+    def test_content_cache(self):
+
+        template_definitions = [['html-block', 'paragraph', ['<p>#PAR-CONTENT#</p>']]]
+
+        blog_data = [{'id': '2017-01-01-linking',
+                      'title': 'Linking',
+                      'category': config.TEMPORAL,
+                      'level': 1,
+                      'usertags': ['mytest'],
+                      'content': [['par', 'See [[id:2018-02-02-linked][a link]]']],
+                      'firstpublishTS': datetime.datetime(2017, 1, 1, 12, 0),
+                      'latestupdateTS': datetime.datetime(2017, 1, 1, 12, 0)},
+                     {'id': '2018-02-02-linked',
+                      'title': 'Linked',
+                      'category': config.TEMPORAL,
+                      'level': 1,
+                      'usertags': ['mytest'],
+                      'content': [['par', 'Linked']],
+                      'firstpublishTS': datetime.datetime(2018, 2, 2, 12, 0),
+                      'latestupdateTS': datetime.datetime(2018, 2, 2, 12, 0)}]
+
+        def htmlize(template_definitions, previous_content_cache):
+            htmlizer = Htmlizer(template_definitions, 'foo', 'foo', blog_data, None, {}, [], [], False, False,
+                                previous_content_cache=previous_content_cache)
+            htmlizer._start_recording_page_dependencies()
+            htmlized_entry = htmlizer.sanitize_and_htmlize_blog_content(blog_data[0])
+            return htmlizer, htmlized_entry
+
+        # without a previous content cache, nothing gets cached:
+        htmlizer, uncached_entry = htmlize(template_definitions, None)
+        self.assertEqual(htmlizer.content_cache, {})
+
+        first, first_entry = htmlize(template_definitions, {})
+        self.assertEqual(first_entry['content'], uncached_entry['content'])
+        self.assertEqual(first.stats_content_cache_hits, 0)
+        self.assertEqual(first.content_cache['2017-01-01-linking']['content']['dependencies'],
+                         {'entries': ['2018-02-02-linked'], 'templates': ['paragraph'], 'globals': ['config']})
+
+        # the next run takes the content from the cache and depends on the same inputs:
+        second, second_entry = htmlize(template_definitions, first.content_cache)
+        self.assertEqual(second.stats_content_cache_hits, 1)
+        self.assertEqual(second_entry['content'], first_entry['content'])
+        self.assertEqual(second_entry['htmlteaser-equals-content'], first_entry['htmlteaser-equals-content'])
+        self.assertEqual(second._current_page_dependencies,
+                         {'entries': {'2018-02-02-linked'}, 'templates': {'paragraph'}, 'globals': {'config'}})
+        self.assertEqual(blog_data[0]['content'], [['par', 'See [[id:2018-02-02-linked][a link]]']])
+
+        # changed templates or content invalidate the cached content:
+        third, third_entry = htmlize([['html-block', 'paragraph', ['<div>#PAR-CONTENT#</div>']]], first.content_cache)
+        self.assertEqual(third.stats_content_cache_hits, 0)
+        self.assertTrue(third_entry['content'][0].startswith('<div>'))
+
+        blog_data[0]['content'] = [['par', 'Changed']]
+        fourth, fourth_entry = htmlize(template_definitions, first.content_cache)
+        self.assertEqual(fourth.stats_content_cache_hits, 0)
+        self.assertEqual(fourth_entry['content'], ['<p>Changed</p>'])
+
+    def test_feed_fragments(self):
+
+        template_definitions = [['html-block', 'paragraph', ['<p>#PAR-CONTENT#</p>']]]
+        figure = '\n<figure class="image-center">\n<img src="image.jpg" />\n</figure>'
+        blog_data = [{'id': '2017-01-01-feed',
+                      'title': 'Feed & Co',
+                      'category': config.TEMPORAL,
+                      'level': 1,
+                      'usertags': ['mytest'],
+                      'autotags': {'language': 'english'},
+                      'content': [['par', 'Feed']],
+                      'firstpublishTS': datetime.datetime(2017, 1, 1, 12, 0),
+                      'latestupdateTS': datetime.datetime(2017, 1, 2, 12, 0)}]
+
+        htmlizer = Htmlizer(template_definitions, 'foo', 'foo', blog_data, None, {}, [], [], False, False)
+        htmlizer._htmlized_entries['2017-01-01-feed'] = dict(blog_data[0], **{
+            'content': ['<p>Feed</p>', figure],
+            'htmlteaser-equals-content': True})
+
+        fragments = htmlizer._get_feed_fragments(blog_data[0], '2017/01/01/feed')
+        self.assertIs(htmlizer._get_feed_fragments(blog_data[0], '2017/01/01/feed'), fragments)
+        self.assertIn('<title type="text">Feed &amp; Co</title>', fragments['head'])
+        self.assertIn("<link href='https:" + config.BASE_URL + "/2017/01/01/feed' />", fragments['head'])
+        self.assertIn("<category scheme='https:" + config.BASE_URL + "/tags/mytest' term='mytest' />",
+                      fragments['head'])
+        self.assertIn("<category scheme='https:" + config.BASE_URL + "/autotags/language' term='language:english' />",
+                      fragments['head'])
+
+        # only the summary gets absolute image paths; the htmlized content is not modified:
+        self.assertEqual(fragments['summary'].count('http:' + config.BASE_URL + '/2017/01/01/feed/image.jpg'), 1)
+        self.assertNotIn('http:', fragments['content'])
+        self.assertEqual(htmlizer._htmlized_entries['2017-01-01-feed']['content'][1], figure)
+
+        self.assertEqual(Htmlizer._add_https_to_blog_urls('<a href="' + config.BASE_URL + '/a">' + config.BASE_URL +
+                                                          '</a> http:' + config.BASE_URL),
+                         '<a href="https:' + config.BASE_URL + '/a">https:' + config.BASE_URL +
+                         '</a> http:' + config.BASE_URL)
+
+    def test_pandoc_cache(self):
+
+        import tempfile
+        import shutil
+
+        orgmode = '| a | b |\n|---+---|\n| 1 | 2 |'
+        original_cache_directory = config.PANDOC_CACHE_DIRECTORY
+        cache_directory = tempfile.mkdtemp()
+        try:
+            config.PANDOC_CACHE_DIRECTORY = ''
+            htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+            uncached_result = htmlizer.convert_org_to_html5(orgmode)
+            self.assertEqual(htmlizer.stats_external_org_to_html5_conversion, 1)
+            self.assertEqual(htmlizer.stats_pandoc_cache_misses, 0)
+
+            config.PANDOC_CACHE_DIRECTORY = cache_directory
+
+            htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+            self.assertEqual(htmlizer.convert_org_to_html5(orgmode), uncached_result)
+            self.assertEqual(htmlizer.stats_pandoc_cache_misses, 1)
+            self.assertEqual(len(os.listdir(cache_directory)), 1)
+
+            # same text, different format: not taken from the cache
+            htmlizer.convert_latex_to_html5(orgmode)
+            self.assertEqual(htmlizer.stats_pandoc_cache_misses, 2)
+
+            # a new run gets its result from the cache without invoking pandoc
+            htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+            self.assertEqual(htmlizer.convert_org_to_html5(orgmode), uncached_result)
+            self.assertEqual(htmlizer.stats_pandoc_cache_hits, 1)
+            self.assertEqual(htmlizer.stats_pandoc_cache_misses, 0)
+            self.assertEqual(htmlizer.stats_external_org_to_html5_conversion, 0)
+
+            # results of the pandoc workers are cached separately:
+            htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+            htmlizer._pandoc_worker_pool = PandocWorkerPool(1, pypandoc.get_pandoc_path())
+            try:
+                self.assertEqual(htmlizer.convert_org_to_html5(orgmode), uncached_result)
+            finally:
+                htmlizer._pandoc_worker_pool.close()
+            self.assertEqual(htmlizer.stats_pandoc_cache_misses, 1)
+            self.assertEqual(len(os.listdir(cache_directory)), 3)
+        finally:
+            config.PANDOC_CACHE_DIRECTORY = original_cache_directory
+            shutil.rmtree(cache_directory)
+
+    def test_pandoc_batch_conversion(self):
+
+        texts = ['| a | b |\n|---+---|\n| 1 | 2 |',
+                 '- first item\n  - sub-item\n- second item with *bold* and [[https://example.com][a link]]',
+                 '1. one\n2. two',
+                 '- single item']
+        heading_text = '* a heading\nwith text'
+
+        original_cache_directory = config.PANDOC_CACHE_DIRECTORY
+        try:
+            config.PANDOC_CACHE_DIRECTORY = ''
+
+            htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+            single_results = [htmlizer.convert_org_to_html5(text) for text in texts]
+            self.assertEqual(htmlizer.stats_external_org_to_html5_conversion, len(texts))
+
+            self.assertFalse(htmlizer._is_suitable_for_pandoc_batch(heading_text, 'org'))
+            self.assertFalse(htmlizer._is_suitable_for_pandoc_batch('\\section{foo}', 'latex'))
+
+            htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+            htmlizer._prepare_pandoc_conversions([('org', text) for text in texts + [heading_text]])
+            self.assertEqual(htmlizer.stats_external_org_to_html5_conversion, 1)
+            self.assertEqual([htmlizer.convert_org_to_html5(text) for text in texts], single_results)
+            self.assertEqual(htmlizer.stats_external_org_to_html5_conversion, 1)
+            self.assertEqual(htmlizer._pandoc_batch_results, {})
+        finally:
+            config.PANDOC_CACHE_DIRECTORY = original_cache_directory
+
+    def test_pandoc_workers(self):
+
+        blog_data = [{'id': 'entry-' + str(number),
+                      'category': config.TEMPORAL,
+                      'content': [['par', 'some text'],
+                                  # italic is not rendered natively:
+                                  ['mytable', False, ['| /a/ | ' + str(number) + ' |', '|---+---|', '| 1 | 2 |']],
+                                  ['list', ['- /item/ ' + str(number), '- another item']]]}
+                     for number in range(5)]
+
+        original_cache_directory = config.PANDOC_CACHE_DIRECTORY
+        try:
+            config.PANDOC_CACHE_DIRECTORY = ''
+
+            htmlizer = Htmlizer([], 'foo', 'foo', blog_data, None, {}, [], [], False, False)
+            expected_results = {}
+            for entry in blog_data:
+                for sourceformat, text in htmlizer._collect_pandoc_conversions(entry).values():
+                    expected_results[(sourceformat, text)] = htmlizer.convert_org_to_html5(text)
+            self.assertEqual(len(expected_results), 10)
+
+            htmlizer = Htmlizer([], 'foo', 'foo', blog_data, None, {}, [], [], False, False,
+                                pandoc_workers=3)
+            htmlizer._prepare_pandoc_conversions_concurrently(blog_data)
+            self.assertEqual(htmlizer._pandoc_batch_results, expected_results)
+            # one batch per entry:
+            self.assertEqual(htmlizer.stats_external_org_to_html5_conversion, 5)
+
+            # within run(), the long-running pandoc workers convert the batches:
+            htmlizer = Htmlizer([], 'foo', 'foo', blog_data, None, {}, [], [], False, False,
+                                pandoc_workers=3)
+            htmlizer.current_entry_id = 'the-current-entry'
+            pool = htmlizer._pandoc_worker_pool = PandocWorkerPool(3, pypandoc.get_pandoc_path())
+            try:
+                htmlizer._prepare_pandoc_conversions_concurrently(blog_data)
+                self.assertIn(len(pool._workers), [1, 2, 3])
+            finally:
+                pool.close()
+            self.assertEqual(htmlizer._pandoc_batch_results, expected_results)
+            self.assertEqual(htmlizer.stats_external_org_to_html5_conversion, 5)
+            self.assertEqual(htmlizer.current_entry_id, 'the-current-entry')
+        finally:
+            config.PANDOC_CACHE_DIRECTORY = original_cache_directory
+
+    def test_render_org_table(self):
+
+        htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+
+        self.assertEqual(htmlizer.render_org_table(['|   | <r> |',
+                                                    '| Name | *Value* |',
+                                                    '|------+-------|',
+                                                    '| a & b | ~x<y~ |',
+                                                    '| [[https://ex.com/?a=1&b=2][*ex* x]] |  |',
+                                                    '|------+-------|']),
+                         '<table>\n<thead>\n<tr>\n<th>Name</th>\n' +
+                         '<th style="text-align: right;"><strong>Value</strong></th>\n</tr>\n</thead>\n' +
+                         '<tbody>\n<tr>\n<td>a &amp; b</td>\n' +
+                         '<td style="text-align: right;"><code>x&lt;y</code></td>\n</tr>\n' +
+                         '<tr>\n<td><a href="https://ex.com/?a=1&amp;b=2"><strong>ex</strong> x</a></td>\n' +
+                         '<td style="text-align: right;"></td>\n</tr>\n</tbody>\n</table>\n')
+
+        # tables without header:
+        self.assertEqual(htmlizer.render_org_table(['| 1 | 2 |']),
+                         '<table>\n<tbody>\n<tr>\n<td>1</td>\n<td>2</td>\n</tr>\n' +
+                         '</tbody>\n</table>\n')
+
+        # anything not supported is left to pandoc:
+        for lines in [['| /italic/ | 2 |'],
+                      ['| a -- b | 2 |'],
+                      ['| [[https://example.com]] | 2 |'],
+                      ['| 1 | 2 |', '| 3 |'],
+                      ['|---+---|', '| 1 | 2 |'],
+                      ['| 1 | 2 |', '| 3 | 4 |', '|---+---|', '| 5 | 6 |'],
+                      ['| header | only |', '|--------+------|'],
+                      ['|  |  |', '|---+---|', '| 1 | 2 |'],
+                      ['| ' + ' '.join(['word'] * 30) + ' | 2 |'],
+                      ['| a*b*c | 2 |']]:
+            self.assertIsNone(htmlizer.render_org_table(lines))
+
+    def test_render_org_table_like_pandoc(self):
+
+        htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+
+        for lines in [['| 1 | 2 |'],
+                      ['| 1 | 2 |', '| 3 | 4 |', '| 5 | 6 |'],
+                      ['| a | b |', '|---+---|', '| 1 | 2 |', '| 3 | 4 |', '| 5 | 6 |'],
+                      ['| a | b |', '|---+---|', '| 1 | 2 |', '|---+---|'],
+                      ['| <l> | <c> | <r> |', '| a | b | c |', '|---+---+---|', '| 1 | 2 | 3 |'],
+                      ['| | <r> |', '| 1 | 2 |'],
+                      ['| Name | *Value* |', '|------+-------|', '| a & b | ~x<y~ |', '|  | plain |'],
+                      ['| [[https://ex.com/?a=1&b=2][*ex*]] | x |'],
+                      ['| ' + ' '.join(['word'] * 12) + ' | ' + '*bold text* ' * 2 + '|']]:
+            result = htmlizer.render_org_table(lines)
+            self.assertIsNotNone(result, lines)
+            self.assertEqual(result, pypandoc.convert_text('\n'.join(lines), 'html5', format='org'), lines)
+
+    def test_render_org_list(self):
+
+        htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+
+        self.assertEqual(htmlizer.render_org_list(['- first item',
+                                                   '- *bold* [[https://ex.com][link]]',
+                                                   '  on two lines',
+                                                   '  1. nested',
+                                                   '  2. [X] done',
+                                                   '     - [ ] open',
+                                                   '+ ',
+                                                   '- don\'t stop',
+                                                   '- ',
+                                                   '  - nested in an empty item']),
+                         '<ul>\n<li>first item</li>\n' +
+                         '<li><strong>bold</strong> <a href="https://ex.com">link</a> on two lines\n' +
+                         '<ol>\n<li>nested</li>\n' +
+                         '<li><label><input type="checkbox" checked="" />done</label>\n' +
+                         '<ul class="task-list">\n<li><label><input type="checkbox" />open</label></li>\n</ul></li>\n' +
+                         '</ol></li>\n<li></li>\n<li>don\'t stop</li>\n' +
+                         '<li><ul>\n<li>nested in an empty item</li>\n</ul></li>\n</ul>\n')
+
+        # anything not supported is left to pandoc:
+        for lines in [['- /italic/'],
+                      ['- first', '\n', '- second'],
+                      ['- term :: description'],
+                      ['3. three', '4. four'],
+                      ['- unordered', '1. ordered'],
+                      ['- an item which pandoc would wrap since it is longer than seventy-two characters'],
+                      ['- item', '  | a | table |']]:
+            self.assertIsNone(htmlizer.render_org_list(lines))
+
+    def test_render_org_paragraphs(self):
+
+        htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+
+        self.assertEqual(htmlizer.render_org_paragraphs(['Maybe <this> is', 'not sanitized?', '', 'Second']),
+                         '<p>Maybe &lt;this&gt; is not sanitized?</p>\n<p>Second</p>\n')
+        self.assertIsNone(htmlizer.render_org_paragraphs(['- a list']))
+        self.assertIsNone(htmlizer.render_org_paragraphs(['<2019-01-01 Tue>']))
+
+    def test_native_renderers_like_pandoc(self):
+
+        htmlizer = Htmlizer([], 'foo', 'foo', [], None, {}, [], [], False, False)
+        generator = random.Random(42)
+        words = ['a', 'word', 'longerword', 'x&y', '<tag>', 'ümlaut', '漢字', "don't", '(42)',
+                 '*bold text*', '~code~', '[[https://example.com/?a=1&b=2][a link]]']
+
+        def text():
+            # lengths around PANDOC_COLUMNS:
+            return ' '.join(generator.choice(words) for number in range(generator.randint(0, generator.choice([4, 12]))))
+
+        native = 0
+        for number in range(400):
+            kind = generator.choice(['table', 'list', 'paragraphs'])
+            if kind == 'table':
+                columns = generator.randint(1, 3)
+                lines = ['| ' + ' | '.join(text() for column in range(columns)) + ' |'
+                         for row in range(generator.randint(1, 3))]
+                if generator.random() < 0.5:
+                    lines.insert(1, '|' + '+'.join(['---'] * columns) + '|')
+                result = htmlizer.render_org_table(lines)
+                orgmode = '\n'.join(lines)
+            elif kind == 'list':
+                lines = []
+                for item in range(generator.randint(1, 3)):
+                    lines.append('- ' + generator.choice(['', '[ ] ', '[X] ']) + text())
+                    if generator.random() < 0.3:
+                        lines.append('  1. ' + text())
+                result = htmlizer.render_org_list(lines)
+                orgmode = '\n'.join(lines)
+            else:
+                lines = [text(), text(), '', text()]
+                result = htmlizer.render_org_paragraphs(lines)
+                if result is not None:
+                    result = '<div class="center">\n' + result + '</div>\n'
+                orgmode = '#+BEGIN_CENTER\n' + '\n'.join(lines) + '\n#+END_CENTER'
+            if result is None:
+                continue
+            native += 1
+            self.assertEqual(result, pypandoc.convert_text(orgmode, 'html5', format='org').replace('"CENTER"', '"center"'),
+                             lines)
+        self.assertGreater(native, 20)
+
 
 # Local Variables:
 # mode: flyspell
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8; mode: python; -*-
+
+# Microbenchmark of the OrgParser: parses a generated Org-mode file
+# and prints the number of parsed lines per second.
+#
+# Invoke it from the project directory:
+#   python3 -m lib.tests.orgparser_benchmark
+#   python3 -m lib.tests.orgparser_benchmark --copies 50 --filler 2000 --runs 5
+#   python3 -m lib.tests.orgparser_benchmark --copies 500 --memory
+#
+# With --memory, the memory of the parsed blog data is measured
+# instead: in total, for the dicts of the entries, and for the lists of
+# their content elements. The time of typical accesses to the entries
+# is reported along with it since a more compact representation has to
+# keep them fast.
+#
+# The file consists of copies of the end-to-end test file with all
+# supported Org-mode syntax elements (blog entries only; each copy gets
+# unique IDs) and optional non-blog headings in between which have to
+# be skipped by the parser.
+
+import os
+import re
+import sys
+import tempfile
+import logging
+import tracemalloc
+import timeit
+from time import time
+from argparse import ArgumentParser
+from lib.orgparser import OrgParser
+
+BLOG_ENTRIES_FILE = os.path.join("testdata", "end_to_end_test", "orgfiles",
+                                 "currently_supported_orgmode_syntax.org")
+
+FILLER_HEADING = "* TODO non-blog heading %d :work:\n" + \
+                 ":PROPERTIES:\n:CREATED:  [2019-01-01 Tue 12:00]\n:END:\n" + \
+                 "- a list item\n- another list item which is DONE\n\n" + \
+                 "| a | table |\n\nA paragraph with some words.\n\n"
+
+
+def generate_orgfile(filename, copies, filler):
+    """
+    Writes the Org-mode file for the benchmark.
+
+    @param filename: name of the file to write
+    @param copies: number of copies of the blog entries
+    @param filler: number of non-blog headings before each copy
+    """
+
+    with open(BLOG_ENTRIES_FILE, encoding='utf-8') as inputfile:
+        blog_entries = inputfile.read()
+
+    with open(filename, 'w', encoding='utf-8') as output:
+        for copy in range(copies):
+            output.write(''.join(FILLER_HEADING % number for number in range(filler)))
+            output.write(re.sub(r'(:ID:\s+)(\S+)', r'\g<1>\g<2>-' + str(copy), blog_entries))
+
+
+def measure_memory(filename):
+    """
+    Prints the memory used by the parse result of a file.
+
+    @param filename: name of the file to parse
+    """
+
+    tracemalloc.start()
+    blog_data, lines = OrgParser(filename).parse_orgmode_file()
+    total = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    entries = sum(sys.getsizeof(entry) for entry in blog_data)
+    elements = sum(sys.getsizeof(element) for entry in blog_data for element in entry['content'])
+
+    print("%d lines with %d blog entries: %.1f MB of blog data" % (lines, len(blog_data), total / 1024 / 1024))
+    print("  dicts of the entries: %.1f kB" % (entries / 1024))
+    print("  lists of the content elements: %.1f kB" % (elements / 1024))
+
+    print("access times per entry:")
+    for access in ["entry['title']", "'title' in entry", "entry.get('missing')", "'title' in entry.keys()"]:
+        seconds = min(timeit.repeat(access, globals={'entry': blog_data[0]}, number=100000, repeat=5))
+        print("  %-26s %.0f ns" % (access, seconds / 100000 * 1e9))
+
+
+def main():
+
+    parser = ArgumentParser(description="Microbenchmark of the OrgParser")
+    parser.add_argument("--copies", dest="copies", type=int, default=50, metavar='N',
+                        help="Number of copies of the blog entries of the end-to-end test (default: 50)")
+    parser.add_argument("--filler", dest="filler", type=int, default=0, metavar='N',
+                        help="Number of non-blog headings before each copy (default: 0)")
+    parser.add_argument("--runs", dest="runs", type=int, default=5, metavar='N',
+                        help="Number of runs; the fastest one is reported (default: 5)")
+    parser.add_argument("--memory", dest="memory", action="store_true",
+                        help="Measure the memory of the blog data instead of the parsing speed")
+    options = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        filename = os.path.join(tempdir, 'benchmark.org')
+        generate_orgfile(filename, options.copies, options.filler)
+
+        if options.memory:
+            measure_memory(filename)
+            return
+
+        fastest = None
+        for run in range(options.runs):
+            starttime = time()
+            blog_data, lines = OrgParser(filename).parse_orgmode_file()
+            duration = time() - starttime
+            if fastest is None or duration < fastest:
+                fastest = duration
+
+    print("%d lines with %d blog entries parsed in %.3f seconds: %d lines per second" %
+          (lines, len(blog_data), fastest, lines / fastest))
+
+
+if __name__ == "__main__":
+    main()
+
+# Local Variables:
+# mode: flyspell
+# eval: (ispell-change-dictionary "en_US")
+# End:
@@ -6,6 +6,7 @@ import unittest
 from lib.utils import *
 from lib.orgparser import *
 import pickle  # for serializing and storing objects into files
+import tempfile
 from os import remove
 from os.path import isfile, join
 
@@ -180,6 +181,113 @@ class TestOrgParser(unittest.TestCase):
             "but starts with: %s" % repr(first_line))
         self.assertIn('Test case with drawers', first_line)
 
+    def test_find_blog_heading_candidates(self):
+
+        content = ('* DONE not a blog entry :work:\n' +
+                   'text mentioning DONE and :blog:\n' +
+                   '** DONE a blog entry :foo:Blog:\n' +
+                   '- State "DONE" from "NEXT" [2019-01-01 Tue 12:00]\n' +
+                   '* DONE last line without line break :blog:').encode('utf-8')
+
+        self.assertEqual(OrgParser._find_blog_heading_candidates(content),
+                         [content.index(b'** DONE'), content.rindex(b'* DONE')])
+        self.assertEqual(OrgParser._find_blog_heading_candidates(b''), [])
+
+    def test_pre_scan_skips_only_non_blog_lines(self):
+        """Lines skipped by the pre-scan are still counted and do not change the blog data."""
+
+        testfile = join("testdata", "end_to_end_test", "orgfiles",
+                        "real-world-entries.org")
+        blog_data, lines = OrgParser(testfile).parse_orgmode_file()
+
+        with open(testfile, encoding='utf-8') as orgfile:
+            self.assertEqual(lines, len(orgfile.readlines()))
+        self.assertIn('2021-01-30-drawer-tests', [entry['id'] for entry in blog_data])
+
+    def test_iterate_blog_entries(self):
+        """Entries are yielded as soon as they are complete."""
+
+        testfile = join("testdata", "end_to_end_test", "orgfiles",
+                        "real-world-entries.org")
+        blog_data, lines = OrgParser(testfile).parse_orgmode_file()
+        parser = OrgParser(testfile)
+        self.assertEqual(list(parser.iterate_blog_entries()), blog_data)
+        self.assertEqual(parser.number_of_parsed_lines(), lines)
+
+        # the first entry is handed over before the parser reaches the
+        # broken second one:
+        entry = '** DONE Entry %d  :blog:\n:PROPERTIES:\n:CREATED:  [2014-01-01 Wed 10:00]\n' + \
+            ':ID: entry-%d\n:END:\n:LOGBOOK:\n- State "DONE"       from "NEXT"       [2014-01-01 Wed 10:00]\n' + \
+            ':END:\n\n'
+        with tempfile.NamedTemporaryFile('w', suffix='.org', delete=False) as orgfile:
+            orgfile.write(entry % (1, 1) + 'Text.\n\n' + entry % (2, 2) + '| a | b |\nnot a table row\n')
+        try:
+            entries = OrgParser(orgfile.name).iterate_blog_entries()
+            self.assertEqual(next(entries)['id'], 'entry-1')
+            with self.assertRaises(OrgParserException):
+                next(entries)
+        finally:
+            remove(orgfile.name)
+
+    def test_parse_shards(self):
+        """Shards cut at top-level headings result in the blog data of the whole file."""
+
+        testfile = join("testdata", "end_to_end_test", "orgfiles",
+                        "real-world-entries.org")
+        sequential = OrgParser(testfile).parse_orgmode_file()
+
+        for number_of_shards in [1, 2, 3, 5, 10]:
+            offsets = OrgParser.find_shard_offsets(testfile, number_of_shards)
+            self.assertEqual(offsets[0][0], 0)
+            self.assertIsNone(offsets[-1][1])
+            self.assertLessEqual(len(offsets), number_of_shards)
+            blog_data, lines = [], 0
+            for start, end in offsets:
+                parser = OrgParser(testfile, start, end)
+                shard_blog_data, shard_lines = parser.parse_orgmode_file()
+                self.assertTrue(parser.ends_at_clean_cut())
+                blog_data += shard_blog_data
+                lines += shard_lines
+            self.assertEqual((blog_data, lines), sequential)
+
+        # a top-level heading within a block is no place to cut:
+        entry = '** DONE Entry %d  :blog:\n:PROPERTIES:\n:CREATED:  [2014-01-01 Wed 10:00]\n' + \
+            ':ID: entry-%d\n:END:\n:LOGBOOK:\n- State "DONE"       from "NEXT"       [2014-01-01 Wed 10:00]\n' + \
+            ':END:\n\n'
+        with tempfile.NamedTemporaryFile('w', suffix='.org', delete=False) as orgfile:
+            orgfile.write('* Notes\n' + entry % (1, 1) + '#+BEGIN_SRC org\n')
+            cut = orgfile.tell()
+            orgfile.write('* no heading within the block\n#+END_SRC\n\n' + entry % (2, 2))
+        try:
+            parser = OrgParser(orgfile.name, 0, cut)
+            parser.parse_orgmode_file()
+            self.assertFalse(parser.ends_at_clean_cut())
+        finally:
+            remove(orgfile.name)
+
+    def test_parse_segments(self):
+        """Segments start with blog heading candidates; sub-entries are no place to cut."""
+
+        entry = '%s DONE Entry %d  :blog:\n:PROPERTIES:\n:CREATED:  [2014-01-01 Wed 10:00]\n' + \
+            ':ID: entry-%d\n:END:\n:LOGBOOK:\n- State "DONE"       from "NEXT"       [2014-01-01 Wed 10:00]\n' + \
+            ':END:\n\nText.\n\n'
+        with tempfile.NamedTemporaryFile('w', suffix='.org', delete=False) as orgfile:
+            orgfile.write('* Notes\n' + entry % ('**', 1, 1) + entry % ('***', 2, 2) + entry % ('**', 3, 3))
+        try:
+            offsets = OrgParser.find_segment_offsets(orgfile.name)
+            self.assertEqual(len(offsets), 4)
+            self.assertEqual(offsets[0][0], 0)
+            self.assertIsNone(offsets[-1][1])
+            clean_cuts = []
+            for start, end in offsets:
+                parser = OrgParser(orgfile.name, start, end)
+                parser.parse_orgmode_file()
+                clean_cuts.append(parser.ends_at_clean_cut())
+            # entry 2 is a sub-heading of entry 1:
+            self.assertEqual(clean_cuts, [True, False, True, True])
+        finally:
+            remove(orgfile.name)
+
 
 # END OF FILE ###########################################################
 # Local Variables:
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8; mode: python; -*-
+
+import unittest
+import threading
+import pypandoc
+from lib.pandocworkers import PandocWorkerPool
+
+
+class TestPandocWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = PandocWorkerPool(2, pypandoc.get_pandoc_path())
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_convert_like_pandoc(self):
+
+        samples = [('| a | b |\n|---+---|\n| 1 | /2/ |', 'org'),
+                   ('- item [[https://example.org][link]]\n- "quoted" ...', 'org'),
+                   ('Ümlauts — &amp; <b>\r\nnext line', 'org'),
+                   ('a rather long line which pandoc has to wrap ' * 5, 'org'),
+                   ('', 'org'),
+                   ('#+BEGIN_EXAMPLE\n\tfoo\tbar\n  üä\tx\r\n#+END_EXAMPLE', 'org'),
+                   ('- a\tb\n\t- nested', 'org'),
+                   ('\\textbf{bold} $a^2$', 'latex'),
+                   ('\\begin{verbatim}\nx\tyy\tz\n\\end{verbatim}', 'latex')]
+
+        for text, sourceformat in samples:
+            self.assertEqual(self.pool.convert(text, sourceformat),
+                             pypandoc.convert_text(text, 'html5', format=sourceformat))
+        self.assertEqual(len(self.pool._workers), 1)
+
+    def test_errors_are_left_to_pandoc(self):
+
+        self.assertIsNone(self.pool.convert('\\begin{itemize} unterminated', 'latex'))
+        self.assertIsNone(self.pool.convert('text', 'no-such-format'))
+        # the worker is still available afterwards:
+        self.assertEqual(self.pool.convert('*bold*', 'org'), '<p><strong>bold</strong></p>\n')
+        self.assertTrue(self.pool.available)
+
+    def test_missing_pandoc(self):
+
+        pool = PandocWorkerPool(2, '/no/such/pandoc')
+        self.assertIsNone(pool.convert('*bold*', 'org'))
+        self.assertFalse(pool.available)
+        pool.close()
+
+    def test_concurrent_conversions(self):
+
+        texts = ['| a | ' + str(number) + ' |\n|---+---|\n| /x/ | y |' for number in range(12)]
+        results = {}
+
+        def convert(text):
+            results[text] = self.pool.convert(text, 'org')
+
+        threads = [threading.Thread(target=convert, args=(text,)) for text in texts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, {text: pypandoc.convert_text(text, 'html5', format='org') for text in texts})
+        self.assertLessEqual(len(self.pool._workers), 2)
+
+        self.pool.close()
+        self.assertEqual(self.pool._workers, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Local Variables:
+# mode: flyspell
+# eval: (ispell-change-dictionary "en_US")
+# End:
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8; mode: python; -*-
+
+import unittest
+from lib.placeholders import Placeholders
+
+
+class TestPlaceholders(unittest.TestCase):
+
+    def replace_chain(self, content, steps):
+        """The chain of str.replace() calls which Placeholders.replace() has to be equal to."""
+        for placeholder, value in steps:
+            content = content.replace(placeholder, value)
+        return content
+
+    def test_replace_like_a_chain(self):
+
+        steps = [('#SIDEBAR#', '<ul>#TOP-TAGS# on #DOMAIN#</ul>'),
+                 ('#TOP-TAGS#', '<li>#TITLE#</li>'),
+                 ('#DOMAIN#', 'example.org'),
+                 ('#TITLE#', 'A #SIDEBAR# and #DOMAIN# in the title'),
+                 ('#DOMAIN#', 'domain of the second step'),
+                 ('#FOOTER#\n', '#DOMAIN#\n'),
+                 ('\n     #SECTION#', '')]
+        content = '#TITLE# #SIDEBAR#\n#FOOTER#\n#FOOTER# #UNKNOWN#\n     #SECTION# #SECTION#'
+
+        self.assertEqual(Placeholders.replace(content, steps), self.replace_chain(content, steps))
+        self.assertEqual(Placeholders.replace(content, steps),
+                         'A #SIDEBAR# and domain of the second step in the title ' +
+                         '<ul><li>A #SIDEBAR# and domain of the second step in the title</li> on example.org</ul>\n' +
+                         '#DOMAIN#\n#FOOTER# #UNKNOWN# #SECTION#')
+        self.assertEqual(Placeholders.replace(content, []), content)
+
+    def test_values_are_generated_when_needed(self):
+
+        calls = []
+
+        def value(name):
+            calls.append(name)
+            return name
+
+        steps = [('#USED#', lambda: value('used')),
+                 ('#UNUSED#', lambda: value('unused')),
+                 ('#ARTICLE-TITLE#', 'x')]
+
+        self.assertEqual(Placeholders.replace('#USED# #ARTICLE-TITLE# #USED#', steps), 'used x used')
+        self.assertEqual(calls, ['used'])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Local Variables:
+# mode: flyspell
+# eval: (ispell-change-dictionary "en_US")
+# End:
@@ -123,6 +123,41 @@ class TestSnippetResolver(unittest.TestCase):
         self.assertEqual(result[0]['content'],
                          [['par', 'inner content']])
 
+    def test_snippets_are_resolved_once(self):
+        """Snippets referenced many times get resolved only once, referenced snippets first."""
+        outer = self._make_snippet('outer-snippet',
+                                    [['par', '[[id:inner-snippet]]'], ['heading', {'title': 'Sub', 'level': 3}]],
+                                    rawcontent='** Snippet outer-snippet\n[[id:inner-snippet]]\n*** Sub\n')
+        inner = self._make_snippet('inner-snippet',
+                                    [['par', 'inner content']],
+                                    rawcontent='** Snippet inner-snippet\ninner content\n')
+        entries = [self._make_entry('article-%d' % number,
+                                    [['par', '[[id:outer-snippet]]'], ['par', 'See id:inner-snippet.']],
+                                    rawcontent='[[id:outer-snippet]]\n')
+                   for number in range(10)]
+        blog_data = [outer, inner] + entries
+
+        resolver = SnippetResolver(blog_data)
+        resolved = []
+        resolve_entry_snippets = resolver._resolve_entry_snippets
+
+        def _resolve_entry_snippets(entry, expansion_chain):
+            resolve_entry_snippets(entry, expansion_chain)
+            resolved.append(entry['id'])
+
+        resolver._resolve_entry_snippets = _resolve_entry_snippets
+        result = resolver.resolve_all()
+
+        self.assertEqual(resolved, ['inner-snippet', 'outer-snippet'] + ['article-%d' % number for number in range(10)])
+        for entry in result:
+            self.assertEqual(entry['content'], [['par', 'inner content'],
+                                                ['heading', {'title': 'Sub', 'level': 3}],
+                                                ['par', 'See inner content.']])
+            self.assertEqual(entry['rawcontent'], 'inner content\n*** Sub\n')
+            self.assertEqual(entry['snippets'], ['inner-snippet', 'outer-snippet'])
+        # the elements of the snippets are shared:
+        self.assertIs(result[0]['content'][0], result[1]['content'][0])
+
     def test_loop_detection(self):
         """Circular reference raises SnippetException."""
         snippet_a = self._make_snippet('snippet-a',
@@ -184,6 +219,9 @@ class TestSnippetResolver(unittest.TestCase):
 
         self.assertEqual(len(result), 1)
         self.assertIn('description which will be ignored', cm.output[0])
+        self.assertEqual(cm.output,
+                         ['WARNING:root:Snippet reference [[id:desc-snippet][my description]] has a '
+                          'description which will be ignored. Use [[id:desc-snippet]] instead.'])
         self.assertEqual(result[0]['content'],
                          [['par', 'See replaced text here.']])
 
@@ -232,6 +270,21 @@ class TestSnippetResolver(unittest.TestCase):
         for e in result:
             self.assertNotEqual(e.get('category'), config.SNIPPET)
 
+    def test_expanded_snippets_are_recorded(self):
+        """IDs of expanded snippets (including nested ones) are stored in the entry."""
+        inner = self._make_snippet('inner', [['par', 'inner text']])
+        outer = self._make_snippet('outer', [['par', '[[id:inner]]']])
+        entry = self._make_entry('article-1',
+                                  [['par', '[[id:outer]]']])
+        unrelated = self._make_entry('article-2', [['par', 'no refs']])
+        blog_data = [inner, outer, entry, unrelated]
+
+        resolver = SnippetResolver(blog_data)
+        result = resolver.resolve_all()
+
+        self.assertEqual(result[0]['snippets'], ['inner', 'outer'])
+        self.assertNotIn('snippets', result[1])
+
     def test_snippet_tag_is_lbtag(self):
         """lbsnippet should be in lbtags not usertags (tested via config constant)."""
         self.assertEqual(config.TAG_FOR_SNIPPET_ENTRY, 'lbsnippet')
@@ -367,6 +420,25 @@ class TestSnippetResolver(unittest.TestCase):
         self.assertEqual(result[0]['content'],
                          [['par', 'See [[id:some-other-entry]] for details.']])
 
+    def test_all_reference_forms_in_one_text(self):
+        """All forms of references are replaced in one pass; other links and IDs with common prefixes are kept."""
+        short = self._make_snippet('note', [['par', r'$\alpha$']],
+                                   rawcontent='** Snippet note\n' + r'$\alpha$' + '\n')
+        long = self._make_snippet('note-long', [['par', 'long note']],
+                                  rawcontent='** Snippet note-long\nlong note\n')
+        text = 'A [[id:note]], [[id:note-long][desc]], id:note-long. [[id:other]] [[id:other][see id:note]] id:notes'
+        entry = self._make_entry('article-1', [['par', text]], rawcontent=text)
+        blog_data = [short, long, entry]
+
+        resolver = SnippetResolver(blog_data)
+        result = resolver.resolve_all()
+
+        self.assertEqual(result[0]['content'],
+                         [['par', r'A $\alpha$, long note, long note. [[id:other]] [[id:other][see $\alpha$]] id:notes']])
+        self.assertEqual(result[0]['rawcontent'],
+                         r'A $\alpha$, [[id:note-long][desc]], long note. [[id:other]] [[id:other][see $\alpha$]] id:notes')
+        self.assertEqual(result[0]['snippets'], ['note', 'note-long'])
+
 
 if __name__ == '__main__':
     unittest.main()
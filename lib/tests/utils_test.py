@@ -339,6 +339,46 @@ class TestUtils(unittest.TestCase):
                         print(str(year) + '-' + str(month[0]) + '-' + str(day[0]) + " has entry: " + str(blogentry))
         print('END debug output of entries_timeline_by_published: ' + '=' * 20)
 
+    def test_generate_fingerprints_for_blog_entry(self):
+
+        entry = {'id': 'foo',
+                 'title': 'Foo',
+                 'usertags': ['bar', 'baz'],
+                 'content': [['par', 'See [[id:other][other entry]] and [[https://example.com]].'],
+                             ['cust_link_image', 'image.jpg', 'description', 'caption', {}]]}
+
+        fingerprints = Utils.generate_fingerprints_for_blog_entry(entry)
+        self.assertEqual(sorted(fingerprints.keys()), sorted(Utils.FINGERPRINT_KEYS))
+        self.assertEqual(fingerprints, Utils.generate_fingerprints_for_blog_entry(entry))
+
+        def changed_fingerprints(modified_entry):
+            new_fingerprints = Utils.generate_fingerprints_for_blog_entry(modified_entry)
+            return sorted([key for key in fingerprints if fingerprints[key] != new_fingerprints[key]])
+
+        # order of tags does not matter:
+        self.assertEqual(changed_fingerprints(dict(entry, usertags=['baz', 'bar'])), [])
+        self.assertEqual(changed_fingerprints(dict(entry, usertags=['bar'])), ['usertags'])
+        self.assertEqual(changed_fingerprints(dict(entry, title='Foo2')), ['title'])
+        self.assertEqual(changed_fingerprints(dict(entry, snippets=['snip'])), ['snippets'])
+        self.assertEqual(changed_fingerprints(dict(entry, content=[
+            ['par', 'Sees [[id:other][other entry]] and [[https://example.com]].'],
+            entry['content'][1]])), ['body'])
+        self.assertEqual(changed_fingerprints(dict(entry, content=[
+            ['par', 'See [[id:another][other entry]] and [[https://example.com]].'],
+            entry['content'][1]])), ['body', 'links'])
+        self.assertEqual(changed_fingerprints(dict(entry, content=[
+            entry['content'][0],
+            ['cust_link_image', 'image2.jpg', 'description', 'caption', {}]])), ['images'])
+        # structure matters, not only the concatenated strings:
+        self.assertNotEqual(Utils.generate_fingerprints_for_blog_entry(dict(entry, content=[['par', 'ab']]))['body'],
+                            Utils.generate_fingerprints_for_blog_entry(dict(entry, content=[['par', 'a', 'b']]))['body'])
+
+        metadata = {'fingerprints': fingerprints, 'hidden': False, 'category': 'TEMPORAL'}
+        self.assertEqual(Utils.get_changed_fingerprints(metadata, metadata), [])
+        self.assertEqual(Utils.get_changed_fingerprints(dict(metadata, hidden=True), metadata), ['hidden'])
+        self.assertEqual(Utils.get_changed_fingerprints(metadata, {'checksum': 'old'}),
+                         sorted(Utils.FINGERPRINT_KEYS + ['hidden', 'category']))
+
 
 # Local Variables:
 # mode: flyspell
@@ -88,6 +88,13 @@ class Utils(object):
     FILE_WITH_TAGS_REGEX_TAGLIST_INDEX = 2
     FILE_WITH_TAGS_REGEX_EXTENSION_INDEX = 4
 
+    # Org-mode links with or without description: [[target]] or [[target][description]]
+    ORG_LINK_TARGET_REGEX = re.compile(r'\[\[([^\[\]]+?)\](\[[^\]]*?\])?\]')
+
+    # components of the fingerprints dict of the meta-data; the
+    # 'checksum' is derived from all of them in this order:
+    FINGERPRINT_KEYS = ['title', 'body', 'usertags', 'links', 'images', 'snippets']
+
     def __init__(self):
 
         pass
@@ -187,18 +194,119 @@ class Utils(object):
                                "\n")
 
     @staticmethod
-    def __generate_checksum_for_blog_entry(title, content):
+    def __update_fingerprint(fingerprint, data, links=None):
+        """
+
+        Feeds a (nested) content data structure into a hash object
+        element by element instead of building its string
+        representation as a whole. Each element is prefixed with its
+        type so that different structures do not result in the same
+        stream of bytes.
+
+        @param fingerprint: hash object like md5() that gets updated
+        @param data: string, list, tuple, dict, or any other value
+        @param links: optional list which gets the targets of all Org-mode links found in strings
+        @param return: nothing
+        """
+
+        if isinstance(data, str):
+            fingerprint.update(b's' + str(len(data)).encode('ascii') + b':')
+            fingerprint.update(data.encode('utf-8'))
+            if links is not None and '[[' in data:
+                links.extend([match.group(1) for match in Utils.ORG_LINK_TARGET_REGEX.finditer(data)])
+        elif isinstance(data, (list, tuple)):
+            fingerprint.update(b'[')
+            for item in data:
+                Utils.__update_fingerprint(fingerprint, item, links)
+            fingerprint.update(b']')
+        elif isinstance(data, dict):
+            fingerprint.update(b'{')
+            for key in sorted(data, key=str):
+                Utils.__update_fingerprint(fingerprint, key)
+                Utils.__update_fingerprint(fingerprint, data[key], links)
+            fingerprint.update(b'}')
+        else:
+            fingerprint.update(b'r' + repr(data).encode('utf-8'))
+
+    @staticmethod
+    def generate_fingerprints_for_blog_entry(entry):
+        """
+
+        Creates separate hash values for the aspects of a blog entry
+        which decide what has to be re-generated: title, body (the
+        content without image elements), user tags, outgoing links,
+        image attachments, and the IDs of the snippets which got
+        expanded into the entry (see SnippetResolver).
+
+        The content is hashed in one pass, element by element.
+
+        @param entry: blog entry as described in "dev/lazyblorg.org > Notes > Representation of blog data"
+        @param return: dict with the keys of FINGERPRINT_KEYS and hexadecimal hash values
+        """
+
+        title = md5()
+        Utils.__update_fingerprint(title, entry['title'])
+
+        body = md5()
+        images = md5()
+        links = []
+        for element in entry['content']:
+            if isinstance(element, list) and element and element[0] == 'cust_link_image':
+                Utils.__update_fingerprint(images, element)
+            else:
+                Utils.__update_fingerprint(body, element, links)
+
+        linkfingerprint = md5()
+        Utils.__update_fingerprint(linkfingerprint, links)
+
+        usertags = md5()
+        Utils.__update_fingerprint(usertags, sorted(entry.get('usertags', [])))
+
+        snippets = md5()
+        Utils.__update_fingerprint(snippets, entry.get('snippets', []))
+
+        return {'title': title.hexdigest(),
+                'body': body.hexdigest(),
+                'usertags': usertags.hexdigest(),
+                'links': linkfingerprint.hexdigest(),
+                'images': images.hexdigest(),
+                'snippets': snippets.hexdigest()}
+
+    @staticmethod
+    def __generate_checksum_for_blog_entry(fingerprints):
         """
 
         Creates a hash value which should be unique to the most
         important identifiers of content of a single blog entry.
 
-        @param title: string of the blog entry title
-        @param content: array of arrays containing the content of the blog entry
+        @param fingerprints: dict as returned by generate_fingerprints_for_blog_entry()
         @param return: hexadecimal value of the hash
         """
 
-        return md5(str([title, content]).encode('utf-8')).hexdigest()
+        return md5(''.join([fingerprints[key] for key in Utils.FINGERPRINT_KEYS]).encode('ascii')).hexdigest()
+
+    @staticmethod
+    def get_changed_fingerprints(metadata, previous_metadata):
+        """
+
+        Compares the fingerprints of the meta-data of one entry with
+        the ones from a previous run.
+
+        @param metadata: meta-data dict of one entry of the current run
+        @param previous_metadata: meta-data dict of the same entry of the previous run
+        @param return: sorted list of changed keys of FINGERPRINT_KEYS plus 'hidden' and 'category'; all of them if the previous run did not store fingerprints
+        """
+
+        if 'fingerprints' not in previous_metadata:
+            # meta-data of lazyblorg versions before fingerprints were introduced
+            return sorted(Utils.FINGERPRINT_KEYS + ['hidden', 'category'])
+
+        changed = [key for key in Utils.FINGERPRINT_KEYS
+                   if metadata['fingerprints'].get(key) != previous_metadata['fingerprints'].get(key)]
+        for key in ['hidden', 'category']:
+            if metadata.get(key) != previous_metadata.get(key):
+                changed.append(key)
+        return sorted(changed)
 
     @staticmethod
     def _add_entry_to_entries_timeline_by_published(
@@ -359,7 +467,8 @@ class Utils(object):
         "dev/lazyblorg.org > Notes > Representation of blog data"
         @param return: array containing a dict with entries like: {
         <ID>: {created: <timestamp>, timestamp: <timestamp>, checksum:
-        <checksum>}, ...}
+        <checksum>, fingerprints: {title: <hash>, body: <hash>, ...},
+        hidden: <bool>, ...}, ...}
 
         @param blogdata: content of the blog data
         @param return metadata: metadata content so far
@@ -389,8 +498,8 @@ class Utils(object):
 
             entries_timeline_by_published = {}
 
-            checksum = Utils.__generate_checksum_for_blog_entry(
-                entry['title'], entry['content'])
+            fingerprints = Utils.generate_fingerprints_for_blog_entry(entry)
+            checksum = Utils.__generate_checksum_for_blog_entry(fingerprints)
 
             if entry['id'] in metadata:
                 logging.error("We got a duplicate ID in blogdata: \"" +
@@ -407,6 +516,8 @@ class Utils(object):
                                          'latestupdateTS': entry['latestupdateTS'],
                                          'firstpublishTS': entry['firstpublishTS'],
                                          'checksum': checksum,
+                                         'fingerprints': fingerprints,
+                                         'hidden': config.TAG_FOR_HIDDEN in entry['usertags'],
                                          'title': entry['title'],
                                          'category': entry['category']}
                 if config.TAG_FOR_HIDDEN not in entry['usertags']:
@@ -6,6 +6,9 @@ import unittest
 from lazyblorg import Lazyblorg
 from lib.utils import Utils
 import os
+import re
+import shutil
+import tempfile
 
 
 class TestLazyblorg(unittest.TestCase):
@@ -31,141 +34,314 @@ class TestLazyblorg(unittest.TestCase):
         # test_parse_HTML_output_template_and_generate_template_definitions()
         pass
 
-    def test_determine_changes(self):
+    @staticmethod
+    def _options_parser():
+        """
+        Returns a parser for the command line options the tests use.
+        """
+
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--orgfiles", dest="orgfiles", nargs='+')
+        parser.add_argument("--targetdir", dest="targetdir")
+        parser.add_argument("--new-metadata", dest="new_metadatafilename")
+        parser.add_argument("--previous-metadata", dest="previous_metadatafilename")
+        parser.add_argument("--logfile", dest="logfilename")
+        parser.add_argument("-v", "--verbose", dest="verbose", action="store_true")
+        parser.add_argument("--autotag-language", dest="autotag_language", action="store_true")
+        parser.add_argument("--ignore-missing-ids", dest="ignore_missing_ids", action="store_true")
+        parser.add_argument("--incremental", dest="incremental", action="store_true")
+        return parser
+
+    def _determine_changes(self, orgfile, previous_metadata, new_metadata, logfile, incremental=False):
+        """
+        Invokes determine_changes() for the Org-mode file and the
+        templates.
+
+        @param return: lazyblorg object and the sorted lists of generate, marked_for_feed, and increment_version
+        """
+
+        myoptions = "--orgfiles templates/blog-format.org " + orgfile + \
+            " --targetdir ../testdata/basic_blog_update_test/2del-results/ --previous-metadata " + \
+            previous_metadata + " --new-metadata " + new_metadata + " --logfile " + logfile
+        if incremental:
+            myoptions += " --incremental"
+
+        mylazyblorg = Lazyblorg(self._options_parser().parse_args(myoptions.split()), self.logging)
+        generate, marked_for_feed, increment_version, stats_parsed_org_files, stats_parsed_org_lines = \
+            mylazyblorg.determine_changes()
+        return mylazyblorg, sorted(generate), sorted(marked_for_feed), sorted(increment_version)
 
-        # Checks on the situation before first iteration:
+    def test_determine_changes(self):
 
-        # manually written Org-mode file; has to be placed in
+        # manually written Org-mode files; have to be placed in
         # "../testdata/basic_blog_update_test/"
         template_file = "templates/blog-format.org"
         org_testfile_firstrun = "testdata/basic_blog_update_test/basic_blog_update_test_-_first_run.org"
+        org_testfile_secondrun = "testdata/basic_blog_update_test/basic_blog_update_test_-_second_run.org"
         metadata_firstrun_output = "testdata/basic_blog_update_test/basic_blog_update_test_-_first_run.pk"
         metadata_secondrun_output = "testdata/basic_blog_update_test/basic_blog_update_test_-_second_run.pk"
+        metadata_incremental_output = "testdata/basic_blog_update_test/basic_blog_update_test_-_incremental_run.pk"
         log_firstrun = "testdata/basic_blog_update_test/basic_blog_update_test_-_first_run.log"
-        org_testfile_secondrun = "testdata/basic_blog_update_test/basic_blog_update_test_-_second_run.org"
+        leftovers = [metadata_firstrun_output, metadata_secondrun_output, metadata_incremental_output, log_firstrun]
 
-        # might be left over from a failed previous run:
-        if os.path.isfile(metadata_firstrun_output):
-            os.remove(metadata_firstrun_output)
+        for leftover in leftovers:
+            # might be left over from a failed previous run:
+            if os.path.isfile(leftover):
+                os.remove(leftover)
 
-        # might be left over from a failed previous run:
-        if os.path.isfile(log_firstrun):
-            os.remove(log_firstrun)
-
-        # check, if test input file is found
+        # check, if test input files are found
         self.assertTrue(os.path.isfile(template_file))
-        # check, if test input file is found
         self.assertTrue(os.path.isfile(org_testfile_firstrun))
-        # check, if test input file is found
         self.assertTrue(os.path.isfile(org_testfile_secondrun))
 
-        # Building the call parameters:
-
-        first_parser = argparse.ArgumentParser()
-        first_parser.add_argument("--orgfiles", dest="orgfiles", nargs='+')
-        first_parser.add_argument("--targetdir", dest="targetdir")
-        first_parser.add_argument(
-            "--new-metadata",
-            dest="new_metadatafilename")
-        first_parser.add_argument(
-            "--previous-metadata",
-            dest="previous_metadatafilename")
-        first_parser.add_argument("--logfile", dest="logfilename")
-        first_parser.add_argument(
-            "-v",
-            "--verbose",
-            dest="verbose",
-            action="store_true")
-
-        myoptions = "--orgfiles " + template_file + " " + org_testfile_firstrun + \
-            " --targetdir ../testdata/basic_blog_update_test/2del-results/ --previous-metadata NOTEXISTING.pk --new-metadata " + \
-            metadata_firstrun_output + \
-            " --logfile " + log_firstrun  # + " --verbose"
-
-        options = first_parser.parse_args(myoptions.split())
-
-        # Invoking lazyblorg first interation:
-
-        first_lazyblorg = Lazyblorg(options, self.logging)
-        generate, marked_for_feed, increment_version, stats_parsed_org_files, stats_parsed_org_lines = first_lazyblorg.determine_changes()
-
-        # Checking results:
-
-        generate_sorted = sorted(generate)
-        marked_for_feed_sorted = sorted(marked_for_feed)
-        # increment_version_sorted = sorted(increment_version)
+        # first iteration:
+        first_lazyblorg, generate, marked_for_feed, increment_version = self._determine_changes(
+            org_testfile_firstrun, "NOTEXISTING.pk", metadata_firstrun_output, log_firstrun)
 
         self.assertEqual(increment_version, [])
-        self.assertEqual(generate_sorted, marked_for_feed_sorted)
-        self.assertTrue(
-            generate_sorted == [
-                'case4',
-                'case5',
-                'case6',
-                'case7',
-                'case8',
-                'empty-language-autotag-page',
-                'lazyblorg-templates'])
-        # Checks on the situation before second iteration:
-
-        # none
-
-        # Building the call parameters:
-
-        second_parser = argparse.ArgumentParser()
-        second_parser.add_argument("--orgfiles", dest="orgfiles", nargs='+')
-        second_parser.add_argument("--targetdir", dest="targetdir")
-        second_parser.add_argument(
-            "--new-metadata",
-            dest="new_metadatafilename")
-        second_parser.add_argument(
-            "--previous-metadata",
-            dest="previous_metadatafilename")
-        second_parser.add_argument("--logfile", dest="logfilename")
-        second_parser.add_argument(
-            "-v",
-            "--verbose",
-            dest="verbose",
-            action="store_true")
-
-        myoptions = "--orgfiles " + org_testfile_secondrun + " " + template_file + \
-            " --targetdir ../testdata/basic_blog_update_test/2del-results/ --previous-metadata " + \
-            metadata_firstrun_output + \
-            " --new-metadata " + metadata_secondrun_output + " --logfile " + log_firstrun  # + " --verbose"
-
-        options = second_parser.parse_args(myoptions.split())
-
-        # Invoking lazyblorg first interation:
-
-        second_lazyblorg = Lazyblorg(options, self.logging)
-        generate, marked_for_feed, increment_version, stats_parsed_org_files, stats_parsed_org_lines = second_lazyblorg.determine_changes()
-
-        # Checking results:
-
-        generate_sorted = sorted(generate)
-        marked_for_feed_sorted = sorted(marked_for_feed)
-        increment_version_sorted = sorted(increment_version)
-
-        self.assertEqual(increment_version_sorted, ['case8'])
-        self.assertEqual(marked_for_feed_sorted, ['case1', 'case8'])
-        self.assertTrue(
-            generate_sorted == [
-                'case1',
-                'case5',
-                'case6',
-                'case7',
-                'case8',
-                'empty-language-autotag-page',
-                'lazyblorg-templates'])
-
-        if os.path.isfile(log_firstrun):
-            os.remove(log_firstrun)
-
-        os.remove(metadata_firstrun_output)
-        os.remove(metadata_secondrun_output)
+        self.assertEqual(generate, marked_for_feed)
+        self.assertEqual(generate, ['case4', 'case5', 'case6', 'case7', 'case8',
+                                    'empty-language-autotag-page', 'lazyblorg-templates'])
+
+        # second iteration:
+        second_lazyblorg, generate, marked_for_feed, increment_version = self._determine_changes(
+            org_testfile_secondrun, metadata_firstrun_output, metadata_secondrun_output, log_firstrun)
+
+        self.assertEqual(increment_version, ['case8'])
+        self.assertEqual(marked_for_feed, ['case1', 'case8'])
+        # the template file did not change:
+        self.assertEqual(second_lazyblorg.stats_org_files_from_parse_cache, 1)
+        self.assertEqual(generate, ['case1', 'case5', 'case6', 'case7', 'case8',
+                                    'empty-language-autotag-page', 'lazyblorg-templates'])
+
+        # with "--incremental", unchanged entries (case 5 and 6) are
+        # not generated any more:
+        incremental_lazyblorg, generate, marked_for_feed, increment_version = self._determine_changes(
+            org_testfile_secondrun, metadata_firstrun_output, metadata_incremental_output, log_firstrun,
+            incremental=True)
+
+        self.assertEqual(increment_version, ['case8'])
+        self.assertEqual(marked_for_feed, ['case1', 'case8'])
+        self.assertEqual(generate, ['case1', 'case7', 'case8'])
+
+        for leftover in leftovers + [Lazyblorg._parse_cache_filename(metadata_firstrun_output),
+                                     Lazyblorg._parse_cache_filename(metadata_secondrun_output),
+                                     Lazyblorg._parse_cache_filename(metadata_incremental_output)]:
+            if os.path.isfile(leftover):
+                os.remove(leftover)
 
         return
 
+    def test_incremental_build(self):
+
+        tempdir = tempfile.mkdtemp()
+        try:
+            orgdir = os.path.join(tempdir, 'orgfiles')
+            shutil.copytree("testdata/end_to_end_test/orgfiles", orgdir)
+            orgfiles = " ".join(sorted(os.path.join(orgdir, name) for name in os.listdir(orgdir)))
+
+            def build(name, previous_metadata, new_metadata, incremental):
+                targetdir = os.path.join(tempdir, name)
+                if not os.path.isdir(targetdir):
+                    os.makedirs(targetdir)
+                myoptions = "--autotag-language --orgfiles templates/blog-format.org " + orgfiles + \
+                    " --targetdir " + targetdir + \
+                    " --previous-metadata " + os.path.join(tempdir, previous_metadata) + \
+                    " --new-metadata " + os.path.join(tempdir, new_metadata) + \
+                    " --logfile " + os.path.join(tempdir, 'log.org')
+                if incremental:
+                    myoptions += " --incremental"
+                mylazyblorg = Lazyblorg(self._options_parser().parse_args(myoptions.split()), self.logging)
+                generate, marked_for_feed, increment_version, stats_parsed_org_files, stats_parsed_org_lines = \
+                    mylazyblorg.determine_changes()
+                mylazyblorg.generate_output(generate, marked_for_feed, increment_version)
+
+            def read_files(directory):
+                # the generation time of the feeds differs between runs:
+                files = {}
+                for path, dirnames, filenames in os.walk(directory):
+                    for filename in filenames:
+                        with open(os.path.join(path, filename), 'rb') as inputfile:
+                            files[os.path.relpath(os.path.join(path, filename), directory)] = \
+                                [line for line in inputfile.read().split(b'\n') if b'<updated>' not in line]
+                return files
+
+            def mark_as_old(directory):
+                for path, dirnames, filenames in os.walk(directory):
+                    for filename in filenames:
+                        os.utime(os.path.join(path, filename), ns=(0, 0))
+
+            def was_written(directory, filename):
+                return os.stat(os.path.join(tempdir, directory, filename)).st_mtime_ns != 0
+
+            build('incremental', 'none.pk', '1.pk', True)
+
+            # without any change, only the feeds are written again:
+            mark_as_old(os.path.join(tempdir, 'incremental'))
+            build('incremental', '1.pk', '2.pk', True)
+            self.assertFalse(was_written('incremental', 'about/index.html'))
+            self.assertFalse(was_written('incremental', '2016/09/18/from-nothing-to-done/index.html'))
+            self.assertFalse(was_written('incremental', '2013/08/22/testid/index.html'))
+            for overview_page in ['index.html', 'tags/index.html', 'tags/testtag1/index.html', '2016/index.html']:
+                self.assertFalse(was_written('incremental', overview_page), overview_page)
+
+            # edit one entry, hide one (no blog entry any more), and delete one:
+            with open(os.path.join(orgdir, 'test_case_from_nothing_to_DONE.org')) as inputfile:
+                content = inputfile.read()
+            with open(os.path.join(orgdir, 'test_case_from_nothing_to_DONE.org'), 'w') as outputfile:
+                outputfile.write(content.replace('with no special content', 'with no special content at all'))
+            with open(os.path.join(orgdir, 'test.org')) as inputfile:
+                content = inputfile.read()
+            content = re.sub(r'(\* DONE Mini blog entry) +:blog:', r'\1', content)
+            content = re.sub(r'\*\* DONE old blog entry14 .*?Test entry.\n', '', content, flags=re.S)
+            with open(os.path.join(orgdir, 'test.org'), 'w') as outputfile:
+                outputfile.write(content)
+
+            mark_as_old(os.path.join(tempdir, 'incremental'))
+            build('incremental', '2.pk', '3.pk', True)
+            self.assertTrue(was_written('incremental', '2016/09/18/from-nothing-to-done/index.html'))
+            self.assertFalse(was_written('incremental', 'about/index.html'))
+            # overview pages listing the edited entry:
+            self.assertTrue(was_written('incremental', '2016/index.html'))
+            self.assertTrue(was_written('incremental', 'tags/testtag1/index.html'))
+            self.assertFalse(was_written('incremental', '2014/index.html'))
+            # pages of the previous run which a full build does not generate any more:
+            for removed in ['1985/01/01/old-entry14', '2013/08']:
+                self.assertFalse(os.path.exists(os.path.join(tempdir, 'incremental', removed)))
+
+            # the same result as a full build:
+            build('full', 'none.pk', 'full.pk', False)
+            self.assertEqual(read_files(os.path.join(tempdir, 'incremental')),
+                             read_files(os.path.join(tempdir, 'full')))
+
+            # an unreadable page dependency graph results in a full build:
+            with open(os.path.join(tempdir, '3_-_page_dependencies.pk'), 'wb') as outputfile:
+                outputfile.write(b'\x80')
+            mark_as_old(os.path.join(tempdir, 'incremental'))
+            build('incremental', '3.pk', '4.pk', True)
+            self.assertTrue(was_written('incremental', 'about/index.html'))
+            self.assertTrue(was_written('incremental', 'tags/index.html'))
+        finally:
+            shutil.rmtree(tempdir)
+
+    def test_parse_cache(self):
+
+        tempdir = tempfile.mkdtemp()
+        try:
+            orgfile = os.path.join(tempdir, 'blog.org')
+            shutil.copyfile("testdata/basic_blog_update_test/basic_blog_update_test_-_first_run.org", orgfile)
+
+            parser = argparse.ArgumentParser()
+            parser.add_argument("--orgfiles", dest="orgfiles", nargs='+')
+            parser.add_argument("--targetdir", dest="targetdir")
+            parser.add_argument("--new-metadata", dest="new_metadatafilename")
+            parser.add_argument("--previous-metadata", dest="previous_metadatafilename")
+            parser.add_argument("--logfile", dest="logfilename")
+            parser.add_argument("-v", "--verbose", dest="verbose", action="store_true")
+
+            def run(number):
+                myoptions = "--orgfiles templates/blog-format.org " + orgfile + \
+                    " --targetdir " + tempdir + \
+                    " --previous-metadata " + os.path.join(tempdir, str(number - 1) + '.pk') + \
+                    " --new-metadata " + os.path.join(tempdir, str(number) + '.pk') + \
+                    " --logfile " + os.path.join(tempdir, 'log.org')
+                mylazyblorg = Lazyblorg(parser.parse_args(myoptions.split()), self.logging)
+                generate, marked_for_feed, increment_version, stats_parsed_org_files, stats_parsed_org_lines = \
+                    mylazyblorg.determine_changes()
+                return mylazyblorg, stats_parsed_org_lines
+
+            first_lazyblorg, first_lines = run(1)
+            self.assertEqual(first_lazyblorg.stats_org_files_from_parse_cache, 0)
+
+            # unchanged files:
+            second_lazyblorg, second_lines = run(2)
+            self.assertEqual(second_lazyblorg.stats_org_files_from_parse_cache, 2)
+            self.assertEqual(second_lines, first_lines)
+            self.assertEqual(second_lazyblorg.blog_data, first_lazyblorg.blog_data)
+
+            # same content with a new modification time:
+            os.utime(orgfile, ns=(os.stat(orgfile).st_atime_ns, os.stat(orgfile).st_mtime_ns + 10 ** 9))
+            third_lazyblorg, third_lines = run(3)
+            self.assertEqual(third_lazyblorg.stats_org_files_from_parse_cache, 2)
+
+            # changed content:
+            with open(orgfile, 'a') as outputfile:
+                outputfile.write('\n')
+            fourth_lazyblorg, fourth_lines = run(4)
+            self.assertEqual(fourth_lazyblorg.stats_org_files_from_parse_cache, 1)
+            self.assertEqual(fourth_lines, first_lines + 1)
+
+            # only the segment of the changed blog entry gets parsed again:
+            with open(orgfile) as inputfile:
+                content = inputfile.read()
+            with open(orgfile, 'w') as outputfile:
+                outputfile.write(content.replace('Case6: not changed since last update', 'Case6: changed title'))
+            fifth_lazyblorg, fifth_lines = run(5)
+            self.assertEqual(fifth_lazyblorg.stats_org_files_from_parse_cache, 1)
+            self.assertEqual(fifth_lazyblorg.stats_org_segments_from_parse_cache, 6)
+            self.assertIn('Case6: changed title', [entry['title'] for entry in fifth_lazyblorg.blog_data])
+            without_cache_lazyblorg, without_cache_lines = run(10)
+            self.assertEqual(without_cache_lazyblorg.stats_org_segments_from_parse_cache, 0)
+            self.assertEqual(fifth_lines, without_cache_lines)
+            self.assertEqual(fifth_lazyblorg.blog_data, without_cache_lazyblorg.blog_data)
+        finally:
+            shutil.rmtree(tempdir)
+
+    def test_parse_with_jobs(self):
+
+        tempdir = tempfile.mkdtemp()
+        try:
+            brokenfile = os.path.join(tempdir, 'broken.org')
+            with open(brokenfile, 'w') as outputfile:
+                outputfile.write('** DONE Broken table  :blog:\n:PROPERTIES:\n:CREATED:  [2014-01-01 Wed 10:00]\n' +
+                                 ':ID: broken\n:END:\n\n| a | b |\nnot a table row\n')
+
+            parser = argparse.ArgumentParser()
+            parser.add_argument("--orgfiles", dest="orgfiles", nargs='+')
+            parser.add_argument("--targetdir", dest="targetdir")
+            parser.add_argument("--new-metadata", dest="new_metadatafilename")
+            parser.add_argument("--previous-metadata", dest="previous_metadatafilename")
+            parser.add_argument("--logfile", dest="logfilename")
+            parser.add_argument("-v", "--verbose", dest="verbose", action="store_true")
+            parser.add_argument("--jobs", dest="jobs", type=int, default=1)
+            parser.add_argument("--shard-orgfiles-above", dest="shard_orgfiles_above", type=int, default=0)
+
+            def run(orgfiles, jobs, shard_orgfiles_above=0):
+                myoptions = "--orgfiles " + orgfiles + " --targetdir " + tempdir + \
+                    " --previous-metadata " + os.path.join(tempdir, 'none.pk') + \
+                    " --new-metadata " + os.path.join(tempdir, str(jobs) + '.pk') + \
+                    " --logfile " + os.path.join(tempdir, 'log.org') + " --jobs " + str(jobs) + \
+                    " --shard-orgfiles-above " + str(shard_orgfiles_above)
+                mylazyblorg = Lazyblorg(parser.parse_args(myoptions.split()), self.logging)
+                generate, marked_for_feed, increment_version, stats_parsed_org_files, stats_parsed_org_lines = \
+                    mylazyblorg.determine_changes()
+                return mylazyblorg.blog_data, stats_parsed_org_files, stats_parsed_org_lines
+
+            orgfiles = "testdata/basic_blog_update_test/basic_blog_update_test_-_first_run.org " + \
+                "templates/blog-format.org testdata/end_to_end_test/orgfiles/currently_supported_orgmode_syntax.org"
+
+            # same results in the same order:
+            self.assertEqual(run(orgfiles, 3), run(orgfiles, 1))
+
+            # a file larger than one megabyte split into shards at its top-level headings:
+            largefile = os.path.join(tempdir, 'large.org')
+            with open('testdata/end_to_end_test/orgfiles/real-world-entries.org') as inputfile:
+                entries = inputfile.read()
+            with open(largefile, 'w') as outputfile:
+                for copy in range(8):
+                    outputfile.write(('* Notes\n' + 'Some filler text of a non-blog heading.\n' * 4000) +
+                                     re.sub(r'(:ID:\s+)(\S+)', r'\g<1>\g<2>-' + str(copy), entries))
+            largefiles = largefile + " templates/blog-format.org"
+            self.assertEqual(run(largefiles, 3, 1), run(largefiles, 1))
+
+            # parse errors of workers are reported with the file name:
+            with self.assertRaises(SystemExit):
+                run(orgfiles + " " + brokenfile, 2)
+            with open(os.path.join(tempdir, 'log.org')) as logfile:
+                self.assertIn('Parsing error in file "' + brokenfile + '"', logfile.read())
+        finally:
+            shutil.rmtree(tempdir)
+
 #old#    def test_example_entry_with_all_implemented_orgmode_elements_from_org_to_html(
 #old#            self):
 #old#